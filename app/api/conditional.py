@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+
+def weak_etag(*parts: Any) -> str:
+    return 'W/"' + hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()[:20] + '"'
+
+
+def check_not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """ETag 헤더를 설정하고, If-None-Match 가 일치하면 304 응답을 반환."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+    inm = request.headers.get("if-none-match")
+    if inm and (inm.strip() == "*" or etag in {t.strip() for t in inm.split(",")}):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "private, no-cache"})
+    return None
+
+
+__all__ = ["weak_etag", "check_not_modified"]
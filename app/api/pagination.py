@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, List, Optional, Sequence, Set, Tuple
+
+from fastapi import HTTPException, Response
+
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def keyset_page(query: Any, id_col: Any, cursor: Optional[int], limit: int, descending: bool = True) -> Any:
+    """id 기준 keyset 페이지네이션. (user_id, id) 복합 인덱스를 그대로 탄다.
+
+    다음 페이지 존재 여부 판단을 위해 limit + 1건을 조회한다.
+    """
+    if cursor is not None:
+        query = query.where(id_col < cursor if descending else id_col > cursor)
+    order = id_col.desc() if descending else id_col.asc()
+    return query.order_by(order).limit(limit + 1)
+
+
+def finish_page(rows: Sequence[Any], limit: int, response: Response) -> List[Any]:
+    """초과 조회분을 잘라내고 다음 커서를 응답 헤더로 전달."""
+    rows = list(rows)
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = str(last["id"] if isinstance(last, dict) else last.id)
+    return rows
+
+
+def parse_fields(fields: Optional[str], allowed: Iterable[str]) -> Optional[Tuple[str, ...]]:
+    """`fields=id,status,url` 형태의 프로젝션 파라미터 파싱. id는 항상 포함."""
+    if not fields:
+        return None
+    allowed_set: Set[str] = set(allowed)
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in requested if f not in allowed_set]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    return tuple(dict.fromkeys(["id", *requested]))
+
+
+__all__ = ["NEXT_CURSOR_HEADER", "DEFAULT_PAGE_SIZE", "MAX_PAGE_SIZE", "keyset_page", "finish_page", "parse_fields"]
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from pydantic import BaseModel
 
-from app.models.db import get_session
+from app.models.db import get_async_session
 from app.models.entities import User
 from app.core.auth import create_access_token
+from app.core.passwords import hash_password_async, verify_password_async
 
 
 router = APIRouter()
@@ -24,24 +27,30 @@ class LoginRequest(BaseModel):
 
 
 @router.post("/signup")
-def signup(request: SignupRequest, session: Session = Depends(get_session)):
-    exists = session.exec(select(User).where(User.email == request.email)).first()
+async def signup(request: SignupRequest, session: AsyncSession = Depends(get_async_session)):
+    exists = (await session.exec(select(User).where(User.email == request.email))).first()
     if exists:
         raise HTTPException(status_code=400, detail="Email already exists")
-    user = User(email=request.email, hashed_password=User.hash_password(request.password), name=request.name)
+    # bcrypt는 전용 풀에서(이벤트 루프/DB 커넥션을 잡지 않은 채)
+    await session.close()
+    hashed = await hash_password_async(request.password)
+    user = User(email=request.email, hashed_password=hashed, name=request.name)
     session.add(user)
-    session.commit()
-    session.refresh(user)
+    try:
+        await session.commit()
+    except IntegrityError:
+        # 해시 계산 중 같은 이메일로 동시 가입된 경우(unique 제약)
+        await session.rollback()
+        raise HTTPException(status_code=400, detail="Email already exists")
     token = create_access_token(user.id, user.email)
     return {"access_token": token, "user": {"id": user.id, "email": user.email, "name": user.name}}
 
 
 @router.post("/login")
-def login(request: LoginRequest, session: Session = Depends(get_session)):
-    user = session.exec(select(User).where(User.email == request.email)).first()
-    if not user or not User.verify_password(request.password, user.hashed_password):
+async def login(request: LoginRequest, session: AsyncSession = Depends(get_async_session)):
+    user = (await session.exec(select(User).where(User.email == request.email))).first()
+    await session.close()
+    if not user or not await verify_password_async(request.password, user.hashed_password):
         raise HTTPException(status_code=400, detail="Invalid credentials")
     token = create_access_token(user.id, user.email)
     return {"access_token": token, "user": {"id": user.id, "email": user.email, "name": user.name}}
-
-
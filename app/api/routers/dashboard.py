@@ -1,43 +1,32 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
+from typing import Literal
 
-from app.models.db import get_session
-from app.models.entities import Experience, JobPosting, InterviewSession
+from fastapi import APIRouter, Depends, Query
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.db import get_async_session
 from app.api.deps import get_current_user
+from app.services.analytics_service import get_weaknesses
+from app.services.dashboard_service import get_dashboard_summary
 
 
 router = APIRouter()
 
 
 @router.get("/summary")
-def summary(session: Session = Depends(get_session), user=Depends(get_current_user)):
+async def summary(session: AsyncSession = Depends(get_async_session), user=Depends(get_current_user)):
     user_id = str(user.get("sub", "default"))
-    exp_q = select(Experience).where(Experience.user_id == user_id)
-    job_q = select(JobPosting).where(JobPosting.user_id == user_id)
-    sess_q = select(InterviewSession).where(InterviewSession.user_id == user_id)
-    exp_count = len(session.exec(exp_q).all())
-    job_count = len(session.exec(job_q).all())
-    sess_count = len(session.exec(sess_q).all())
-    recent_sessions = session.exec(
-        select(InterviewSession).where(InterviewSession.user_id == user_id).order_by(InterviewSession.id.desc()).limit(5)
-    ).all()
-    recent = [
-        {
-            "id": s.id,
-            "job_posting_id": s.job_posting_id,
-            "status": s.status,
-            "round": s.current_round,
-            "created_at": s.created_at,
-        }
-        for s in recent_sessions
-    ]
-    return {
-        "experiences": exp_count,
-        "jobs": job_count,
-        "sessions": sess_count,
-        "recent": recent,
-    }
+    return await get_dashboard_summary(session, user_id)
 
 
+@router.get("/weaknesses")
+async def weaknesses(
+    days: int = Query(default=90, ge=1, le=730),
+    bucket: Literal["day", "week", "month"] = "week",
+    session: AsyncSession = Depends(get_async_session),
+    user=Depends(get_current_user),
+):
+    """평가 축별 누락 빈도와 추이(증분 집계 테이블 기반)."""
+    user_id = str(user.get("sub", "default"))
+    return await get_weaknesses(session, user_id, days=days, bucket=bucket)
@@ -1,10 +1,13 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlmodel import Session, select
 
 from app.models.db import get_session
 from app.models.entities import Experience
-from app.models.schemas import ExperienceCreate, ExperienceRead
+from app.models.schemas import ExperienceCreate, ExperienceRead, ExperienceListItem, BulkDeleteRequest, BulkDeleteResult
+from app.api.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, finish_page, keyset_page, parse_fields
+from app.services.dashboard_service import invalidate_dashboard_summary
+from app.services.deletion_service import delete_experiences
 
 
 from app.api.deps import get_current_user
@@ -21,14 +24,29 @@ def create_experience(payload: ExperienceCreate, session: Session = Depends(get_
     session.add(exp)
     session.commit()
     session.refresh(exp)
+    invalidate_dashboard_summary(exp.user_id)
     return exp
 
 
-@router.get("/", response_model=List[ExperienceRead])
-def list_experiences(user_id: str = "default", session: Session = Depends(get_session), user=Depends(get_current_user)):
+@router.get("/", response_model=List[ExperienceListItem], response_model_exclude_unset=True)
+def list_experiences(
+    response: Response,
+    user_id: str = "default",
+    cursor: Optional[int] = None,
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    fields: Optional[str] = Query(default=None, description="쉼표 구분 필드 목록(예: id,title,category). content 등 큰 컬럼 생략용"),
+    session: Session = Depends(get_session),
+    user=Depends(get_current_user),
+):
+    """경험 목록(id 오름차순). 다음 페이지 커서는 X-Next-Cursor 헤더로 전달."""
     user_id = user.get("sub", user_id)
-    exps = session.exec(select(Experience).where(Experience.user_id == user_id)).all()
-    return exps
+    cols = parse_fields(fields, ExperienceListItem.model_fields)
+    base = select(*(getattr(Experience, c) for c in cols)) if cols else select(Experience)
+    q = keyset_page(base.where(Experience.user_id == user_id), Experience.id, cursor, limit, descending=False)
+    rows = session.exec(q).all()
+    if cols:
+        rows = [dict(zip(cols, r)) for r in rows]
+    return finish_page(rows, limit, response)
 
 
 @router.get("/{exp_id}", response_model=ExperienceRead)
@@ -60,10 +78,15 @@ def update_experience(exp_id: int, payload: ExperienceCreate, session: Session =
 
 @router.delete("/{exp_id}")
 def delete_experience(exp_id: int, session: Session = Depends(get_session)):
-    exp = session.get(Experience, exp_id)
-    if not exp:
+    # 경험에서 파생된 벡터 행도 같은 트랜잭션에서 삭제
+    if not delete_experiences(session, [exp_id]):
         raise HTTPException(status_code=404, detail="Experience not found")
-    session.delete(exp)
-    session.commit()
     return {"ok": True}
 
+
+@router.post("/bulk-delete", response_model=BulkDeleteResult)
+def bulk_delete_experiences(payload: BulkDeleteRequest, session: Session = Depends(get_session), user=Depends(get_current_user)):
+    """본인 소유 경험만 삭제. 삭제된 id 목록 반환."""
+    uid = str(user.get("sub", "default"))
+    return BulkDeleteResult(deleted=delete_experiences(session, payload.ids, user_ids=[uid]))
+
@@ -1,4 +1,11 @@
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from app.core.llm_cache import get_llm_cache
+from app.core.singleflight import llm_flight, embedding_flight
+from app.core.config import get_settings
+from app.core.warmup import warmup_state
+from app.models.db import pool_status
 
 router = APIRouter()
 
@@ -7,3 +14,34 @@ router = APIRouter()
 def healthz():
     return {"status": "ok"}
 
+
+@router.get("/ready")
+def readiness():
+    """워밍업 완료 여부(로드밸런서/오토스케일러 readiness probe용). 미완료 시 503."""
+    snap = warmup_state.snapshot()
+    if not get_settings().warmup_enabled:
+        snap["ready"] = True
+    return JSONResponse(status_code=200 if snap["ready"] else 503, content=snap)
+
+
+@router.get("/llm-cache")
+def llm_cache_stats():
+    return get_llm_cache().stats()
+
+
+@router.get("/singleflight")
+def singleflight_stats():
+    return {"llm": llm_flight.stats(), "embedding": embedding_flight.stats()}
+
+
+@router.get("/db-pool")
+def db_pool_stats():
+    return pool_status()
+
+
+@router.get("/embedding-spaces")
+def embedding_spaces():
+    """임베딩 공간 목록과 재임베딩 진행률(done/total)."""
+    from app.services.reembed_service import space_status
+
+    return space_status()
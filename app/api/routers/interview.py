@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, BackgroundTasks
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, BackgroundTasks, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.models.db import get_session
-from app.models.entities import InterviewSession, InterviewQuestion, InterviewAnswer, FeedbackReport
+from app.models.db import get_session, get_async_session, get_engine
+from app.models.entities import InterviewSession, InterviewQuestion, InterviewAnswer, FeedbackReport, Experience, JobPosting
 from app.models.schemas import (
     InterviewStartRequest,
     InterviewStartResponse,
@@ -13,37 +15,93 @@ from app.models.schemas import (
     FeedbackResponse,
     InterviewSessionSummary,
     InterviewSessionDetail,
+    AudioAnswerQueued,
+    BulkDeleteRequest,
+    BulkDeleteResult,
 )
-from app.services.agent_service import InterviewAgent
+from app.services.agent_service import InterviewAgent, prepare_first_question
 from app.services.feedback_service import generate_feedback, generate_feedback_async
-from app.services.rag_service import retrieve_context, stream_question_from_context
-from app.core.llm import get_llm
+from app.services.rag_service import retrieval_scope, retrieve_context, stream_question_from_context
 from app.core.config import get_settings
-from app.services.prompts import llm_eval_prompt
+from app.services.evaluation_service import stream_evaluation
+from app.services.dashboard_service import invalidate_dashboard_summary
+from app.services.deletion_service import delete_sessions
+from app.services.job_content_service import load_content_async
+from app.services.transcript_service import (
+    append_events,
+    current_question,
+    is_legacy,
+    load_transcript_async,
+    lock_session,
+    question_event,
+    record_answer,
+)
 import json
-from typing import Dict, Any
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Optional
 from app.queues.local_db import LocalDBQueue
-from app.services.stt_service import transcribe_audio_stub
+from app.services.stt_service import spool_upload, transcribe_file
 from app.api.deps import get_current_user
+from app.api.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, finish_page, keyset_page
+from app.api.conditional import check_not_modified, weak_etag
 from sqlmodel import select
 
 
 router = APIRouter()
 
+# 답변 스트리밍 파이프라인용 스레드풀. 질문 생성 작업이 검색 결과를 기다리므로
+# 교착을 피하기 위해 검색 전용 풀을 분리한다.
+_pipeline_pool = ThreadPoolExecutor(max_workers=get_settings().answer_pipeline_workers, thread_name_prefix="answer-pipeline")
+_retrieval_pool = ThreadPoolExecutor(max_workers=get_settings().answer_pipeline_workers, thread_name_prefix="answer-retrieval")
+
 
 @router.post("/start", response_model=InterviewStartResponse)
-def start_interview(payload: InterviewStartRequest, session: Session = Depends(get_session), user=Depends(get_current_user)):
+async def start_interview(payload: InterviewStartRequest, session: AsyncSession = Depends(get_async_session), user=Depends(get_current_user)):
     payload.user_id = payload.user_id or user.get("sub", "default")
-    agent = InterviewAgent(session)
-    sid, q, qid = agent.start_session(payload.user_id, payload.job_posting_id, payload.selected_experience_ids)
-    return InterviewStartResponse(session_id=sid, first_question=q, first_question_id=qid)
+    job = await session.get(JobPosting, payload.job_posting_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job posting not found")
+    if (job.fetch_status or "ready") != "ready":
+        # URL 공고 수집 전/실패: 본문 없이 질문을 만들지 않도록
+        detail = "Job posting is still being fetched" if job.fetch_status == "fetching" else "Job posting fetch failed"
+        raise HTTPException(status_code=409, detail=detail)
+    ids = payload.selected_experience_ids
+    rows = (await session.exec(select(Experience).where(Experience.id.in_(ids)))).all() if ids else []
+    by_id = {e.id: e for e in rows}
+    exps = [by_id[i] for i in ids if i in by_id]
+    content = await load_content_async(session, job)
+    # LLM/임베딩 호출 동안 커넥션을 보유하지 않도록 먼저 반환
+    await session.close()
+
+    first_q = await run_in_threadpool(prepare_first_question, exps, job, content)
+
+    sess = InterviewSession(user_id=payload.user_id, job_posting_id=payload.job_posting_id, selected_experience_ids=ids)
+    session.add(sess)
+    await session.flush()
+    q = InterviewQuestion(session_id=sess.id, round_index=0, question_type="main", text=first_q)
+    session.add(q)
+    await session.flush()
+    append_events(sess, question_event(q))
+    await session.commit()
+    invalidate_dashboard_summary(sess.user_id)
+    return InterviewStartResponse(session_id=sess.id, first_question=first_q, first_question_id=q.id)
 
 
 @router.get("/{session_id}/next", response_model=NextQuestionResponse)
-def next_question(session_id: int, session: Session = Depends(get_session), user=Depends(get_current_user)):
-    agent = InterviewAgent(session)
-    data = agent.next_question(session_id)
-    return NextQuestionResponse(**data)
+async def next_question(session_id: int, session: AsyncSession = Depends(get_async_session), user=Depends(get_current_user)):
+    s = await session.get(InterviewSession, session_id)
+    ev = current_question(s) if s else None
+    if ev:
+        return NextQuestionResponse(question=ev["text"], question_id=ev["id"], question_type=ev["type"], round_index=ev["round"])
+    # 전사 도입 이전 세션
+    q = (await session.exec(
+        select(InterviewQuestion).where(InterviewQuestion.session_id == session_id).order_by(InterviewQuestion.id.desc()).limit(1)
+    )).first()
+    if not q:
+        raise HTTPException(status_code=404, detail="No question found for this session")
+    return NextQuestionResponse(question=q.text, question_id=q.id, question_type=q.question_type, round_index=q.round_index)
 
 
 @router.post("/{session_id}/answer/{question_id}", response_model=SubmitAnswerResponse)
@@ -56,21 +114,68 @@ def submit_answer(session_id: int, question_id: int, payload: SubmitAnswerReques
 # 중복 정의 방지: 피드백 조회는 하단의 단일 엔드포인트를 사용
 
 
-@router.post("/{session_id}/answer/{question_id}/audio", response_model=SubmitAnswerResponse)
+def _submit_answer_in_new_session(session_id: int, question_id: int, answer: str) -> Dict[str, Any]:
+    with Session(get_engine()) as db:
+        return InterviewAgent(db).submit_answer(session_id, question_id, answer)
+
+
+@router.post(
+    "/{session_id}/answer/{question_id}/audio",
+    response_model=SubmitAnswerResponse,
+    responses={202: {"model": AudioAnswerQueued}},
+)
 async def submit_answer_audio(
     session_id: int,
     question_id: int,
     file: UploadFile = File(...),
-    session: Session = Depends(get_session),
     user=Depends(get_current_user),
 ):
-    # 스텁: 파일명을 이용해 텍스트 추출한 것으로 간주
-    text = transcribe_audio_stub(file.filename)
-    agent = InterviewAgent(session)
-    data = agent.submit_answer(session_id, question_id, text)
+    """음성 답변 제출.
+
+    - 업로드는 청크 단위로 스풀 파일에 기록
+    - 짧은 오디오: 프로세스 풀에서 전사 후 답변 처리(스레드풀) → 200
+    - 긴 오디오: transcribe_audio 큐 작업으로 넘기고 202 + job_id (상태는 /{session_id}/audio/{job_id})
+    """
+    audio = await spool_upload(file)
+    if audio.duration_seconds > get_settings().stt_sync_max_seconds:
+        job_id = await run_in_threadpool(
+            LocalDBQueue().enqueue,
+            "transcribe_audio",
+            {"path": audio.path, "session_id": session_id, "question_id": question_id},
+        )
+        return JSONResponse(status_code=202, content=AudioAnswerQueued(job_id=job_id).model_dump())
+    try:
+        text = await transcribe_file(audio.path)
+    finally:
+        audio.cleanup()
+    try:
+        data = await run_in_threadpool(_submit_answer_in_new_session, session_id, question_id, text)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     return SubmitAnswerResponse(**data)
 
 
+@router.get("/{session_id}/audio/{job_id}")
+async def audio_answer_status(
+    session_id: int,
+    job_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    user=Depends(get_current_user),
+):
+    job = await run_in_threadpool(LocalDBQueue().get, job_id)
+    s = await session.get(InterviewSession, session_id)
+    # 다른 세션/사용자의 작업은 존재 여부도 드러내지 않음(404)
+    if (
+        not job
+        or job["type"] != "transcribe_audio"
+        or str((job.get("payload") or {}).get("session_id")) != str(session_id)
+        or s is None
+        or s.user_id != str(user.get("sub", "default"))
+    ):
+        raise HTTPException(status_code=404, detail="Audio job not found")
+    return {"job_id": job["id"], "status": job["status"], "attempts": job["attempts"]}
+
+
 @router.post("/{session_id}/end")
 def end_interview(session_id: int, background_tasks: BackgroundTasks, session: Session = Depends(get_session), user=Depends(get_current_user)):
     # 1. 면접 상태를 completed로 변경
@@ -81,6 +186,7 @@ def end_interview(session_id: int, background_tasks: BackgroundTasks, session: S
     interview_session.status = "completed"
     session.add(interview_session)
     session.commit()
+    invalidate_dashboard_summary(interview_session.user_id)
     
     # 2. 피드백 리포트 생성 시작 (기존 리포트가 있다면 삭제)
     existing_report = session.exec(
@@ -102,6 +208,10 @@ def end_interview(session_id: int, background_tasks: BackgroundTasks, session: S
     return {"message": "피드백 생성을 시작했습니다", "session_id": session_id, "report_id": feedback_report.id}
 
 
+def _goal_for_round(current_round: int) -> str:
+    return "다음 핵심 역량을 검증" if current_round > 0 else "선택된 경험과 공고 우대사항을 바탕으로 핵심 역량을 검증"
+
+
 @router.get("/{session_id}/next/stream")
 def next_question_stream(session_id: int, session: Session = Depends(get_session), user=Depends(get_current_user)):
     """다음 질문(메인) 스트리밍. LangGraph 병렬 사전생성 없이도 체감 개선용.
@@ -112,8 +222,8 @@ def next_question_stream(session_id: int, session: Session = Depends(get_session
     if not s:
         raise HTTPException(status_code=404, detail="Interview session not found")
 
-    goal = "다음 핵심 역량을 검증" if (s.current_round or 0) > 0 else "선택된 경험과 공고 우대사항을 바탕으로 핵심 역량을 검증"
-    ctx = retrieve_context(goal, top_k=6)
+    goal = _goal_for_round(s.current_round or 0)
+    ctx = retrieve_context(goal, top_k=6, **retrieval_scope(session, s))
 
     def generator():
         for chunk in stream_question_from_context(goal, ctx, round_index=s.current_round or 0):
@@ -122,6 +232,29 @@ def next_question_stream(session_id: int, session: Session = Depends(get_session
     return StreamingResponse(generator(), media_type="text/plain; charset=utf-8")
 
 
+def _persist_answer(session_id: int, question_id: int, answer_text: str, evaluation: Dict[str, Any]) -> None:
+    """스트리밍 경로 밖(백그라운드 스레드)에서 답변을 저장. 요청 세션과 분리된 별도 세션 사용."""
+    with Session(get_engine()) as db:
+        record_answer(db, InterviewAnswer(session_id=session_id, question_id=question_id, answer_text=answer_text, evaluation=evaluation))
+
+
+_QUESTION_END = object()
+
+
+def _produce_question(out: "queue.Queue[Any]", cancel: threading.Event, ctx_future: "Future[list]", goal: str, round_index: int) -> None:
+    """다음 메인 질문을 생성해 토큰을 큐로 전달(평가 스트림과 병행)."""
+    try:
+        ctx = ctx_future.result()
+        for chunk in stream_question_from_context(goal, ctx, round_index=round_index):
+            if cancel.is_set():
+                break
+            out.put(chunk)
+    except Exception as e:  # 소비자 쪽에서 다시 올림
+        out.put(e)
+    finally:
+        out.put(_QUESTION_END)
+
+
 @router.post("/{session_id}/answer/{question_id}/stream")
 def submit_answer_stream(
     session_id: int,
@@ -130,102 +263,134 @@ def submit_answer_stream(
     session: Session = Depends(get_session),
     user=Depends(get_current_user),
 ):
-    """답변 평가 후 다음 질문을 SSE로 스트리밍 전송."""
+    """답변 평가 후 다음 질문을 SSE로 스트리밍 전송.
+
+    파이프라인:
+    - 컨텍스트 검색을 평가와 동시에 시작
+    - 평가 토큰을 evaluation_chunk로 흘려보내고, rating이 확정되는 즉시 다음 질문 생성을 시작
+    - 답변 저장은 백그라운드에서 수행(질문 토큰 전송을 막지 않음)
+    """
     s = session.get(InterviewSession, session_id)
     q = session.get(InterviewQuestion, question_id)
     if not s or not q:
         raise HTTPException(status_code=404, detail="Invalid session or question")
 
     settings = get_settings()
-    llm = get_llm()
+    scope = retrieval_scope(session, s)
 
     def sse(msg: Dict[str, Any], event: str | None = None) -> bytes:
         prefix = f"event: {event}\n" if event else ""
         return (prefix + f"data: {json.dumps(msg, ensure_ascii=False)}\n\n").encode("utf-8")
 
     def generator():
-        # 1) 평가
-        messages = llm_eval_prompt(q.text, payload.answer)
-        raw = llm.chat(messages)
-        rating = "VAGUE"
-        notes: Dict[str, Any] = {"summary": raw, "hints": []}
-        try:
-            import re
-            match = re.search(r"\{[\s\S]*\}", raw)
-            payload_json = match.group(0) if match else raw
-            parsed = json.loads(payload_json)
-            rating = parsed.get("rating", rating)
-            notes = parsed.get("notes", notes)
-        except Exception:
-            pass
-
-        # 답변 저장
-        ans = InterviewAnswer(
-            session_id=session_id,
-            question_id=question_id,
-            answer_text=payload.answer,
-            evaluation={"rating": rating, "notes": notes},
-        )
-        session.add(ans)
-        session.commit()
-
-        # 평가 이벤트 전송
-        yield sse({"rating": rating, "notes": notes}, event="evaluation")
-
-        # 2) 분기 결정
+        current_round = s.current_round or 0
         follow_up_count = s.follow_up_count or 0
-        route = "NEXT_ROUND"
-        if rating != "GOOD" and follow_up_count < settings.max_follow_ups:
-            route = "FOLLOW_UP"
-
-        # 3) 질문 스트리밍/생성 및 저장
-        yield b"event: question_start\n\n"
-        if route == "FOLLOW_UP":
-            hint_text = "; ".join(notes.get("hints", [])[:2]) if notes.get("hints") else "성과를 정량적으로 제시하고, 기술 선택의 이유를 설명해주세요."
-            q2 = InterviewQuestion(
-                session_id=session_id,
-                round_index=s.current_round or 0,
-                question_type="follow_up",
-                text=hint_text,
-                parent_question_id=question_id,
-            )
-            s.follow_up_count = follow_up_count + 1
-            session.add(q2); session.add(s); session.commit(); session.refresh(q2)
+        goal = _goal_for_round(current_round)
+
+        # 0) 컨텍스트 검색을 평가와 병행
+        ctx_future = _retrieval_pool.submit(retrieve_context, goal, 6, **scope)
+        q_out: "queue.Queue[Any]" = queue.Queue()
+        cancel = threading.Event()
+        question_started = False
+        question_done = False
+        full: list[str] = []
+
+        def drain(block: bool):
+            nonlocal question_done
+            while not question_done:
+                try:
+                    item = q_out.get(block=block)
+                except queue.Empty:
+                    return
+                if item is _QUESTION_END:
+                    question_done = True
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                full.append(item)
+                yield sse({"content": item}, event="question_chunk")
 
-            yield sse({"content": hint_text}, event="question_chunk")
-            yield sse({"question_id": q2.id, "question_type": q2.question_type, "round_index": q2.round_index}, event="question_end")
-        else:
-            goal = "다음 핵심 역량을 검증" if (s.current_round or 0) > 0 else "선택된 경험과 공고 우대사항을 바탕으로 핵심 역량을 검증"
-            ctx = retrieve_context(goal, top_k=6)
-            full = []
-            for chunk in stream_question_from_context(goal, ctx, round_index=s.current_round or 0):
-                full.append(chunk)
-                yield sse({"content": chunk}, event="question_chunk")
-
-            text = ("".join(full)).strip()
-            s.current_round = (s.current_round or 0) + 1
-            s.follow_up_count = 0
-            q2 = InterviewQuestion(
-                session_id=session_id,
-                round_index=s.current_round,
-                question_type="main",
-                text=text,
+        try:
+            # 1) 평가 스트리밍: rating 도착 즉시 분기 결정 및 질문 생성 시작
+            route = "NEXT_ROUND"
+            result = None
+            for kind, value in stream_evaluation(q.text, payload.answer):
+                if kind == "chunk":
+                    yield sse({"content": value}, event="evaluation_chunk")
+                elif kind == "rating":
+                    if value != "GOOD" and follow_up_count < settings.max_follow_ups:
+                        route = "FOLLOW_UP"
+                        ctx_future.cancel()
+                    yield sse({"rating": value, "route": route}, event="rating")
+                    if route == "NEXT_ROUND":
+                        _pipeline_pool.submit(_produce_question, q_out, cancel, ctx_future, goal, current_round)
+                        question_started = True
+                        yield b"event: question_start\n\n"
+                elif kind == "result":
+                    result = value
+                if question_started:
+                    yield from drain(block=False)
+            rating = result.rating
+            notes: Dict[str, Any] = result.notes.model_dump()
+
+            # 답변 저장은 크리티컬 패스 밖에서
+            save_future = _pipeline_pool.submit(
+                _persist_answer, session_id, question_id, payload.answer, {"rating": rating, "notes": notes}
             )
-            session.add(q2); session.add(s); session.commit(); session.refresh(q2)
 
+            # 평가 이벤트 전송
+            yield sse({"rating": rating, "notes": notes}, event="evaluation")
+
+            # 2) 질문 스트리밍/생성 및 저장
+            if route == "FOLLOW_UP":
+                yield b"event: question_start\n\n"
+                hint_text = "; ".join(notes.get("hints", [])[:2]) if notes.get("hints") else "성과를 정량적으로 제시하고, 기술 선택의 이유를 설명해주세요."
+                yield sse({"content": hint_text}, event="question_chunk")
+                q2 = InterviewQuestion(
+                    session_id=session_id,
+                    round_index=current_round,
+                    question_type="follow_up",
+                    text=hint_text,
+                    parent_question_id=question_id,
+                )
+                follow_up_count += 1
+            else:
+                yield from drain(block=True)
+                current_round += 1
+                follow_up_count = 0
+                q2 = InterviewQuestion(
+                    session_id=session_id,
+                    round_index=current_round,
+                    question_type="main",
+                    text=("".join(full)).strip(),
+                )
+            # 백그라운드 답변 저장과 전사 갱신이 겹치지 않도록 세션 행을 잠근 뒤 반영
+            locked = lock_session(session, session_id)
+            locked.current_round = current_round
+            locked.follow_up_count = follow_up_count
+            session.add(q2)
+            session.flush()
+            append_events(locked, question_event(q2))
+            session.add(locked)
+            session.commit()
+            session.refresh(q2)
             yield sse({"question_id": q2.id, "question_type": q2.question_type, "round_index": q2.round_index}, event="question_end")
 
-        yield b"event: done\n\n"
+            save_future.result()
+            yield b"event: done\n\n"
+        finally:
+            # 클라이언트 연결 종료 등으로 중단되면 질문 생성도 멈춤
+            cancel.set()
 
     return StreamingResponse(generator(), media_type="text/event-stream")
 
 
 @router.get("/{session_id}/feedback/status")
-def get_feedback_status(session_id: int, session: Session = Depends(get_session), user=Depends(get_current_user)):
+async def get_feedback_status(session_id: int, session: AsyncSession = Depends(get_async_session), user=Depends(get_current_user)):
     """피드백 생성 상태 확인"""
-    report = session.exec(
+    report = (await session.exec(
         select(FeedbackReport).where(FeedbackReport.session_id == session_id)
-    ).first()
+    )).first()
     
     if not report:
         return {"status": "not_found"}
@@ -262,31 +427,41 @@ def interview_feedback(session_id: int, session: Session = Depends(get_session),
 
 
 @router.get("/{session_id}/transcript")
-def get_transcript(session_id: int, session: Session = Depends(get_session), user=Depends(get_current_user)):
-    q_list = session.exec(select(InterviewQuestion).where(InterviewQuestion.session_id == session_id).order_by(InterviewQuestion.id.asc())).all()
-    a_map = {a.question_id: a for a in session.exec(select(InterviewAnswer).where(InterviewAnswer.session_id == session_id)).all()}
-    items = []
-    for q in q_list:
-        a = a_map.get(q.id)
-        items.append({
-            "round": q.round_index,
-            "type": q.question_type,
-            "question": q.text,
-            "answer": a.answer_text if a else None,
-            "evaluation": a.evaluation if a else None,
-        })
-    return {"items": items}
+async def get_transcript(
+    session_id: int,
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_async_session),
+    user=Depends(get_current_user),
+):
+    """세션 전사. 비정규화된 전사 컬럼을 PK 조회 한 번으로 읽고, append-only이므로 길이로 ETag를 만든다."""
+    s = await session.get(InterviewSession, session_id)
+    if not s:
+        return {"items": []}
+    if not is_legacy(s):
+        not_modified = check_not_modified(request, response, weak_etag("transcript", s.id, len(s.transcript or [])))
+        if not_modified:
+            return not_modified
+    return {"items": await load_transcript_async(session, s)}
 
 
 @router.get("/", response_model=list[InterviewSessionSummary])
-def list_sessions(include_legacy: bool = False, session: Session = Depends(get_session), user=Depends(get_current_user)):
+async def list_sessions(
+    response: Response,
+    include_legacy: bool = False,
+    cursor: Optional[int] = None,
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    session: AsyncSession = Depends(get_async_session),
+    user=Depends(get_current_user),
+):
+    """세션 목록(id 내림차순). 다음 페이지 커서는 X-Next-Cursor 헤더로 전달."""
     user_id = str(user.get("sub", "default"))
     if include_legacy:
         from sqlalchemy import or_
         q = select(InterviewSession).where(or_(InterviewSession.user_id == user_id, InterviewSession.user_id == "default"))
     else:
         q = select(InterviewSession).where(InterviewSession.user_id == user_id)
-    rows = session.exec(q.order_by(InterviewSession.id.desc())).all()
+    rows = finish_page((await session.exec(keyset_page(q, InterviewSession.id, cursor, limit))).all(), limit, response)
     data = [
         InterviewSessionSummary(
             id=r.id,
@@ -303,8 +478,14 @@ def list_sessions(include_legacy: bool = False, session: Session = Depends(get_s
 
 
 @router.get("/{session_id}", response_model=InterviewSessionDetail)
-def get_session_detail(session_id: int, session: Session = Depends(get_session), user=Depends(get_current_user)):
-    s = session.get(InterviewSession, session_id)
+async def get_session_detail(
+    session_id: int,
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_async_session),
+    user=Depends(get_current_user),
+):
+    s = await session.get(InterviewSession, session_id)
     if not s:
         raise HTTPException(status_code=404, detail="Interview session not found")
     # 권한 확인(동일 사용자 또는 legacy default 허용)
@@ -312,10 +493,21 @@ def get_session_detail(session_id: int, session: Session = Depends(get_session),
     if s.user_id not in (uid, "default"):
         raise HTTPException(status_code=403, detail="Forbidden")
 
-    # 마지막 질문 텍스트(있으면)
-    last_q = session.exec(
-        select(InterviewQuestion).where(InterviewQuestion.session_id == session_id).order_by(InterviewQuestion.id.desc())
-    ).first()
+    not_modified = check_not_modified(
+        request, response, weak_etag("session", s.id, s.status, s.current_round, s.follow_up_count, s.last_question_id)
+    )
+    if not_modified:
+        return not_modified
+
+    # 마지막 질문 텍스트(있으면). 전사 도입 이전 세션만 질문 테이블 조회
+    ev = current_question(s)
+    if ev:
+        last_text = ev["text"]
+    else:
+        last_q = (await session.exec(
+            select(InterviewQuestion).where(InterviewQuestion.session_id == session_id).order_by(InterviewQuestion.id.desc()).limit(1)
+        )).first()
+        last_text = last_q.text if last_q else None
 
     return InterviewSessionDetail(
         id=s.id,
@@ -325,7 +517,7 @@ def get_session_detail(session_id: int, session: Session = Depends(get_session),
         current_round=s.current_round,
         follow_up_count=s.follow_up_count,
         created_at=s.created_at,
-        last_question=(last_q.text if last_q else None),
+        last_question=last_text,
     )
 
 
@@ -338,18 +530,14 @@ def delete_session(session_id: int, session: Session = Depends(get_session), use
     if s.user_id not in (uid, "default"):
         raise HTTPException(status_code=403, detail="Forbidden")
 
-    # 관련 데이터 삭제(answers, questions, feedback)
-    answers = session.exec(select(InterviewAnswer).where(InterviewAnswer.session_id == session_id)).all()
-    for a in answers:
-        session.delete(a)
-    questions = session.exec(select(InterviewQuestion).where(InterviewQuestion.session_id == session_id)).all()
-    for q in questions:
-        session.delete(q)
-    reports = session.exec(select(FeedbackReport).where(FeedbackReport.session_id == session_id)).all()
-    for r in reports:
-        session.delete(r)
-
-    session.delete(s)
-    session.commit()
+    # 관련 데이터(answers, questions, feedback)까지 집합 단위 DELETE로 한 트랜잭션에서 삭제
+    delete_sessions(session, [session_id])
     return {"ok": True}
 
+
+@router.post("/bulk-delete", response_model=BulkDeleteResult)
+def bulk_delete_sessions(payload: BulkDeleteRequest, session: Session = Depends(get_session), user=Depends(get_current_user)):
+    """본인(및 레거시 default) 소유 세션만 삭제. 삭제된 id 목록 반환."""
+    uid = str(user.get("sub", "default"))
+    return BulkDeleteResult(deleted=delete_sessions(session, payload.ids, user_ids=[uid, "default"]))
+
@@ -1,74 +1,62 @@
 from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlmodel import Session
-from bs4 import BeautifulSoup
-import requests
 
 from app.core.config import get_settings
 from app.models.db import get_session
 from app.models.entities import JobPosting
-from app.models.schemas import JobPostingCreate, JobPostingRead
+from app.models.schemas import JobPostingCreate, JobPostingRead, JobPostingListItem, BulkDeleteRequest, BulkDeleteResult
+from app.api.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, finish_page, keyset_page, parse_fields
 from app.api.deps import get_current_user
+from app.services.dashboard_service import invalidate_dashboard_summary
+from app.services.deletion_service import delete_job_postings
+from app.services.job_ingest_service import apply_text, get_cached_page
+from app.services.job_content_service import delete_orphan_contents, load_content, load_contents, to_read_dict
+from app.queues.local_db import LocalDBQueue
 from sqlmodel import select
 
 
 router = APIRouter()
 
 
-def _parse_job_text(text: str) -> dict:
-    # 매우 단순한 휴리스틱 파서. 실서비스에서는 Section 헤더를 정교하게 인식하도록 개선 필요
-    sections = {"main": text}
-    for key in ["주요 업무", "자격 요건", "우대 사항", "우대사항", "책임", "요건"]:
-        if key in text:
-            sections_key = {
-                "주요 업무": "responsibilities",
-                "책임": "responsibilities",
-                "자격 요건": "requirements",
-                "요건": "requirements",
-                "우대 사항": "preferred",
-                "우대사항": "preferred",
-            }.get(key, key)
-            # 간단히 구간을 자르지는 않고, 전체 텍스트를 보존. 프롬프트에서 섹션 키 활용
-            sections[sections_key] = text
-    return sections
-
-
 @router.post("/", response_model=JobPostingRead)
 def create_job_posting(payload: JobPostingCreate, session: Session = Depends(get_session), user=Depends(get_current_user)):
+    """공고 등록. URL 공고는 공유 캐시에 신선한 본문이 있으면 즉시 채우고,
+    없으면 fetch_status=fetching으로 바로 반환한 뒤 fetch_job_posting 큐 작업이 채운다."""
     settings = get_settings()
     payload.user_id = str(user.get("sub", "default"))
-    raw_text: Optional[str] = payload.raw_text
-
-    if payload.source_type == "url":
-        if not settings.allow_url_fetch:
-            raise HTTPException(status_code=400, detail="URL fetch disabled in settings")
-        if not payload.url:
-            raise HTTPException(status_code=400, detail="URL is required for source_type=url")
-        try:
-            r = requests.get(payload.url, timeout=10)
-            r.raise_for_status()
-            soup = BeautifulSoup(r.text, "html.parser")
-            raw_text = soup.get_text(" ", strip=True)
-        except Exception as e:
-            raise HTTPException(status_code=400, detail=f"Failed to fetch URL: {e}")
-
-    if not raw_text:
-        raise HTTPException(status_code=400, detail="No job text provided")
-
-    sections = _parse_job_text(raw_text)
     jp = JobPosting(
         user_id=payload.user_id,
         source_type=payload.source_type,
         url=payload.url,
-        raw_text=raw_text,
-        sections=sections,
         status=(payload.status or "draft"),
         application_qa=(payload.application_qa or []),
     )
+
+    needs_fetch = False
+    if payload.source_type == "url":
+        if not settings.allow_url_fetch:
+            raise HTTPException(status_code=400, detail="URL fetch disabled in settings")
+        if not payload.url or not payload.url.lower().startswith(("http://", "https://")):
+            raise HTTPException(status_code=400, detail="A http(s) URL is required for source_type=url")
+        cached = get_cached_page(session, payload.url)
+        if cached is not None:
+            apply_text(session, jp, cached.text)
+        else:
+            jp.fetch_status = "fetching"
+            needs_fetch = True
+    else:
+        if not payload.raw_text:
+            raise HTTPException(status_code=400, detail="No job text provided")
+        apply_text(session, jp, payload.raw_text)
+
     session.add(jp)
     session.commit()
     session.refresh(jp)
-    return jp
+    if needs_fetch:
+        LocalDBQueue().enqueue("fetch_job_posting", {"job_posting_id": jp.id})
+    invalidate_dashboard_summary(jp.user_id)
+    return to_read_dict(jp, load_content(session, jp))
 
 
 @router.get("/{job_id}", response_model=JobPostingRead)
@@ -76,7 +64,7 @@ def get_job_posting(job_id: int, session: Session = Depends(get_session)):
     jp = session.get(JobPosting, job_id)
     if not jp:
         raise HTTPException(status_code=404, detail="Job posting not found")
-    return jp
+    return to_read_dict(jp, load_content(session, jp))
 @router.put("/{job_id}", response_model=JobPostingRead)
 def update_job_posting(job_id: int, payload: JobPostingCreate, session: Session = Depends(get_session), user=Depends(get_current_user)):
     jp = session.get(JobPosting, job_id)
@@ -91,33 +79,71 @@ def update_job_posting(job_id: int, payload: JobPostingCreate, session: Session
     # update allowed fields
     jp.source_type = payload.source_type or jp.source_type
     jp.url = payload.url if payload.url is not None else jp.url
-    jp.raw_text = payload.raw_text if payload.raw_text is not None else jp.raw_text
+    old_hash = jp.content_hash
     if payload.raw_text:
-        jp.sections = _parse_job_text(payload.raw_text)
+        apply_text(session, jp, payload.raw_text)
     if payload.status is not None:
         jp.status = payload.status
     if payload.application_qa is not None:
         jp.application_qa = payload.application_qa
     session.add(jp)
     session.commit()
+    if old_hash and old_hash != jp.content_hash:
+        # 이전 본문을 더 이상 아무도 참조하지 않으면 본문/임베딩 정리
+        delete_orphan_contents(session, [old_hash])
+        session.commit()
     session.refresh(jp)
-    return jp
+    return to_read_dict(jp, load_content(session, jp))
 
 
 
-@router.get("/", response_model=List[JobPostingRead])
-def list_job_postings(user_id: str = "default", session: Session = Depends(get_session), user=Depends(get_current_user)):
+@router.get("/", response_model=List[JobPostingListItem], response_model_exclude_unset=True)
+def list_job_postings(
+    response: Response,
+    user_id: str = "default",
+    cursor: Optional[int] = None,
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    fields: Optional[str] = Query(default=None, description="쉼표 구분 필드 목록(예: id,url,status,created_at). raw_text/sections 생략용"),
+    session: Session = Depends(get_session),
+    user=Depends(get_current_user),
+):
+    """공고 목록(id 내림차순). 다음 페이지 커서는 X-Next-Cursor 헤더로 전달."""
     user_id = user.get("sub", user_id)
-    items = session.exec(select(JobPosting).where(JobPosting.user_id == user_id).order_by(JobPosting.id.desc())).all()
-    return items
+    cols = parse_fields(fields, JobPostingListItem.model_fields)
+    if cols:
+        # 본문 필드는 공유 본문 테이블에서 채우므로 참조 키를 함께 조회
+        base = select(*(getattr(JobPosting, c) for c in cols), JobPosting.content_hash)
+    else:
+        base = select(JobPosting)
+    q = keyset_page(base.where(JobPosting.user_id == user_id), JobPosting.id, cursor, limit)
+    rows = finish_page(session.exec(q).all(), limit, response)
+    if cols:
+        items = [dict(zip(cols, r[:-1])) for r in rows]
+        if "raw_text" in cols or "sections" in cols:
+            contents = load_contents(session, (r[-1] for r in rows))
+            for item, r in zip(items, rows):
+                content = contents.get(r[-1])
+                if content is not None:
+                    if "raw_text" in cols:
+                        item["raw_text"] = content.raw_text
+                    if "sections" in cols:
+                        item["sections"] = content.sections
+        return items
+    contents = load_contents(session, (jp.content_hash for jp in rows))
+    return [to_read_dict(jp, contents.get(jp.content_hash)) for jp in rows]
 
 
 @router.delete("/{job_id}")
 def delete_job_posting(job_id: int, session: Session = Depends(get_session)):
-    jp = session.get(JobPosting, job_id)
-    if not jp:
+    # 공고에서 파생된 벡터 행도 같은 트랜잭션에서 삭제
+    if not delete_job_postings(session, [job_id]):
         raise HTTPException(status_code=404, detail="Job posting not found")
-    session.delete(jp)
-    session.commit()
     return {"ok": True}
 
+
+@router.post("/bulk-delete", response_model=BulkDeleteResult)
+def bulk_delete_job_postings(payload: BulkDeleteRequest, session: Session = Depends(get_session), user=Depends(get_current_user)):
+    """본인 소유 공고만 삭제. 삭제된 id 목록 반환."""
+    uid = str(user.get("sub", "default"))
+    return BulkDeleteResult(deleted=delete_job_postings(session, payload.ids, user_ids=[uid]))
+
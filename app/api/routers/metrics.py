@@ -0,0 +1,12 @@
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from app.core.metrics import CONTENT_TYPE, render
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus 텍스트 형식 지표(PROMETHEUS_MULTIPROC_DIR 지정 시 전 워커 합산). 요약 확인: python -m app.core.metrics"""
+    return Response(content=render(), media_type=CONTENT_TYPE)
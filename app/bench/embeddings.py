@@ -0,0 +1,109 @@
+"""로컬 임베딩 백엔드 벤치마크: PyTorch(SentenceTransformer) vs int8 ONNX.
+
+    python -m app.bench.embeddings [--n 512] [--batch-size 32] [--threads 0] [--backends torch,onnx]
+
+각 백엔드에 대해 로드 시간, 단건 지연(p50/p95), 배치 처리량(texts/s), RSS 증가량을 출력하고
+두 백엔드를 모두 돌린 경우 같은 입력에 대한 코사인 유사도(평균/최소)로 품질 차이를 확인한다.
+RSS는 프로세스 최대치(ru_maxrss) 기준이라 정확한 메모리 비교는 --backends 로 하나씩 실행.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import resource
+import statistics
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from app.core.config import get_settings
+
+
+_WORDS = (
+    "트래픽 캐시 장애 대응 쿼리 최적화 배포 모니터링 지표 레이턴시 처리량 설계 트레이드오프 "
+    "kafka redis postgres index batch retry timeout queue worker api latency p95 rollout"
+).split()
+
+
+def _sample_texts(n: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(_WORDS) for _ in range(rng.randint(8, 64))) for _ in range(n)]
+
+
+def _rss_mb() -> float:
+    # Linux ru_maxrss 단위는 KB
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def _load(backend: str, model_name: str, threads: int, batch_size: int):
+    if backend == "onnx":
+        from app.core.onnx_embeddings import OnnxEmbeddingService
+
+        return OnnxEmbeddingService(model_name, threads=threads, batch_size=batch_size)
+    if threads > 0:
+        import torch
+
+        torch.set_num_threads(threads)
+    from app.core.embeddings import LocalSBERTEmbeddingService
+
+    return LocalSBERTEmbeddingService(model_name=model_name)
+
+
+def run_backend(backend: str, model_name: str, texts: List[str], batch_size: int, threads: int, singles: int) -> Dict:
+    rss0 = _rss_mb()
+    t0 = time.perf_counter()
+    svc = _load(backend, model_name, threads, batch_size)
+    svc._embed_texts(["warmup"])
+    load_s = time.perf_counter() - t0
+
+    lat: List[float] = []
+    for t in texts[:singles]:
+        s = time.perf_counter()
+        svc._embed_texts([t])
+        lat.append(1000 * (time.perf_counter() - s))
+
+    s = time.perf_counter()
+    vecs: List[List[float]] = []
+    for i in range(0, len(texts), batch_size):
+        vecs.extend(svc._embed_texts(texts[i:i + batch_size]))
+    elapsed = time.perf_counter() - s
+    lat.sort()
+    return {
+        "backend": backend,
+        "load_s": round(load_s, 2),
+        "single_p50_ms": round(statistics.median(lat), 2),
+        "single_p95_ms": round(lat[int(0.95 * (len(lat) - 1))], 2),
+        "throughput_tps": round(len(texts) / elapsed, 1),
+        "rss_delta_mb": round(_rss_mb() - rss0, 1),
+        "_vecs": np.asarray(vecs, dtype=np.float32),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.bench.embeddings")
+    parser.add_argument("--model", default=None)
+    parser.add_argument("--n", type=int, default=512, help="texts for the throughput run")
+    parser.add_argument("--singles", type=int, default=100, help="single-text calls for latency")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--threads", type=int, default=get_settings().embedding_onnx_threads)
+    parser.add_argument("--backends", default="torch,onnx")
+    args = parser.parse_args(argv)
+
+    model_name = args.model or get_settings().embedding_model or "sentence-transformers/all-MiniLM-L6-v2"
+    texts = _sample_texts(args.n)
+    results = [
+        run_backend(b.strip(), model_name, texts, args.batch_size, args.threads, min(args.singles, args.n))
+        for b in args.backends.split(",") if b.strip()
+    ]
+    print(f"model={model_name} n={args.n} batch_size={args.batch_size} threads={args.threads or 'default'}")
+    for r in results:
+        print("  ".join(f"{k}={v}" for k, v in r.items() if not k.startswith("_")))
+    if len(results) == 2:
+        a, b = results[0]["_vecs"], results[1]["_vecs"]
+        cos = (a * b).sum(axis=1) / (np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1) + 1e-12)
+        print(f"agreement {results[0]['backend']} vs {results[1]['backend']}: cos_mean={cos.mean():.4f} cos_min={cos.min():.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""rag_embeddings 저장 모드별 recall/지연/인덱스 크기 벤치마크.
+
+    python -m app.bench.vector_modes [--queries 50] [--k 10] [--modes full,half,binary] [--collection interview_kb]
+
+active 임베딩 공간에 저장된 벡터 중 일부를 질의로 사용해(임베딩 API 호출 없음) 인덱스 없는 정확 검색 결과를 정답으로 두고,
+모드별 HNSW 인덱스를 만든 뒤 recall@k, 질의 지연(p50/p95), 인덱스 크기를 출력한다.
+끝나면 설정된 모드(VECTOR_STORAGE_MODE) 외의 인덱스는 제거한다(--keep-indexes로 유지).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+
+from app.core.config import get_settings
+from app.core.embedding_spaces import Space, active_space
+from app.core.vectorstore import VECTOR_STORAGE_MODES, ensure_vector_index, search_vectors, vector_index_name
+from app.models.db import get_engine
+
+
+def _sample_queries(conn, space: Space, collection: str, n: int) -> List[List[float]]:
+    rows = conn.execute(
+        text(
+            "SELECT embedding::text FROM rag_embeddings WHERE space_id = :s AND collection = :c AND embedding IS NOT NULL "
+            "ORDER BY random() LIMIT :n"
+        ),
+        {"s": space.id, "c": collection, "n": n},
+    ).fetchall()
+    return [json.loads(r[0]) for r in rows]
+
+
+def _exact_top_k(conn, space: Space, qv: List[float], collection: str, k: int) -> List[str]:
+    conn.execute(text("SET LOCAL enable_indexscan = off"))
+    conn.execute(text("SET LOCAL enable_bitmapscan = off"))
+    rows = conn.execute(
+        text("SELECT id FROM rag_embeddings WHERE space_id = :s AND collection = :c ORDER BY embedding <=> (:qv)::vector LIMIT :k"),
+        {"s": space.id, "c": collection, "qv": "[" + ",".join(map(str, qv)) + "]", "k": k},
+    ).fetchall()
+    return [r[0] for r in rows]
+
+
+def bench_mode(mode: str, space: Space, queries: List[List[float]], truth: List[List[str]], collection: str, k: int) -> Dict:
+    engine = get_engine()
+    with engine.begin() as conn:
+        t0 = time.perf_counter()
+        name = ensure_vector_index(conn, space.id, len(queries[0]), mode, drop_others=False)
+        build_s = time.perf_counter() - t0
+    lat: List[float] = []
+    recalls: List[float] = []
+    for qv, gt in zip(queries, truth):
+        with engine.connect() as conn:
+            s = time.perf_counter()
+            rows = search_vectors(conn, qv, collection, k, mode, space_id=space.id)
+            lat.append(1000 * (time.perf_counter() - s))
+        got = {r[0] for r in rows}
+        recalls.append(len(got & set(gt)) / max(1, len(gt)))
+    with engine.connect() as conn:
+        size = conn.execute(text("SELECT pg_relation_size(to_regclass(:n))"), {"n": name}).scalar() or 0
+    lat.sort()
+    return {
+        "mode": mode,
+        f"recall@{k}": round(statistics.mean(recalls), 4),
+        "p50_ms": round(statistics.median(lat), 2),
+        "p95_ms": round(lat[int(0.95 * (len(lat) - 1))], 2),
+        "index_mb": round(size / 1024 / 1024, 2),
+        "build_s": round(build_s, 2),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.bench.vector_modes")
+    parser.add_argument("--collection", default="interview_kb")
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--modes", default=",".join(VECTOR_STORAGE_MODES))
+    parser.add_argument("--keep-indexes", action="store_true")
+    args = parser.parse_args(argv)
+
+    engine = get_engine()
+    space = active_space()
+    with engine.connect() as conn:
+        queries = _sample_queries(conn, space, args.collection, args.queries)
+        total = conn.execute(
+            text("SELECT COUNT(*) FROM rag_embeddings WHERE space_id = :s AND collection = :c"),
+            {"s": space.id, "c": args.collection},
+        ).scalar()
+    if not queries:
+        print(f"no vectors in collection {args.collection}")
+        return
+    truth = []
+    for qv in queries:
+        with engine.begin() as conn:
+            truth.append(_exact_top_k(conn, space, qv, args.collection, args.k))
+
+    print(f"space={space.id} ({space.model_name}) collection={args.collection} rows={total} dim={len(queries[0])} queries={len(queries)} k={args.k}")
+    modes = [m.strip() for m in args.modes.split(",") if m.strip()]
+    try:
+        for mode in modes:
+            print("  ".join(f"{k}={v}" for k, v in bench_mode(mode, space, queries, truth, args.collection, args.k).items()))
+    finally:
+        if not args.keep_indexes:
+            configured = get_settings().vector_storage_mode
+            with engine.begin() as conn:
+                for mode in modes:
+                    if mode != configured:
+                        conn.execute(text(f"DROP INDEX IF EXISTS {vector_index_name(mode, space.id)}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,23 @@
 from __future__ import annotations
 
+import time
 from datetime import datetime, timedelta
 from typing import Optional
 
 from jose import jwt, JWTError
 
+from app.core.cache import TTLCache
 from app.core.config import get_settings
 
 
 ALGO = "HS256"
 
+# 검증 통과한 토큰 → payload. 항목 수명은 토큰 exp를 넘지 않는다.
+_verified_cache: TTLCache[dict] = TTLCache(
+    max_entries=get_settings().jwt_cache_max_entries,
+    ttl_seconds=get_settings().jwt_cache_ttl_seconds,
+)
+
 
 def create_access_token(user_id: int, email: str, expires_minutes: int | None = None) -> str:
     settings = get_settings()
@@ -26,11 +34,17 @@ def create_access_token(user_id: int, email: str, expires_minutes: int | None =
 
 
 def verify_token(token: str) -> Optional[dict]:
+    cached = _verified_cache.get(token)
+    if cached is not None:
+        return dict(cached)
     settings = get_settings()
     try:
         payload = jwt.decode(token, settings.jwt_secret, algorithms=[ALGO])
-        return payload
     except JWTError:
         return None
+    exp = payload.get("exp")
+    ttl = settings.jwt_cache_ttl_seconds if exp is None else min(settings.jwt_cache_ttl_seconds, float(exp) - time.time())
+    _verified_cache.set(token, payload, ttl_seconds=ttl)
+    return dict(payload)
 
 
@@ -12,17 +12,105 @@ class Settings(BaseSettings):
     pg_password: str | None = None
     pg_db: str | None = None
 
+    # 커넥션 풀 (프로세스별: API 워커/큐 워커 각각 적용)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0  # 풀 대기 최대 시간(초)
+    db_pool_recycle: int = 1800  # 초. 오래된 커넥션 재생성
+    db_pool_pre_ping: bool = True
+    db_prepare_threshold: int | None = 5  # psycopg 서버측 prepared statement 전환 임계값
+    db_pgbouncer_mode: bool = False  # pgbouncer transaction pooling: prepared statement 비활성
+    db_auto_migrate: bool = False  # 기동 시 스키마가 뒤처져 있으면 직접 마이그레이션(단일 인스턴스/로컬 개발용)
+
     openai_api_key: str | None = None
     llm_model: str = "gpt-5-nano"
 
+    # LLM 응답 캐시 (opt-in)
+    llm_cache_enabled: bool = False
+    llm_cache_sites: str = "question"  # 콤마 구분: question | eval | feedback
+    llm_cache_memory_max_entries: int = 512
+    llm_cache_memory_ttl_seconds: int = 600
+    llm_cache_db_enabled: bool = True  # Postgres(llm_cache 테이블) 2차 캐시
+    llm_cache_ttl_seconds: int = 86400
+    llm_cache_purge_interval_seconds: int = 3600  # 워커가 만료된 llm_cache 행을 지우는 주기(0이면 끔)
+
+    # 동일한 동시 LLM/임베딩 요청 합치기(프로세스 내)
+    singleflight_enabled: bool = True
+
     jwt_secret: str = "dev-secret"
     jwt_expires_minutes: int = 60
+    jwt_cache_max_entries: int = 10000  # 검증된 토큰 캐시(만료 시각까지만 유지)
+    jwt_cache_ttl_seconds: float = 300.0  # 캐시 최대 보관 시간(exp가 더 이르면 exp까지)
+    bcrypt_rounds: int = 12  # bcrypt cost factor
+    password_hash_workers: int = 2  # bcrypt 전용 스레드 수
 
-    embedding_provider: str = "auto"  # auto | openai | sentence-transformers
+    embedding_provider: str = "auto"  # auto | openai | sentence-transformers | server | onnx
     embedding_model: str | None = None  # if None, choose sensible default per provider
-    embedding_dim: int = 1536  # OpenAI text-embedding-3-small
+    embedding_dim: int = 1536  # (미사용) 저장 차원은 embedding_space 레지스트리에서 관리
+    # 저장 차원 축소: text-embedding-3는 API dimensions 파라미터, 그 외는 앞쪽 차원 절단 + 재정규화
+    embedding_dimensions: int | None = None  # 모델/차원이 바뀌면 워커가 새 임베딩 공간으로 재임베딩
+    # rag_embeddings 검색 인덱스 정밀도: full(vector) | half(halfvec) | binary(bit + full 정밀도 재정렬)
+    vector_storage_mode: str = "full"
+    vector_rerank_factor: int = 4  # binary 모드: k * factor 후보를 뽑아 원본 벡터로 재정렬
+    vector_ef_search: int = 40  # HNSW 탐색 폭(후보 수보다 작으면 후보 수로 올림)
+    vector_hnsw_m: int = 16
+    vector_hnsw_ef_construction: int = 64
+    # 테넌트(사용자) 해시 파티션(rag_embeddings_p{n}); 개수 변경은 새 DB/마이그레이션 시점에만 반영
+    vector_partitions: int = 16
+    # 테넌트 검색: exact(테넌트 행만 정확 검색, 기본) | ann(HNSW + tenant 필터, 테넌트가 매우 클 때)
+    vector_tenant_search: str = "exact"
+    # 지표(app.core.metrics): API는 GET /metrics, 워커는 이 포트에서 노출(0이면 비활성)
+    metrics_enabled: bool = True
+    metrics_worker_port: int = 9101
+    # 임베딩 공간 전환(모델/차원 변경 시 무중단 재임베딩, app.services.reembed_service)
+    embedding_auto_reembed: bool = True  # 워커 기동 시 설정과 active 공간이 다르면 재임베딩 시작
+    reembed_batch_size: int = 256  # reembed_batch 작업 1회당 행 수
+    embedding_space_cache_ttl_seconds: float = 5.0  # 프로세스별 active 공간 캐시(전환 반영 지연 상한)
+    embedding_space_retire_grace_seconds: float = 600.0  # 전환 후 이전 공간 행 삭제까지 유예
+    # 공유 로컬 임베딩 서버(provider=server): tcp://host:port 또는 unix:///path.sock
+    embedding_server_url: str = "tcp://127.0.0.1:7997"
+    embedding_server_timeout: float = 30.0  # 클라이언트 소켓 타임아웃(초)
+    embedding_server_max_batch: int = 64  # 서버가 한 번에 encode할 최대 텍스트 수
+    embedding_server_max_wait_ms: float = 5.0  # 배치를 모으기 위해 첫 요청 후 기다리는 최대 시간
+    embedding_server_backend: str = "sentence-transformers"  # 서버 내부 모델: sentence-transformers | onnx
+    # int8 ONNX 백엔드(provider=onnx): `python -m app.core.onnx_embeddings export`로 생성
+    embedding_onnx_dir: str | None = None  # 기본 data/onnx/<model>
+    embedding_onnx_threads: int = 0  # onnxruntime intra-op 스레드 수(0=코어 수)
+    embedding_onnx_batch_size: int = 32
+
+    # 프롬프트 토큰 예산 (로컬 토크나이저 기준)
+    prompt_tokenizer_encoding: str = "o200k_base"  # 모델명으로 인코딩을 찾지 못할 때 사용
+    prompt_context_budget_tokens: int = 1200  # 질문 생성 시 근거 자료 예산
+    prompt_transcript_budget_tokens: int = 3000  # 피드백 생성 시 면접 전사 예산
+    prompt_transcript_recent_turns: int = 4  # 원문 그대로 유지할 최근 문항 수
+    prompt_size_sample_rate: float = 0.0  # 로컬 토큰 수 로그 표본 비율(0=끔, DEBUG 로그면 항상). 실제 사용량은 llm_tokens 지표
+
+    dashboard_cache_ttl_seconds: float = 30.0  # /dashboard/summary 캐시 TTL
+    dashboard_cache_max_entries: int = 10000
+
+    # 기동 워밍업(lifespan 백그라운드): 임베딩 모델/그래프/풀 커넥션 선로딩
+    warmup_enabled: bool = True
+    warmup_db_connections: int = 2  # 미리 열어 둘 동기 풀 커넥션 수
+
+    answer_pipeline_workers: int = 16  # 답변 스트리밍 파이프라인 스레드 수
+
+    # 음성 답변 STT
+    stt_backend: str = "auto"  # auto | faster-whisper | stub(결정적 로컬 대체)
+    stt_model: str = "small"  # faster-whisper 모델 크기
+    stt_language: str | None = "ko"
+    stt_workers: int = 1  # 전사 프로세스 수(API 프로세스당)
+    stt_cpu_threads: int = 4  # 전사 프로세스당 CPU 스레드
+    stt_spool_dir: str = "./data/stt_spool"  # API/워커가 공유해야 함
+    stt_upload_chunk_bytes: int = 1024 * 1024
+    stt_max_upload_mb: int = 25
+    queue_max_attempts: int = 5  # 작업 실패 시 재시도 상한(도달하면 failed, 작업별 정리 수행)
+    stt_sync_max_seconds: float = 60.0  # 이보다 긴 오디오는 큐 작업으로 처리(202)
 
     allow_url_fetch: bool = True
+    job_fetch_timeout_seconds: float = 10.0
+    job_fetch_max_bytes: int = 2 * 1024 * 1024  # 응답 본문 상한(스트리밍 중 초과 시 중단)
+    job_fetch_cache_ttl_seconds: int = 6 * 3600  # 공유 캐시 신선도. 지나면 ETag/Last-Modified로 조건부 재요청
+    job_fetch_user_agent: str = "ai-interview-coach/0.1 (+job-posting-fetch)"
     max_follow_ups: int = 3
     frontend_origin: str | None = None
 
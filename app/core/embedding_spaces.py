@@ -0,0 +1,103 @@
+"""임베딩 공간 조회/선택.
+
+- 검색: active 공간의 모델로 질의를 임베딩하고 그 공간의 행만 검색
+- 기록: active + building 공간 모두에 기록(재임베딩 중 새 문서 누락 방지)
+- legacy 공간: 공간 도입 이전 행(생성 모델 불명). 질의는 현재 설정 모델로 최선 추정하고,
+  재임베딩 대상(building) 공간이 생기면 그쪽에만 기록한다
+
+레지스트리는 프로세스별로 embedding_space_cache_ttl_seconds 동안 캐시한다.
+전환(flip)은 DB에서 원자적이며, 각 프로세스는 캐시 만료 후 새 공간을 읽는다(이전 공간 행은 유예 후 삭제).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from sqlalchemy import text
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.core.embeddings import EmbeddingService, get_embedding_service_for, resolve_embedding_spec
+from app.models.db import get_engine
+
+
+# 마이그레이션 9가 기존 행에 붙이는 모델명(어떤 설정 모델과도 일치하지 않음 → 항상 재임베딩)
+LEGACY_MODEL = "legacy"
+
+
+@dataclass(frozen=True)
+class Space:
+    id: int
+    provider: str
+    model_name: str
+    dimensions: Optional[int]
+    dim: Optional[int]
+    status: str
+
+    @property
+    def is_legacy(self) -> bool:
+        return self.model_name == LEGACY_MODEL
+
+    @property
+    def service(self) -> EmbeddingService:
+        if self.is_legacy:
+            return get_embedding_service_for(*resolve_embedding_spec())
+        return get_embedding_service_for(self.provider, self.model_name, self.dimensions)
+
+    def matches(self, model_name: str, dimensions: Optional[int]) -> bool:
+        # provider(sbert/onnx/server)만 다르면 같은 모델이므로 재임베딩하지 않음
+        return self.model_name == model_name and (self.dimensions or None) == (dimensions or None)
+
+
+_cache: TTLCache[Tuple[Optional[Space], Tuple[Space, ...]]] = TTLCache(max_entries=1, ttl_seconds=5.0)
+
+
+def load_spaces(conn) -> Tuple[Optional[Space], Tuple[Space, ...]]:
+    """(active, building 목록)."""
+    rows = conn.execute(text(
+        "SELECT id, provider, model_name, dimensions, dim, status FROM embedding_space "
+        "WHERE status IN ('active', 'building') ORDER BY id"
+    )).fetchall()
+    spaces = [Space(*r) for r in rows]
+    active = next((s for s in spaces if s.status == "active"), None)
+    return active, tuple(s for s in spaces if s.status == "building")
+
+
+def get_spaces() -> Tuple[Optional[Space], Tuple[Space, ...]]:
+    cached = _cache.get("spaces")
+    if cached is not None:
+        return cached
+    with get_engine().connect() as conn:
+        spaces = load_spaces(conn)
+    _cache.set("spaces", spaces, ttl_seconds=get_settings().embedding_space_cache_ttl_seconds)
+    return spaces
+
+
+def invalidate_spaces() -> None:
+    _cache.clear()
+
+
+def active_space() -> Space:
+    active, _ = get_spaces()
+    if active is None:
+        raise RuntimeError("no active embedding space; run `python -m app.models.migrations`")
+    return active
+
+
+def write_spaces() -> List[Space]:
+    active, building = get_spaces()
+    if active is not None and active.is_legacy and building:
+        # 모델 불명 공간에는 더 쓰지 않음(차원이 다르면 부분 인덱스 식에서 실패). 전환 후 building이 active가 됨
+        return list(building)
+    return ([active] if active else []) + list(building)
+
+
+__all__ = [
+    "LEGACY_MODEL",
+    "Space",
+    "load_spaces",
+    "get_spaces",
+    "invalidate_spaces",
+    "active_space",
+    "write_spaces",
+]
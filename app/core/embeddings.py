@@ -1,57 +1,225 @@
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional, Tuple
 from functools import lru_cache
+import hashlib
+import json
+import socket
+import threading
 
 import numpy as np
 
 from app.core.config import get_settings
+from app.core.metrics import embedding_batch_size, embedding_seconds
+from app.core.singleflight import embedding_flight
+
+
+def truncate_embeddings(vectors: List[List[float]], dims: Optional[int]) -> List[List[float]]:
+    """앞쪽 dims 차원만 남기고 L2 재정규화(Matryoshka 방식). API가 차원 축소를 직접 지원하지 않는 백엔드용."""
+    if not dims or not vectors or len(vectors[0]) <= dims:
+        return vectors
+    arr = np.asarray(vectors, dtype=np.float32)[:, :dims]
+    arr /= np.clip(np.linalg.norm(arr, axis=1, keepdims=True), 1e-12, None)
+    return arr.tolist()
 
 
 class EmbeddingService:
+    provider: str = ""  # 지표 라벨
+    model_name: str = ""
+    # 저장 차원 축소(EMBEDDING_DIMENSIONS). None이면 모델 원래 차원
+    dimensions: Optional[int] = None
+
     def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """동일 입력의 동시 임베딩 요청은 업스트림 호출 1회로 합친다(single-flight)."""
+        if not texts:
+            return []
+        if not get_settings().singleflight_enabled:
+            return self._embed_and_truncate(texts)
+        h = hashlib.sha256(f"{self.model_name}:{self.dimensions or ''}".encode("utf-8"))
+        for t in texts:
+            h.update(b"\x1f" + t.encode("utf-8"))
+        return embedding_flight.do(h.hexdigest(), lambda: self._embed_and_truncate(texts))
+
+    def _embed_and_truncate(self, texts: List[str]) -> List[List[float]]:
+        embedding_batch_size.labels(provider=self.provider).observe(len(texts))
+        with embedding_seconds.labels(provider=self.provider).time():
+            return truncate_embeddings(self._embed_texts(texts), self.dimensions)
+
+    def _embed_texts(self, texts: List[str]) -> List[List[float]]:
         raise NotImplementedError
 
 
 class OpenAIEmbeddingService(EmbeddingService):
-    def __init__(self, model: str):
+    provider = "openai"
+
+    def __init__(self, model: str, dimensions: Optional[int] = None):
         from openai import OpenAI
 
         self.client = OpenAI()
         self.model = model
+        self.model_name = model
+        self.dimensions = dimensions
 
-    def embed_texts(self, texts: List[str]) -> List[List[float]]:
+    def _embed_texts(self, texts: List[str]) -> List[List[float]]:
         if not texts:
             return []
-        resp = self.client.embeddings.create(model=self.model, input=texts)
+        # text-embedding-3 계열은 서버에서 차원 축소(+정규화)를 지원
+        extra = {"dimensions": self.dimensions} if self.dimensions and self.model.startswith("text-embedding-3") else {}
+        resp = self.client.embeddings.create(model=self.model, input=texts, **extra)
         return [d.embedding for d in resp.data]
 
 
 class LocalSBERTEmbeddingService(EmbeddingService):
+    provider = "sentence-transformers"
+
     def __init__(self, model_name: str = "sentence-transformers/all-MiniLM-L6-v2"):
         from sentence_transformers import SentenceTransformer
 
         self.model = SentenceTransformer(model_name)
+        self.model_name = model_name
 
-    def embed_texts(self, texts: List[str]) -> List[List[float]]:
+    def _embed_texts(self, texts: List[str]) -> List[List[float]]:
         if not texts:
             return []
         embs = self.model.encode(texts, show_progress_bar=False, convert_to_numpy=True, normalize_embeddings=True)
         return embs.tolist()
 
 
-@lru_cache
-def get_embedding_service() -> EmbeddingService:
+class EmbeddingModelMismatch(RuntimeError):
+    """임베딩 서버에 적재된 모델/차원이 클라이언트(임베딩 공간)가 기대하는 것과 다름."""
+
+
+class RemoteEmbeddingService(EmbeddingService):
+    """공유 임베딩 서버(app.embedding_server.main) 클라이언트. 모델은 서버 프로세스에만 적재된다.
+    스레드별로 소켓 1개를 유지하고, 끊기면 1회 재연결 후 재시도한다.
+
+    연결마다 서버의 info(모델/차원)를 확인하고, embed 요청에도 model을 실어 보내 서버가 불일치를 거부한다
+    (다른 모델로 재시작된 서버의 벡터가 조용히 섞이지 않도록)."""
+
+    provider = "server"
+
+    def __init__(self, url: str, model_name: str, timeout: float = 30.0):
+        self.url = url
+        self.model_name = model_name
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connect(self) -> socket.socket:
+        from app.embedding_server.protocol import parse_address
+
+        kind, addr = parse_address(self.url)
+        if kind == "unix":
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.settimeout(self.timeout)
+        sock.connect(addr)
+        return sock
+
+    @staticmethod
+    def _roundtrip(sock: socket.socket, req: dict) -> tuple[dict, Optional[bytes]]:
+        from app.embedding_server.protocol import encode_json, recv_frame
+
+        sock.sendall(encode_json(req))
+        header = json.loads(recv_frame(sock))
+        body = recv_frame(sock) if header.get("ok") and "n" in header else None
+        return header, body
+
+    def check_info(self, info: dict) -> None:
+        """서버 모델이 self.model_name과 같고, 축소 차원(dimensions)이 서버 차원 이하인지 확인."""
+        if info.get("model") != self.model_name:
+            raise EmbeddingModelMismatch(
+                f"embedding server at {self.url} serves {info.get('model')!r}, expected {self.model_name!r}"
+            )
+        if self.dimensions and info.get("dim") and int(info["dim"]) < self.dimensions:
+            raise EmbeddingModelMismatch(
+                f"embedding server at {self.url} returns {info['dim']}-d vectors, expected >= {self.dimensions}"
+            )
+
+    def _request(self, req: dict) -> tuple[dict, Optional[bytes]]:
+        for attempt in (0, 1):
+            sock = getattr(self._local, "sock", None)
+            try:
+                if sock is None:
+                    sock = self._connect()
+                    # 새 연결마다(서버 재시작 포함) 적재된 모델 확인
+                    info, _ = self._roundtrip(sock, {"op": "info"})
+                    try:
+                        self.check_info(info)
+                    except EmbeddingModelMismatch:
+                        sock.close()
+                        raise
+                    self._local.sock = sock
+                return self._roundtrip(sock, req)
+            except OSError:
+                # 서버 재시작 등으로 끊긴 소켓: 폐기 후 1회 재시도
+                if sock is not None:
+                    sock.close()
+                self._local.sock = None
+                if attempt:
+                    raise
+        raise ConnectionError("unreachable")
+
+    def info(self) -> dict:
+        header, _ = self._request({"op": "info"})
+        return header
+
+    def _embed_texts(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        header, body = self._request({"op": "embed", "texts": texts, "model": self.model_name})
+        if not header.get("ok"):
+            if header.get("code") == "model_mismatch":
+                raise EmbeddingModelMismatch(header.get("error"))
+            raise RuntimeError(f"embedding server error: {header.get('error')}")
+        return np.frombuffer(body or b"", dtype="<f4").reshape(header["n"], header["dim"]).tolist()
+
+
+_DEFAULT_LOCAL_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+def resolve_embedding_spec() -> Tuple[str, str, Optional[int]]:
+    """설정 기준 (provider, model_name, dimensions). 모델을 로드하지 않고 결정만 한다."""
     settings = get_settings()
     provider = settings.embedding_provider.lower() if settings.embedding_provider else "auto"
-
     # Prefer OpenAI if API key exists and provider is auto/openai
     if settings.openai_api_key and provider in {"auto", "openai"}:
-        model = settings.embedding_model or "text-embedding-3-small"
-        return OpenAIEmbeddingService(model=model)
+        return "openai", settings.embedding_model or "text-embedding-3-small", settings.embedding_dimensions
+    if provider not in {"server", "onnx"}:
+        provider = "sentence-transformers"
+    return provider, settings.embedding_model or _DEFAULT_LOCAL_MODEL, settings.embedding_dimensions
+
+
+@lru_cache
+def get_embedding_service() -> EmbeddingService:
+    return get_embedding_service_for(*resolve_embedding_spec())
+
+
+@lru_cache
+def get_embedding_service_for(provider: str, model_name: str, dimensions: Optional[int] = None) -> EmbeddingService:
+    """임베딩 공간(app.core.embedding_spaces)별 서비스. 모델 전환 중에는 이전/신규 모델이 함께 쓰인다."""
+    svc = _create_embedding_service(provider, model_name, dimensions)
+    svc.dimensions = dimensions
+    return svc
+
+
+def _create_embedding_service(provider: str, model_name: str, dimensions: Optional[int]) -> EmbeddingService:
+    settings = get_settings()
+    if provider == "openai":
+        return OpenAIEmbeddingService(model=model_name, dimensions=dimensions)
+
+    # 공유 임베딩 서버(프로세스마다 모델을 올리지 않음)
+    if provider == "server":
+        return RemoteEmbeddingService(settings.embedding_server_url, model_name, timeout=settings.embedding_server_timeout)
+
+    # int8 양자화 ONNX(CPU): torch 없이 onnxruntime으로 추론. 사전 export 필요
+    if provider == "onnx":
+        from app.core.onnx_embeddings import OnnxEmbeddingService
+
+        return OnnxEmbeddingService(model_name, threads=settings.embedding_onnx_threads, batch_size=settings.embedding_onnx_batch_size)
 
     # Fallback to local SBERT
-    model_name = settings.embedding_model or "sentence-transformers/all-MiniLM-L6-v2"
     return LocalSBERTEmbeddingService(model_name=model_name)
 
 
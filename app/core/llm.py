@@ -1,21 +1,116 @@
 from __future__ import annotations
 
-from typing import List, Dict, Any, Iterator, AsyncIterator
+from typing import List, Dict, Any, Iterator, AsyncIterator, Optional
 from functools import lru_cache
 import os
 import time
 import asyncio
 
 from app.core.config import get_settings
+from app.core.llm_cache import get_llm_cache, make_cache_key
+from app.core.metrics import llm_errors, llm_first_token_seconds, llm_tokens, llm_upstream_seconds
+from app.core.singleflight import llm_flight
 
 
 class LLMService:
-    def chat(self, messages: List[Dict[str, str]]) -> str:
+    model: str = ""
+
+    def chat(
+        self,
+        messages: List[Dict[str, str]],
+        call_site: Optional[str] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """채팅 완성.
+
+        - call_site가 캐시 대상(settings.llm_cache_sites)이면 응답 캐시를 사용
+        - 동일 요청이 동시에 들어오면 업스트림 호출 1회로 합침(single-flight)
+        - response_format: 구조화 출력(JSON schema) 지정. 지원하지 않는 구현은 무시
+        """
+        cache = get_llm_cache()
+        use_cache = cache.enabled_for(call_site)
+        coalesce = get_settings().singleflight_enabled
+        if not use_cache and not coalesce:
+            return self._timed_chat(messages, response_format, call_site)
+        key = make_cache_key(self.model, messages, {"response_format": response_format})
+        if use_cache:
+            cached = cache.get(key, call_site)
+            if cached is not None:
+                return cached
+
+        def call() -> str:
+            out = self._timed_chat(messages, response_format, call_site)
+            if use_cache:
+                cache.set(key, call_site, self.model, out)
+            return out
+
+        return llm_flight.do(key, call) if coalesce else call()
+
+    def _timed_chat(self, messages: List[Dict[str, str]], response_format: Optional[Dict[str, Any]], call_site: Optional[str]) -> str:
+        """업스트림 호출 지연/오류 기록(캐시 적중·single-flight 대기는 제외)."""
+        start = time.perf_counter()
+        try:
+            return self._chat(messages, response_format, call_site)
+        except Exception:
+            llm_errors.labels(call_site=call_site, mode="chat").inc()
+            raise
+        finally:
+            llm_upstream_seconds.labels(call_site=call_site, mode="chat").observe(time.perf_counter() - start)
+
+    def _timed_stream(self, messages: List[Dict[str, str]], response_format: Optional[Dict[str, Any]], call_site: Optional[str]) -> Iterator[str]:
+        """스트림 첫 청크까지의 시간과 전체 시간을 기록."""
+        start = time.perf_counter()
+        first = True
+        try:
+            for chunk in self._chat_stream(messages, response_format, call_site):
+                if first:
+                    llm_first_token_seconds.labels(call_site=call_site).observe(time.perf_counter() - start)
+                    first = False
+                yield chunk
+        except Exception:
+            llm_errors.labels(call_site=call_site, mode="stream").inc()
+            raise
+        finally:
+            llm_upstream_seconds.labels(call_site=call_site, mode="stream").observe(time.perf_counter() - start)
+
+    def _chat(
+        self,
+        messages: List[Dict[str, str]],
+        response_format: Optional[Dict[str, Any]] = None,
+        call_site: Optional[str] = None,
+    ) -> str:
         raise NotImplementedError
     
-    def chat_stream(self, messages: List[Dict[str, str]]) -> Iterator[str]:
-        """스트리밍 채팅 (기본 구현: 토큰 단위 분할)"""
-        response = self.chat(messages)
+    def chat_stream(
+        self,
+        messages: List[Dict[str, str]],
+        call_site: Optional[str] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[str]:
+        """스트리밍 채팅. 캐시 적중 시 전체 응답을 한 번에 반환하고, 미스 시 스트림 완료 후 저장."""
+        cache = get_llm_cache()
+        if not cache.enabled_for(call_site):
+            yield from self._timed_stream(messages, response_format, call_site)
+            return
+        key = make_cache_key(self.model, messages, {"response_format": response_format})
+        cached = cache.get(key, call_site)
+        if cached is not None:
+            yield cached
+            return
+        parts: List[str] = []
+        for chunk in self._timed_stream(messages, response_format, call_site):
+            parts.append(chunk)
+            yield chunk
+        cache.set(key, call_site, self.model, "".join(parts).strip())
+
+    def _chat_stream(
+        self,
+        messages: List[Dict[str, str]],
+        response_format: Optional[Dict[str, Any]] = None,
+        call_site: Optional[str] = None,
+    ) -> Iterator[str]:
+        """스트리밍 기본 구현: 토큰 단위 분할"""
+        response = self._chat(messages, response_format, call_site)
         # 간단한 토큰 분할 (실제로는 LLM API의 스트리밍 사용)
         words = response.split()
         for word in words:
@@ -38,28 +133,53 @@ class OpenAILLMService(LLMService):
         self.client = OpenAI()
         self.model = model
 
-    def chat(self, messages: List[Dict[str, str]]) -> str:
-        resp = self.client.chat.completions.create(model=self.model, messages=messages)
+    def _chat(
+        self,
+        messages: List[Dict[str, str]],
+        response_format: Optional[Dict[str, Any]] = None,
+        call_site: Optional[str] = None,
+    ) -> str:
+        extra: Dict[str, Any] = {"response_format": response_format} if response_format else {}
+        resp = self.client.chat.completions.create(model=self.model, messages=messages, **extra)
+        _record_usage(call_site, resp.usage)
         return (resp.choices[0].message.content or "").strip()
     
-    def chat_stream(self, messages: List[Dict[str, str]]) -> Iterator[str]:
+    def _chat_stream(
+        self,
+        messages: List[Dict[str, str]],
+        response_format: Optional[Dict[str, Any]] = None,
+        call_site: Optional[str] = None,
+    ) -> Iterator[str]:
         """OpenAI 스트리밍 지원"""
+        extra: Dict[str, Any] = {"response_format": response_format} if response_format else {}
         try:
             stream = self.client.chat.completions.create(
                 model=self.model, 
                 messages=messages, 
-                stream=True
+                stream=True,
+                # 마지막 청크(choices 비어 있음)에 토큰 사용량 포함
+                stream_options={"include_usage": True},
+                **extra,
             )
             
             for chunk in stream:
-                if chunk.choices[0].delta.content:
+                if chunk.usage is not None:
+                    _record_usage(call_site, chunk.usage)
+                if chunk.choices and chunk.choices[0].delta.content:
                     yield chunk.choices[0].delta.content
         except Exception as e:
             # 스트리밍 실패 시 일반 응답으로 fallback
-            fallback_response = self.chat(messages)
+            fallback_response = self._chat(messages, response_format, call_site)
             yield fallback_response
 
 
+def _record_usage(call_site: Optional[str], usage: Any) -> None:
+    if usage is None:
+        return
+    llm_tokens.labels(call_site=call_site, kind="prompt").observe(usage.prompt_tokens or 0)
+    llm_tokens.labels(call_site=call_site, kind="completion").observe(usage.completion_tokens or 0)
+
+
 @lru_cache
 def get_llm() -> LLMService:
     settings = get_settings()
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from collections import defaultdict
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.core.metrics import register_collector
+
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(model: str, messages: List[Dict[str, str]], params: Optional[Dict[str, Any]] = None) -> str:
+    """model + messages + 호출 파라미터의 정규화된 JSON 해시."""
+    raw = json.dumps(
+        {"model": model, "messages": messages, "params": params or {}},
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """LLM 응답 캐시: 메모리(LRU+TTL) → Postgres 2단 구성.
+
+    - 호출 지점(call_site) 단위로 opt-in (settings.llm_cache_sites)
+    - 캐시 오류는 응답 경로를 막지 않도록 로그만 남기고 무시
+    """
+
+    def __init__(self):
+        settings = get_settings()
+        self.enabled = settings.llm_cache_enabled
+        self.sites = {s.strip() for s in (settings.llm_cache_sites or "").split(",") if s.strip()}
+        self.db_enabled = settings.llm_cache_db_enabled
+        self.ttl_seconds = settings.llm_cache_ttl_seconds
+        self.memory = TTLCache[str](
+            max_entries=settings.llm_cache_memory_max_entries,
+            ttl_seconds=settings.llm_cache_memory_ttl_seconds,
+        )
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def enabled_for(self, call_site: Optional[str]) -> bool:
+        return self.enabled and bool(call_site) and call_site in self.sites
+
+    def _count(self, call_site: str, name: str) -> None:
+        with self._lock:
+            self._counters[call_site][name] += 1
+
+    def get(self, key: str, call_site: str) -> Optional[str]:
+        value = self.memory.get(key)
+        if value is not None:
+            self._count(call_site, "memory_hits")
+            return value
+        if self.db_enabled:
+            row = self._db_get(key)
+            if row is not None:
+                value, expires_at = row
+                # DB 행의 남은 수명보다 메모리에 오래 남지 않도록
+                ttl = self.memory.ttl_seconds
+                if expires_at is not None:
+                    ttl = min(ttl, (expires_at - datetime.utcnow()).total_seconds())
+                self.memory.set(key, value, ttl_seconds=ttl)
+                self._count(call_site, "db_hits")
+                return value
+        self._count(call_site, "misses")
+        return None
+
+    def set(self, key: str, call_site: str, model: str, response: str) -> None:
+        if not response:
+            return
+        # 메모리 항목이 DB TTL(llm_cache_ttl_seconds)보다 오래 살지 않도록
+        ttl = self.memory.ttl_seconds
+        if self.ttl_seconds > 0:
+            ttl = min(ttl, self.ttl_seconds)
+        self.memory.set(key, response, ttl_seconds=ttl)
+        if self.db_enabled:
+            self._db_set(key, call_site, model, response)
+        self._count(call_site, "stores")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            sites = {site: dict(c) for site, c in self._counters.items()}
+        for c in sites.values():
+            hits = c.get("memory_hits", 0) + c.get("db_hits", 0)
+            total = hits + c.get("misses", 0)
+            c["hit_rate"] = round(hits / total, 4) if total else 0.0
+        return {
+            "enabled": self.enabled,
+            "sites": sorted(self.sites),
+            "memory_entries": len(self.memory),
+            "by_call_site": sites,
+        }
+
+    def _db_get(self, key: str) -> Optional[Tuple[str, Optional[datetime]]]:
+        """(응답, 만료 시각) 또는 None."""
+        from sqlmodel import Session
+        from app.models.db import get_engine
+        from app.models.llm_cache import LLMCacheEntry
+
+        try:
+            with Session(get_engine()) as db:
+                row = db.get(LLMCacheEntry, key)
+                if not row:
+                    return None
+                if row.expires_at and row.expires_at <= datetime.utcnow():
+                    db.delete(row)
+                    db.commit()
+                    return None
+                return row.response, row.expires_at
+        except Exception as e:
+            logger.warning("llm cache db read failed: %s", e)
+            return None
+
+    def _db_set(self, key: str, call_site: str, model: str, response: str) -> None:
+        from sqlmodel import Session
+        from app.models.db import get_engine
+        from app.models.llm_cache import LLMCacheEntry
+
+        expires_at = datetime.utcnow() + timedelta(seconds=self.ttl_seconds) if self.ttl_seconds > 0 else None
+        try:
+            with Session(get_engine()) as db:
+                db.merge(LLMCacheEntry(key=key, call_site=call_site, model=model, response=response, expires_at=expires_at))
+                db.commit()
+        except Exception as e:
+            logger.warning("llm cache db write failed: %s", e)
+
+
+@lru_cache
+def get_llm_cache() -> LLMResponseCache:
+    return LLMResponseCache()
+
+
+_PURGE_SQL = """
+DELETE FROM llm_cache
+WHERE key IN (
+  SELECT key FROM llm_cache WHERE expires_at < (NOW() AT TIME ZONE 'UTC') LIMIT :n
+)
+"""
+
+
+def purge_expired(batch_size: int = 5000) -> int:
+    """만료된 llm_cache 행 삭제(다시 조회되지 않는 키도 정리). 배치 단위로 짧게 끊어 잠금을 오래 잡지 않는다."""
+    from sqlalchemy import text
+    from app.models.db import get_engine
+
+    total = 0
+    try:
+        while True:
+            with get_engine().begin() as conn:
+                n = conn.execute(text(_PURGE_SQL), {"n": batch_size}).rowcount or 0
+            total += n
+            if n < batch_size:
+                break
+    except Exception as e:
+        logger.warning("llm cache purge failed: %s", e)
+    if total:
+        logger.info("purged %d expired llm cache rows", total)
+    return total
+
+
+@register_collector
+def _llm_cache_collector():
+    # 캐시를 아직 만들지 않은 프로세스는 노출할 값이 없음
+    if not get_llm_cache.cache_info().currsize:
+        return []
+    stats = get_llm_cache().stats()
+    events = [
+        ({"call_site": site, "event": name}, value)
+        for site, counters in stats["by_call_site"].items()
+        for name, value in counters.items()
+        if name != "hit_rate"
+    ]
+    return [
+        ("llm_cache_events_total", "counter", "LLM response cache lookups/stores by call site", events),
+        ("llm_cache_memory_entries", "gauge", "Entries in the in-process LLM cache", [({}, stats["memory_entries"])]),
+    ]
+
+
+__all__ = ["LLMResponseCache", "get_llm_cache", "make_cache_key", "purge_expired"]
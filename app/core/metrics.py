@@ -0,0 +1,219 @@
+"""핫 패스(LLM, 임베딩, 벡터 검색, 커넥션 풀, 큐, 그래프 노드)의 지연/크기 지표(prometheus_client).
+
+API는 GET /metrics, 워커는 METRICS_WORKER_PORT(0이면 비활성)에서 노출한다.
+값은 프로세스별이다. uvicorn 다중 워커면 PROMETHEUS_MULTIPROC_DIR(워커 기동 전 비워 둘 것)을 지정해
+/metrics가 모든 워커의 Counter/Histogram을 합쳐 응답하게 한다(이때 스크레이프 시점 수집기 값은 제외).
+
+로컬 확인(히스토그램 개수/평균/추정 p50·p95 요약)::
+
+    python -m app.core.metrics [--url http://localhost:8000/metrics] [--prefix llm_]
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import math
+import os
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest
+from prometheus_client import start_http_server as _start_http_server
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import Collector
+
+
+logger = logging.getLogger(__name__)
+
+# 초 단위 지연 버킷(임베딩/DB 대기 ms 수준 ~ LLM 수십 초)
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# 배치 크기/개수 버킷
+SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+# LLM 토큰 수 버킷
+TOKEN_BUCKETS = (16, 64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384, 32768)
+
+CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+# 스크레이프 시점에 값을 계산하는 함수: (이름, 타입, 설명, [(라벨, 값)]) 목록 반환
+CollectFn = Callable[[], Iterable[Tuple[str, str, str, Iterable[Tuple[Dict[str, str], float]]]]]
+
+_FAMILIES = {"gauge": GaugeMetricFamily, "counter": CounterMetricFamily}
+
+
+class FunctionCollector(Collector):
+    """이미 다른 곳(풀/캐시 통계 등)에 누적된 값을 스크레이프 시점에 지표 패밀리로 변환."""
+
+    def __init__(self, fn: CollectFn):
+        self.fn = fn
+
+    def describe(self):
+        # 등록 시 collect()가 호출되지 않도록(수집 함수가 엔진/캐시를 만들지 않게)
+        return []
+
+    def collect(self):
+        try:
+            families = list(self.fn())
+        except Exception as e:  # 수집 실패(예: DB 불가)가 전체 노출을 막지 않도록
+            logger.warning("metrics collector %s failed: %s", getattr(self.fn, "__name__", self.fn), e)
+            return
+        for name, kind, help, samples in families:
+            samples = list(samples)
+            labelnames = sorted({k for labels, _ in samples for k in labels})
+            family = _FAMILIES[kind](name, help, labels=labelnames)
+            for labels, value in samples:
+                family.add_metric([str(labels.get(k, "")) for k in labelnames], float(value))
+            yield family
+
+
+def register_collector(fn: CollectFn) -> CollectFn:
+    """기본 레지스트리에 수집 함수 등록. 데코레이터로도 사용 가능."""
+    REGISTRY.register(FunctionCollector(fn))
+    return fn
+
+
+def render() -> bytes:
+    """Prometheus 텍스트 노출 형식. 다중 프로세스 모드면 모든 워커의 값을 합친다."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest(REGISTRY)
+
+
+# ----- 핫 패스 지표 -----
+
+llm_upstream_seconds = Histogram(
+    "llm_upstream_seconds", "LLM API call latency (cache misses only)", ["call_site", "mode"], buckets=LATENCY_BUCKETS
+)
+llm_first_token_seconds = Histogram(
+    "llm_first_token_seconds", "Time to first streamed LLM chunk", ["call_site"], buckets=LATENCY_BUCKETS
+)
+llm_tokens = Histogram(
+    "llm_tokens", "Tokens per LLM call as reported by the API", ["call_site", "kind"], buckets=TOKEN_BUCKETS
+)
+llm_errors = Counter("llm_errors", "LLM API calls that raised", ["call_site", "mode"])
+
+embedding_seconds = Histogram(
+    "embedding_seconds", "Embedding call latency (upstream/model)", ["provider"], buckets=LATENCY_BUCKETS
+)
+embedding_batch_size = Histogram(
+    "embedding_batch_size", "Texts per embedding call", ["provider"], buckets=SIZE_BUCKETS
+)
+
+vector_query_seconds = Histogram(
+    "vector_query_seconds", "rag_embeddings top-k query latency", ["kind"], buckets=LATENCY_BUCKETS
+)
+
+db_pool_wait_seconds = Histogram(
+    "db_pool_wait_seconds", "Time waiting for a pooled DB connection", ["pool"], buckets=LATENCY_BUCKETS
+)
+
+job_wait_seconds = Histogram(
+    "job_wait_seconds", "Queue job age at dequeue (since scheduled_at or created_at)", ["type"], buckets=LATENCY_BUCKETS
+)
+job_duration_seconds = Histogram(
+    "job_duration_seconds", "Worker job handler duration", ["type", "outcome"], buckets=LATENCY_BUCKETS
+)
+
+graph_node_seconds = Histogram("graph_node_seconds", "Interview LangGraph node duration", ["node"], buckets=LATENCY_BUCKETS)
+
+
+# ----- 워커 노출 -----
+
+def start_http_server(port: int, host: str = "0.0.0.0") -> None:
+    """/metrics HTTP 서버를 데몬 스레드로 시작(워커처럼 웹 앱이 없는 프로세스용)."""
+    _start_http_server(port, addr=host)
+
+
+# ----- 로컬 요약 -----
+
+def _parse(text: str) -> Dict[str, Dict[Tuple[Tuple[str, str], ...], Dict[str, object]]]:
+    """히스토그램 시리즈만 {이름: {라벨: {buckets, sum, count}}}로 모은다."""
+    from prometheus_client.parser import text_string_to_metric_families
+
+    out: Dict[str, Dict[Tuple[Tuple[str, str], ...], Dict[str, object]]] = {}
+    for family in text_string_to_metric_families(text):
+        if family.type != "histogram":
+            continue
+        for sample in family.samples:
+            labels = dict(sample.labels)
+            le = labels.pop("le", None)
+            series = out.setdefault(family.name, {}).setdefault(tuple(sorted(labels.items())), {"buckets": []})
+            if sample.name.endswith("_bucket"):
+                series["buckets"].append((math.inf if le == "+Inf" else float(le), sample.value))
+            elif sample.name.endswith("_sum"):
+                series["sum"] = sample.value
+            elif sample.name.endswith("_count"):
+                series["count"] = sample.value
+    return out
+
+
+def _quantile(buckets: List[Tuple[float, float]], q: float) -> float:
+    """누적 버킷에서 선형 보간으로 분위수 추정(Prometheus histogram_quantile과 같은 방식)."""
+    buckets = sorted(buckets)
+    if not buckets or buckets[-1][1] == 0:
+        return float("nan")
+    rank = q * buckets[-1][1]
+    prev_bound, prev_count = 0.0, 0.0
+    for bound, count in buckets:
+        if count >= rank:
+            if bound == math.inf:
+                return prev_bound
+            if count == prev_count:
+                return bound
+            return prev_bound + (bound - prev_bound) * (rank - prev_count) / (count - prev_count)
+        prev_bound, prev_count = bound, count
+    return prev_bound
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    import urllib.request
+
+    parser = argparse.ArgumentParser(prog="python -m app.core.metrics")
+    parser.add_argument("--url", default="http://localhost:8000/metrics")
+    parser.add_argument("--prefix", default="", help="only histograms whose name starts with this")
+    args = parser.parse_args(argv)
+
+    with urllib.request.urlopen(args.url, timeout=10) as resp:
+        text = resp.read().decode("utf-8")
+    for name, series in sorted(_parse(text).items()):
+        if not name.startswith(args.prefix):
+            continue
+        for labels, s in sorted(series.items()):
+            count = s.get("count", 0) or 0
+            if not count:
+                continue
+            label_str = ",".join(f"{k}={v}" for k, v in labels)
+            print(
+                f"{name}{{{label_str}}} count={int(count)} avg={s.get('sum', 0) / count:.4g} "
+                f"p50~{_quantile(s['buckets'], 0.5):.4g} p95~{_quantile(s['buckets'], 0.95):.4g}"
+            )
+
+
+__all__ = [
+    "FunctionCollector",
+    "REGISTRY",
+    "CONTENT_TYPE",
+    "LATENCY_BUCKETS",
+    "SIZE_BUCKETS",
+    "TOKEN_BUCKETS",
+    "register_collector",
+    "render",
+    "start_http_server",
+    "llm_upstream_seconds",
+    "llm_first_token_seconds",
+    "llm_tokens",
+    "llm_errors",
+    "embedding_seconds",
+    "embedding_batch_size",
+    "vector_query_seconds",
+    "db_pool_wait_seconds",
+    "job_wait_seconds",
+    "job_duration_seconds",
+    "graph_node_seconds",
+]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""int8 양자화 ONNX 임베딩 백엔드(CPU 전용 노드용).
+
+PyTorch/SentenceTransformer 스택 없이 onnxruntime + tokenizers만으로 추론한다.
+모델은 1회 내보내기(export)가 필요하다(내보내기에만 torch/sentence-transformers 필요)::
+
+    python -m app.core.onnx_embeddings export [--model sentence-transformers/all-MiniLM-L6-v2] [--out data/onnx/...]
+
+내보낸 디렉터리 구성: model.onnx(int8), tokenizer.json, embedding_meta.json(pooling/max_seq_length).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.core.config import get_settings
+from app.core.embeddings import EmbeddingService
+
+
+MODEL_FILE = "model.onnx"
+TOKENIZER_FILE = "tokenizer.json"
+META_FILE = "embedding_meta.json"
+
+
+def default_onnx_dir(model_name: str) -> str:
+    settings = get_settings()
+    if settings.embedding_onnx_dir:
+        return settings.embedding_onnx_dir
+    return os.path.join("data", "onnx", model_name.replace("/", "__"))
+
+
+class OnnxEmbeddingService(EmbeddingService):
+    """SentenceTransformer와 동일한 풀링(mean/cls) + L2 정규화를 numpy로 수행."""
+
+    provider = "onnx"
+
+    def __init__(self, model_name: str, model_dir: Optional[str] = None, threads: int = 0, batch_size: int = 32):
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        self.model_name = model_name
+        self.model_dir = model_dir or default_onnx_dir(model_name)
+        model_path = os.path.join(self.model_dir, MODEL_FILE)
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(
+                f"{model_path} not found; run `python -m app.core.onnx_embeddings export --model {model_name}`"
+            )
+        with open(os.path.join(self.model_dir, META_FILE), encoding="utf-8") as f:
+            meta: Dict[str, Any] = json.load(f)
+        self.pooling = meta.get("pooling", "mean")
+        self.max_length = int(meta.get("max_seq_length", 256))
+        self.batch_size = max(1, batch_size)
+
+        opts = ort.SessionOptions()
+        opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if threads > 0:
+            opts.intra_op_num_threads = threads
+        opts.inter_op_num_threads = 1
+        self.session = ort.InferenceSession(model_path, sess_options=opts, providers=["CPUExecutionProvider"])
+        self._input_names = {i.name for i in self.session.get_inputs()}
+
+        self.tokenizer = Tokenizer.from_file(os.path.join(self.model_dir, TOKENIZER_FILE))
+        self.tokenizer.enable_truncation(max_length=self.max_length)
+        self.tokenizer.enable_padding()
+
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        encs = self.tokenizer.encode_batch(texts)
+        ids = np.asarray([e.ids for e in encs], dtype=np.int64)
+        mask = np.asarray([e.attention_mask for e in encs], dtype=np.int64)
+        feeds = {"input_ids": ids, "attention_mask": mask}
+        if "token_type_ids" in self._input_names:
+            feeds["token_type_ids"] = np.asarray([e.type_ids for e in encs], dtype=np.int64)
+        hidden = self.session.run(None, feeds)[0]  # (batch, seq, dim)
+        if self.pooling == "cls":
+            pooled = hidden[:, 0]
+        else:
+            m = mask[..., None].astype(hidden.dtype)
+            pooled = (hidden * m).sum(axis=1) / np.clip(m.sum(axis=1), 1e-9, None)
+        return pooled / np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+
+    def _embed_texts(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        # 길이순으로 묶어 패딩 낭비를 줄이고 원래 순서로 되돌림
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        out: List[Optional[np.ndarray]] = [None] * len(texts)
+        for start in range(0, len(order), self.batch_size):
+            idx = order[start:start + self.batch_size]
+            embs = self._encode_batch([texts[i] for i in idx])
+            for i, e in zip(idx, embs):
+                out[i] = e
+        return np.stack(out).astype(np.float32).tolist()
+
+
+def export_quantized(model_name: str, out_dir: str, opset: int = 17) -> str:
+    """SentenceTransformer 모델을 ONNX로 내보낸 뒤 가중치를 int8 동적 양자화."""
+    import torch
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from sentence_transformers import SentenceTransformer
+
+    os.makedirs(out_dir, exist_ok=True)
+    st = SentenceTransformer(model_name, device="cpu")
+    transformer = st[0]
+    hf_model = transformer.auto_model.eval()
+    tokenizer = transformer.tokenizer
+    pooling = "mean"
+    if len(st) > 1 and hasattr(st[1], "get_pooling_mode_str"):
+        pooling = "cls" if st[1].get_pooling_mode_str() == "cls" else "mean"
+
+    sample = tokenizer(["export sample"], return_tensors="pt")
+    input_names = [n for n in ("input_ids", "attention_mask", "token_type_ids") if n in sample]
+    dynamic = {n: {0: "batch", 1: "seq"} for n in input_names}
+    dynamic["last_hidden_state"] = {0: "batch", 1: "seq"}
+    fp32_path = os.path.join(out_dir, "model.fp32.onnx")
+    with torch.no_grad():
+        torch.onnx.export(
+            hf_model,
+            tuple(sample[n] for n in input_names),
+            fp32_path,
+            input_names=input_names,
+            output_names=["last_hidden_state"],
+            dynamic_axes=dynamic,
+            opset_version=opset,
+        )
+    quantize_dynamic(fp32_path, os.path.join(out_dir, MODEL_FILE), weight_type=QuantType.QInt8)
+    os.remove(fp32_path)
+
+    tokenizer.backend_tokenizer.save(os.path.join(out_dir, TOKENIZER_FILE))
+    with open(os.path.join(out_dir, META_FILE), "w", encoding="utf-8") as f:
+        json.dump({"model_name": model_name, "pooling": pooling, "max_seq_length": int(st.max_seq_length or 256)}, f)
+    return out_dir
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.core.onnx_embeddings")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("export", help="export + int8-quantize the configured SBERT model")
+    p.add_argument("--model", default=None)
+    p.add_argument("--out", default=None)
+    args = parser.parse_args(argv)
+    model_name = args.model or get_settings().embedding_model or "sentence-transformers/all-MiniLM-L6-v2"
+    print(export_quantized(model_name, args.out or default_onnx_dir(model_name)))
+
+
+__all__ = ["OnnxEmbeddingService", "export_quantized", "default_onnx_dir"]
+
+
+if __name__ == "__main__":
+    main()
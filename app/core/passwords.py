@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any
+
+from app.core.config import get_settings
+
+
+@lru_cache
+def get_pwd_context() -> Any:
+    # passlib은 첫 사용 시 로드(임포트 비용 절감)
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=get_settings().bcrypt_rounds)
+
+
+@lru_cache
+def _hash_pool() -> ThreadPoolExecutor:
+    # bcrypt 연산은 GIL을 놓으므로 스레드로 병렬화 가능. 풀 크기로 로그인 폭주 시 CPU 사용량을 제한한다.
+    return ThreadPoolExecutor(max_workers=get_settings().password_hash_workers, thread_name_prefix="bcrypt")
+
+
+def hash_password(password: str) -> str:
+    return get_pwd_context().hash(password)
+
+
+def verify_password(password: str, hashed: str) -> bool:
+    return get_pwd_context().verify(password, hashed)
+
+
+async def hash_password_async(password: str) -> str:
+    """이벤트 루프를 막지 않도록 전용 풀에서 해시."""
+    return await asyncio.get_running_loop().run_in_executor(_hash_pool(), hash_password, password)
+
+
+async def verify_password_async(password: str, hashed: str) -> bool:
+    return await asyncio.get_running_loop().run_in_executor(_hash_pool(), verify_password, password, hashed)
+
+
+__all__ = ["get_pwd_context", "hash_password", "verify_password", "hash_password_async", "verify_password_async"]
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
+
+from app.core.metrics import register_collector
+
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("event", "result", "error", "waiters")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """동일 키의 동시 호출을 하나의 업스트림 호출로 합친다(프로세스 내).
+
+    먼저 도착한 호출(leader)만 fn을 실행하고, 실행 중 들어온 같은 키의 호출은
+    완료를 기다렸다가 같은 결과(또는 같은 예외)를 돌려받는다. 완료 후에는 키를
+    비우므로 결과를 보관하지 않는다(보관은 응답 캐시의 역할).
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._executed = 0
+        self._coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self._executed += 1
+            else:
+                call.waiters += 1
+                self._coalesced += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"executed": self._executed, "coalesced": self._coalesced, "in_flight": len(self._calls)}
+
+
+llm_flight = SingleFlight("llm")
+embedding_flight = SingleFlight("embedding")
+
+
+@register_collector
+def _singleflight_collector():
+    stats = [(f.name, f.stats()) for f in (llm_flight, embedding_flight)]
+    return [
+        ("singleflight_executed_total", "counter", "Upstream calls made by single-flight leaders", [({"flight": n}, s["executed"]) for n, s in stats]),
+        ("singleflight_coalesced_total", "counter", "Calls that waited on an in-flight leader", [({"flight": n}, s["coalesced"]) for n, s in stats]),
+        ("singleflight_in_flight", "gauge", "Keys currently in flight", [({"flight": n}, s["in_flight"]) for n, s in stats]),
+    ]
+
+
+__all__ = ["SingleFlight", "llm_flight", "embedding_flight"]
@@ -2,61 +2,103 @@ from __future__ import annotations
 
 from typing import List, Dict, Any
 import uuid
-import os
 
 from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlmodel import Session
 
 from app.core.config import get_settings
-from app.core.embeddings import get_embedding_service
-from app.models.db import engine
-from app.models.vector_entities import RAGEmbedding
+from app.core.embedding_spaces import Space, active_space, invalidate_spaces, load_spaces, write_spaces
+from app.core.embeddings import EmbeddingService
+from app.core.metrics import vector_query_seconds
+from app.models.db import get_engine
+from app.models.vector_entities import SHARED_TENANT, RAGEmbedding
 
 
 class VectorStore:
-    def __init__(self, collection_name: str = "kb_default"):
+    """임베딩 공간(app.core.embedding_spaces) 단위 벡터 저장소.
+
+    검색은 active 공간에서, 기록은 active + building(재임베딩 중) 공간 모두에 한다.
+    tenant_id(사용자)를 주면 그 테넌트 파티션만 읽고 쓴다. None이면 기록은 공유 테넌트,
+    검색은 전체 파티션 대상(레거시 동작).
+    """
+
+    def __init__(self, collection_name: str = "kb_default", tenant_id: str | None = None):
         self.collection = collection_name
-        self.embeddings = get_embedding_service()
-        # Ensure pgvector extension exists when using Postgres
-        # Always ensure pgvector extension exists
-        with engine.connect() as conn:
-            conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
-            conn.commit()
-
-    def upsert(self, documents: List[str], metadatas: List[Dict[str, Any]], ids: List[str] | None = None) -> List[str]:
+        self.tenant_id = tenant_id
+
+    @property
+    def embeddings(self) -> EmbeddingService:
+        return active_space().service
+
+    @property
+    def write_tenant(self) -> str:
+        return self.tenant_id or SHARED_TENANT
+
+    def existing_ids(self, ids: List[str], space_id: int | None = None) -> set:
+        if not ids:
+            return set()
+        space_id = active_space().id if space_id is None else space_id
+        with get_engine().connect() as conn:
+            rows = conn.execute(
+                text("SELECT id FROM rag_embeddings WHERE tenant_id = :t AND space_id = :s AND id = ANY(:ids)"),
+                {"t": self.write_tenant, "s": space_id, "ids": list(ids)},
+            ).fetchall()
+        return {r[0] for r in rows}
+
+    def upsert(
+        self,
+        documents: List[str],
+        metadatas: List[Dict[str, Any]],
+        ids: List[str] | None = None,
+        skip_existing: bool = False,
+    ) -> List[str]:
+        """skip_existing=True면 이미 저장된 id(내용 주소 기반 id)는 임베딩을 다시 계산하지 않는다."""
         if ids is None:
             ids = [str(uuid.uuid4()) for _ in documents]
-        vectors = self.embeddings.embed_texts(documents)
-
-        # Use ORM style upsert (get or create then update)
-        with Session(engine) as db:
-            for i, doc in enumerate(documents):
-                rid = ids[i]
-                row = db.get(RAGEmbedding, rid)
-                if not row:
-                    row = RAGEmbedding(id=rid, collection=self.collection)
-                row.document = doc
-                row.meta = metadatas[i] if isinstance(metadatas[i], dict) else {}
-                row.embedding = vectors[i]
-                db.add(row)
-            db.commit()
+        for space in write_spaces():
+            self._upsert_space(space, documents, metadatas, ids, skip_existing)
         return ids
 
-    def query(self, query_text: str, n_results: int = 5) -> Dict[str, Any]:
-        q_emb = self.embeddings.embed_texts([query_text])[0]
-        # Use textual vector literal casting for reliability
-        qv_str = "[" + ",".join(str(float(x)) for x in q_emb) + "]"
-        sql = text(
-            """
-            SELECT id, document, meta, 1 - (embedding <=> (:qv)::vector) AS score
-            FROM rag_embeddings
-            WHERE collection = :collection
-            ORDER BY embedding <=> (:qv)::vector
-            LIMIT :k
-            """
-        )
-        with engine.connect() as conn:
-            res = conn.execute(sql, {"qv": qv_str, "collection": self.collection, "k": n_results}).fetchall()
+    def _upsert_space(self, space: Space, documents, metadatas, ids, skip_existing: bool) -> None:
+        if skip_existing:
+            present = self.existing_ids(ids, space.id)
+            keep = [i for i, rid in enumerate(ids) if rid not in present]
+            if not keep:
+                return
+            documents = [documents[i] for i in keep]
+            metadatas = [metadatas[i] for i in keep]
+            ids = [ids[i] for i in keep]
+        vectors = space.service.embed_texts(documents)
+        if not vectors:
+            return
+        with get_engine().begin() as conn:
+            write_vectors(conn, space, [
+                {"tenant_id": self.write_tenant, "id": rid, "collection": self.collection, "document": doc,
+                 "meta": meta if isinstance(meta, dict) else {}, "embedding": vec}
+                for rid, doc, meta, vec in zip(ids, documents, metadatas, vectors)
+            ])
+
+    def query(self, query_text: str, n_results: int = 5, content_hashes: List[str] | None = None) -> Dict[str, Any]:
+        """content_hashes를 주면 공유 테넌트의 해당 공고 섹션도 함께 검색해 점수순으로 합친다."""
+        space = active_space()
+        q_emb = space.service.embed_texts([query_text])[0]
+        return self.query_vector(q_emb, n_results, space=space, content_hashes=content_hashes)
+
+    def query_vector(
+        self,
+        q_emb: List[float],
+        n_results: int = 5,
+        mode: str | None = None,
+        space: Space | None = None,
+        content_hashes: List[str] | None = None,
+    ) -> Dict[str, Any]:
+        space = space or active_space()
+        with get_engine().connect() as conn:
+            res = search_vectors(conn, q_emb, self.collection, n_results, mode, space_id=space.id, tenant_id=self.tenant_id)
+            if content_hashes:
+                res = list(res) + list(search_shared(conn, q_emb, content_hashes, n_results, space.id))
+                res = sorted(res, key=lambda r: r[3], reverse=True)[:n_results]
         return {
             "ids": [[r[0] for r in res]],
             "documents": [[r[1] for r in res]],
@@ -64,3 +106,235 @@ class VectorStore:
             "distances": [[1 - r[3] for r in res]],
         }
 
+
+def write_vectors(conn, space: Space, rows: List[Dict[str, Any]], overwrite: bool = True) -> None:
+    """공간에 벡터 행 기록. 첫 기록 시 공간의 저장 차원을 확정한다(active면 인덱스도 생성).
+    overwrite=False(재임베딩 배치)는 이중 기록으로 이미 들어온 최신 행을 덮어쓰지 않는다."""
+    dim = len(rows[0]["embedding"])
+    if space.dim is None:
+        conn.execute(
+            text("UPDATE embedding_space SET dim = :d WHERE id = :id AND dim IS NULL"),
+            {"d": dim, "id": space.id},
+        )
+        if space.status == "active":
+            ensure_vector_index(conn, space.id, dim)
+        invalidate_spaces()
+    elif space.dim != dim:
+        raise ValueError(f"embedding space {space.id} stores {space.dim}-d vectors, got {dim}")
+    stmt = pg_insert(RAGEmbedding.__table__).values([{**r, "space_id": space.id} for r in rows])
+    if overwrite:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["tenant_id", "space_id", "id"],
+            set_={c: stmt.excluded[c] for c in ("collection", "document", "meta", "embedding")},
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=["tenant_id", "space_id", "id"])
+    conn.execute(stmt)
+
+
+# 저장 모드별 HNSW (인덱스 표현식, 연산자 클래스). {d}는 공간의 저장 차원.
+# 힙에는 항상 full 정밀도 벡터를 두고(binary 재정렬용) 인덱스만 halfvec/bit로 양자화한다.
+# 컬럼이 차원 없는 vector이므로 인덱스는 공간별 부분 인덱스(WHERE space_id = n)
+_MODE_INDEX = {
+    "full": ("(embedding::vector({d}))", "vector_cosine_ops"),
+    "half": ("(embedding::halfvec({d}))", "halfvec_cosine_ops"),
+    "binary": ("(binary_quantize(embedding)::bit({d}))", "bit_hamming_ops"),
+}
+
+VECTOR_STORAGE_MODES = tuple(_MODE_INDEX)
+
+
+def _query_sql(mode: str, dim: int, space_id: int, tenant: bool = False) -> str:
+    """표현식/부분 인덱스를 타도록 ORDER BY와 space_id 조건을 인덱스 정의와 동일한 리터럴로 작성.
+    tenant=True면 :tenant 조건을 더해 해당 해시 파티션만 스캔(파티션 프루닝)."""
+    space_id = int(space_id)
+    where = f"space_id = {space_id} AND collection = :collection" + (" AND tenant_id = :tenant" if tenant else "")
+    if mode == "half":
+        return f"""
+            SELECT id, document, meta, 1 - (embedding::halfvec({dim}) <=> (:qv)::halfvec({dim})) AS score
+            FROM rag_embeddings
+            WHERE {where}
+            ORDER BY embedding::halfvec({dim}) <=> (:qv)::halfvec({dim})
+            LIMIT :k
+        """
+    if mode == "binary":
+        # 해밍 거리로 후보를 넉넉히 뽑은 뒤 원본(full) 벡터 코사인으로 재정렬
+        return f"""
+            SELECT id, document, meta, 1 - (embedding <=> (:qv)::vector) AS score
+            FROM (
+                SELECT id, document, meta, embedding
+                FROM rag_embeddings
+                WHERE {where}
+                ORDER BY binary_quantize(embedding)::bit({dim}) <~> binary_quantize((:qv)::vector)
+                LIMIT :cand
+            ) c
+            ORDER BY embedding <=> (:qv)::vector
+            LIMIT :k
+        """
+    return f"""
+            SELECT id, document, meta, 1 - (embedding::vector({dim}) <=> (:qv)::vector({dim})) AS score
+            FROM rag_embeddings
+            WHERE {where}
+            ORDER BY embedding::vector({dim}) <=> (:qv)::vector({dim})
+            LIMIT :k
+        """
+
+
+def _vector_literal(q_emb: List[float]) -> str:
+    # Use textual vector literal casting for reliability
+    return "[" + ",".join(str(float(x)) for x in q_emb) + "]"
+
+
+# 테넌트 단위 정확 검색: PK (tenant_id, space_id, id) 접두사로 한 테넌트의 행만 읽어 거리 계산.
+# 비용이 전체 코퍼스가 아니라 그 사용자의 문서 수에 비례하고 recall 손실이 없다.
+_TENANT_EXACT_SQL = """
+    SELECT id, document, meta, 1 - (embedding <=> (:qv)::vector) AS score
+    FROM rag_embeddings
+    WHERE tenant_id = :tenant AND space_id = :space AND collection = :collection
+    ORDER BY embedding <=> (:qv)::vector
+    LIMIT :k
+"""
+
+# 공유 테넌트(공고 본문)는 세션의 공고 content_hash로 좁혀 정확 검색(content_hash 표현식 인덱스)
+_SHARED_EXACT_SQL = f"""
+    SELECT id, document, meta, 1 - (embedding <=> (:qv)::vector) AS score
+    FROM rag_embeddings
+    WHERE tenant_id = '{SHARED_TENANT}' AND space_id = :space
+      AND meta->>'content_hash' = ANY(CAST(:hashes AS text[]))
+    ORDER BY embedding <=> (:qv)::vector
+    LIMIT :k
+"""
+
+
+def search_vectors(
+    conn,
+    q_emb: List[float],
+    collection: str,
+    k: int,
+    mode: str | None = None,
+    space_id: int | None = None,
+    tenant_id: str | None = None,
+) -> list:
+    """저장 모드에 맞는 인덱스로 top-k (id, document, meta, score) 행을 반환.
+    tenant_id가 있으면 그 테넌트 파티션만 검색(VECTOR_TENANT_SEARCH=exact|ann)."""
+    settings = get_settings()
+    mode = mode or settings.vector_storage_mode
+    space_id = active_space().id if space_id is None else space_id
+    qv_str = _vector_literal(q_emb)
+    if tenant_id is not None and settings.vector_tenant_search == "exact":
+        with vector_query_seconds.labels(kind="tenant_exact").time():
+            return conn.execute(
+                text(_TENANT_EXACT_SQL),
+                {"qv": qv_str, "tenant": tenant_id, "space": int(space_id), "collection": collection, "k": k},
+            ).fetchall()
+    candidates = k * max(1, settings.vector_rerank_factor) if mode == "binary" else k
+    # HNSW는 ef_search개까지만 반환하므로 후보 수 이상으로 맞춤(트랜잭션 범위)
+    conn.execute(
+        text("SELECT set_config('hnsw.ef_search', :ef, true)"),
+        {"ef": str(max(settings.vector_ef_search, candidates))},
+    )
+    with vector_query_seconds.labels(kind=f"{'tenant' if tenant_id is not None else 'global'}_ann_{mode}").time():
+        return conn.execute(
+            text(_query_sql(mode, len(q_emb), space_id, tenant=tenant_id is not None)),
+            {"qv": qv_str, "collection": collection, "k": k, "cand": candidates, "tenant": tenant_id},
+        ).fetchall()
+
+
+def search_shared(conn, q_emb: List[float], content_hashes: List[str], k: int, space_id: int | None = None) -> list:
+    """공유 테넌트에서 주어진 공고(content_hash)의 섹션만 top-k 검색."""
+    space_id = active_space().id if space_id is None else space_id
+    with vector_query_seconds.labels(kind="shared_exact").time():
+        return conn.execute(
+            text(_SHARED_EXACT_SQL),
+            {"qv": _vector_literal(q_emb), "space": int(space_id), "hashes": [str(h) for h in content_hashes], "k": k},
+        ).fetchall()
+
+
+def vector_index_name(mode: str, space_id: int) -> str:
+    return f"ix_rag_embeddings_hnsw_{mode}_s{int(space_id)}"
+
+
+def vector_partitions(conn) -> List[str]:
+    """rag_embeddings의 해시 파티션 이름 목록(파티션 테이블이 아니면 빈 목록)."""
+    return list(conn.execute(text(
+        """
+        SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = to_regclass('rag_embeddings') ORDER BY c.relname
+        """
+    )).scalars().all())
+
+
+def ensure_vector_index(
+    conn, space_id: int, dim: int, mode: str | None = None, drop_others: bool = True, concurrently: bool = False
+) -> str:
+    """공간의 저장 모드 HNSW 부분 인덱스를 만들고(없을 때만) 같은 공간의 다른 모드 인덱스는 제거한다.
+    concurrently=True는 AUTOCOMMIT 커넥션에서만 호출(재임베딩 중 쓰기를 막지 않음).
+
+    파티션 테이블이면 부모에는 ON ONLY 인덱스만 만들고 파티션별로 인덱스를 만들어 ATTACH 한다
+    (파티션 테이블은 CONCURRENTLY 불가, 파티션마다는 가능. 모든 파티션이 붙으면 부모 인덱스가 유효해짐).
+    """
+    settings = get_settings()
+    mode = mode or settings.vector_storage_mode
+    if mode not in _MODE_INDEX:
+        raise ValueError(f"unknown vector_storage_mode: {mode}")
+    expr, opclass = _MODE_INDEX[mode]
+    name = vector_index_name(mode, space_id)
+    spec = (
+        f"USING hnsw ({expr.format(d=int(dim))} {opclass}) "
+        f"WITH (m = {int(settings.vector_hnsw_m)}, ef_construction = {int(settings.vector_hnsw_ef_construction)}) "
+        f"WHERE space_id = {int(space_id)}"
+    )
+    concurrent = "CONCURRENTLY " if concurrently else ""
+    partitions = vector_partitions(conn)
+    if not partitions:
+        conn.execute(text(f"CREATE INDEX {concurrent}IF NOT EXISTS {name} ON rag_embeddings {spec}"))
+    elif not conn.execute(
+        text("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:n)"), {"n": name}
+    ).scalar():
+        conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON ONLY rag_embeddings {spec}"))
+        for part in partitions:
+            child = f"{name}_{part.rsplit('_', 1)[-1]}"
+            conn.execute(text(f"CREATE INDEX {concurrent}IF NOT EXISTS {child} ON {part} {spec}"))
+            conn.execute(text(f"ALTER INDEX {name} ATTACH PARTITION {child}"))
+    if drop_others:
+        for m in _MODE_INDEX:
+            if m != mode:
+                conn.execute(text(f"DROP INDEX IF EXISTS {vector_index_name(m, space_id)}"))
+    return name
+
+
+def ensure_active_vector_index(conn, mode: str | None = None) -> str | None:
+    """active 공간의 인덱스를 현재 VECTOR_STORAGE_MODE로 맞춘다(모드 변경 후 재적용용)."""
+    active, _ = load_spaces(conn)
+    if active is None or active.dim is None:
+        return None
+    return ensure_vector_index(conn, active.id, active.dim, mode)
+
+
+def drop_space_indexes(conn, space_id: int) -> None:
+    for m in _MODE_INDEX:
+        conn.execute(text(f"DROP INDEX IF EXISTS {vector_index_name(m, space_id)}"))
+
+
+def delete_by_meta(db: Session, key: str, values: List[Any], tenant_id: str | None = None) -> int:
+    """meta[key]가 values 중 하나인 벡터 행을 한 번의 DELETE로 제거(원본 삭제 시 고아 방지). 모든 임베딩 공간 대상.
+
+    tenant_id를 주면 그 테넌트 파티션만 본다(경험/공고처럼 소유자가 정해진 원본). 생략은 소유자가 없는
+    공유 본문(content_hash) 정리용이며 모든 파티션을 훑는다.
+    호출 측 트랜잭션 안에서 실행되며 커밋은 호출 측이 담당한다.
+    """
+    if not values:
+        return 0
+    if not key.isidentifier():
+        raise ValueError(f"invalid meta key: {key}")
+    params: Dict[str, Any] = {"vals": [str(v) for v in values]}
+    tenant_clause = ""
+    if tenant_id is not None:
+        tenant_clause = " AND tenant_id = :t"
+        params["t"] = tenant_id
+    # 키를 리터럴로 넣어야 (meta->>'<key>') 표현식 인덱스를 탄다
+    res = db.execute(
+        text(f"DELETE FROM rag_embeddings WHERE meta->>'{key}' = ANY(CAST(:vals AS text[])){tenant_clause}"),
+        params,
+    )
+    return res.rowcount or 0
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import get_settings
+
+
+logger = logging.getLogger(__name__)
+
+
+class WarmupState:
+    """워밍업 단계별 상태. /health/ready 에서 조회."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.steps: Dict[str, Dict[str, Any]] = {}
+
+    def begin(self, names: List[str]) -> None:
+        with self._lock:
+            self.started_at = time.time()
+            self.finished_at = None
+            self.steps = {n: {"status": "pending"} for n in names}
+
+    def record(self, name: str, status: str, seconds: float, error: Optional[str] = None) -> None:
+        with self._lock:
+            self.steps[name] = {"status": status, "seconds": round(seconds, 3), **({"error": error} if error else {})}
+
+    def finish(self) -> None:
+        with self._lock:
+            self.finished_at = time.time()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            # DB는 필수, 나머지는 실패해도 첫 요청에서 지연 로드되므로 준비 상태를 막지 않음
+            db_ok = self.steps.get("db", {}).get("status") == "ok"
+            return {
+                "ready": self.finished_at is not None and db_ok,
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+                "steps": {k: dict(v) for k, v in self.steps.items()},
+            }
+
+
+warmup_state = WarmupState()
+
+
+def _warm_db() -> None:
+    from app.models.db import get_engine
+    from sqlalchemy import text
+
+    # 풀에 커넥션을 미리 채워 첫 요청의 연결 수립 비용 제거
+    engine = get_engine()
+    conns = [engine.connect() for _ in range(max(1, get_settings().warmup_db_connections))]
+    try:
+        for c in conns:
+            c.execute(text("SELECT 1"))
+    finally:
+        for c in conns:
+            c.close()
+
+
+async def _warm_async_db() -> None:
+    from app.models.db import get_async_engine
+    from sqlalchemy import text
+
+    async with get_async_engine().connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+def _warm_embeddings() -> None:
+    from app.core.embedding_spaces import active_space
+    from app.core.embeddings import OpenAIEmbeddingService
+
+    # 검색 질의는 active 공간의 모델로 임베딩
+    svc = active_space().service
+    # 로컬 모델은 첫 encode에서 커널/가중치가 올라오므로 한 번 실행(원격 API는 호출하지 않음)
+    if not isinstance(svc, OpenAIEmbeddingService):
+        svc._embed_texts(["warmup"])
+
+
+def _warm_graph() -> None:
+    from app.services.graph import get_interview_graph
+
+    get_interview_graph()
+
+
+def _warm_llm() -> None:
+    from app.core.llm import get_llm
+
+    if get_settings().openai_api_key:
+        get_llm()
+
+
+def _warm_tokenizer() -> None:
+    from app.services.prompt_budget import count_tokens
+
+    count_tokens("warmup")
+
+
+_STEPS: Tuple[Tuple[str, Callable[[], None]], ...] = (
+    ("db", _warm_db),
+    ("embeddings", _warm_embeddings),
+    ("graph", _warm_graph),
+    ("llm", _warm_llm),
+    ("tokenizer", _warm_tokenizer),
+)
+
+
+def _run_step(name: str, fn: Callable[[], None]) -> None:
+    start = time.perf_counter()
+    try:
+        fn()
+        warmup_state.record(name, "ok", time.perf_counter() - start)
+    except Exception as e:
+        logger.warning("warmup step %s failed: %s", name, e)
+        warmup_state.record(name, "error", time.perf_counter() - start, str(e))
+
+
+def run_warmup_sync(steps: Optional[List[str]] = None) -> Dict[str, Any]:
+    """워커 등 동기 프로세스용."""
+    selected = [(n, f) for n, f in _STEPS if steps is None or n in steps]
+    warmup_state.begin([n for n, _ in selected])
+    for name, fn in selected:
+        _run_step(name, fn)
+    warmup_state.finish()
+    return warmup_state.snapshot()
+
+
+async def run_warmup() -> Dict[str, Any]:
+    """API lifespan에서 백그라운드 태스크로 실행. 무거운 단계는 스레드에서 병렬로."""
+    warmup_state.begin([n for n, _ in _STEPS] + ["async_db"])
+    start = time.perf_counter()
+    try:
+        await _warm_async_db()
+        warmup_state.record("async_db", "ok", time.perf_counter() - start)
+    except Exception as e:
+        logger.warning("warmup step async_db failed: %s", e)
+        warmup_state.record("async_db", "error", time.perf_counter() - start, str(e))
+    await asyncio.gather(*(asyncio.to_thread(_run_step, n, f) for n, f in _STEPS))
+    warmup_state.finish()
+    return warmup_state.snapshot()
+
+
+__all__ = ["WarmupState", "warmup_state", "run_warmup", "run_warmup_sync"]
@@ -0,0 +1,179 @@
+"""로컬 임베딩 서버.
+
+SBERT 모델(또는 int8 ONNX, EMBEDDING_SERVER_BACKEND=onnx)을 프로세스 1곳에만 올리고 API/워커 프로세스들의 요청을 소켓으로 받아
+짧은 대기 창(embedding_server_max_wait_ms) 동안 모아 한 번에 encode 한다(dynamic batching).
+클라이언트는 EMBEDDING_PROVIDER=server (app.core.embeddings.RemoteEmbeddingService).
+
+    python -m app.embedding_server.main [--listen tcp://0.0.0.0:7997]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import numpy as np
+
+from app.core.config import get_settings
+from app.embedding_server.protocol import encode_bytes, encode_json, parse_address, read_frame
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Pending:
+    texts: List[str]
+    future: asyncio.Future = field(repr=False)
+
+
+class EmbeddingBatcher:
+    """요청 큐에서 최대 max_batch 텍스트 또는 max_wait 동안 모아 모델을 한 번 호출."""
+
+    def __init__(self, service, dim: int, max_batch: int, max_wait_ms: float):
+        self.service = service
+        self.dim = dim
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self._queue: "asyncio.Queue[_Pending]" = asyncio.Queue()
+        # 모델 호출은 전용 스레드 1개에서 직렬 실행(이벤트 루프는 수신/배치 구성만)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embed")
+        self.batches = 0
+        self.texts = 0
+
+    async def embed(self, texts: List[str]) -> np.ndarray:
+        fut = asyncio.get_running_loop().create_future()
+        await self._queue.put(_Pending(texts, fut))
+        return await fut
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            size = len(batch[0].texts)
+            deadline = loop.time() + self.max_wait
+            while size < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                batch.append(item)
+                size += len(item.texts)
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[_Pending]) -> None:
+        texts = [t for p in batch for t in p.texts]
+        start = time.perf_counter()
+        try:
+            embs = await asyncio.get_running_loop().run_in_executor(self._executor, self.service._embed_texts, texts)
+            matrix = np.asarray(embs, dtype="<f4")
+        except Exception as e:
+            for p in batch:
+                if not p.future.done():
+                    p.future.set_exception(e)
+            return
+        self.batches += 1
+        self.texts += len(texts)
+        logger.debug("batch requests=%d texts=%d %.1fms", len(batch), len(texts), 1000 * (time.perf_counter() - start))
+        offset = 0
+        for p in batch:
+            n = len(p.texts)
+            if not p.future.done():
+                p.future.set_result(matrix[offset:offset + n])
+            offset += n
+
+
+async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, batcher: EmbeddingBatcher) -> None:
+    try:
+        while True:
+            try:
+                req = json.loads(await read_frame(reader))
+            except asyncio.IncompleteReadError:
+                break
+            op = req.get("op", "embed")
+            try:
+                if op == "info":
+                    writer.write(encode_json({
+                        "ok": True, "model": batcher.service.model_name, "dim": batcher.dim,
+                        "batches": batcher.batches, "texts": batcher.texts,
+                    }))
+                elif op == "embed" and req.get("model") not in (None, batcher.service.model_name):
+                    # 다른 모델을 기대하는 클라이언트에 이 서버의 벡터를 돌려주지 않음
+                    writer.write(encode_json({
+                        "ok": False, "code": "model_mismatch",
+                        "error": f"server model is {batcher.service.model_name!r}, request expects {req.get('model')!r}",
+                    }))
+                elif op == "embed":
+                    texts = [str(t) for t in req.get("texts") or []]
+                    matrix = await batcher.embed(texts) if texts else np.zeros((0, 0), dtype="<f4")
+                    dim = int(matrix.shape[1]) if matrix.ndim == 2 and len(matrix) else 0
+                    writer.write(encode_json({"ok": True, "n": len(texts), "dim": dim}))
+                    writer.write(encode_bytes(matrix.tobytes()))
+                else:
+                    writer.write(encode_json({"ok": False, "error": f"unknown op: {op}"}))
+            except Exception as e:
+                writer.write(encode_json({"ok": False, "error": str(e)}))
+            await writer.drain()
+    except (ConnectionError, ValueError) as e:
+        logger.info("client dropped: %s", e)
+    finally:
+        writer.close()
+
+
+def _load_service():
+    settings = get_settings()
+    model_name = settings.embedding_model or "sentence-transformers/all-MiniLM-L6-v2"
+    if settings.embedding_server_backend == "onnx":
+        from app.core.onnx_embeddings import OnnxEmbeddingService
+
+        return OnnxEmbeddingService(model_name, threads=settings.embedding_onnx_threads, batch_size=settings.embedding_onnx_batch_size)
+    from app.core.embeddings import LocalSBERTEmbeddingService
+
+    return LocalSBERTEmbeddingService(model_name=model_name)
+
+
+async def serve(listen: str) -> None:
+    settings = get_settings()
+    service = _load_service()
+    # 첫 요청 지연 방지 + 차원 확인
+    dim = len(service._embed_texts(["warmup"])[0])
+    batcher = EmbeddingBatcher(service, dim, settings.embedding_server_max_batch, settings.embedding_server_max_wait_ms)
+
+    async def handler(reader, writer):
+        await _handle(reader, writer, batcher)
+
+    kind, addr = parse_address(listen)
+    if kind == "unix":
+        if os.path.exists(addr):
+            os.unlink(addr)
+        server = await asyncio.start_unix_server(handler, path=addr)
+    else:
+        server = await asyncio.start_server(handler, host=addr[0], port=addr[1])
+    logger.info("embedding server (%s) listening on %s", service.model_name, listen)
+    batch_task = asyncio.create_task(batcher.run())
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        batch_task.cancel()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.embedding_server.main")
+    parser.add_argument("--listen", default=None, help="tcp://host:port or unix:///path.sock (default: EMBEDDING_SERVER_URL)")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    asyncio.run(serve(args.listen or get_settings().embedding_server_url))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""임베딩 서버 소켓 프로토콜.
+
+프레임 = 4바이트 big-endian 길이 + 본문. 요청은 JSON 프레임 1개,
+응답은 JSON 헤더 프레임 + (성공 시) float32 little-endian 행렬 프레임.
+
+- 요청: {"op": "embed", "texts": [...]} | {"op": "info"}
+- 응답 헤더: {"ok": true, "n": N, "dim": D} | {"ok": true, "model": ..., "dim": D} | {"ok": false, "error": "..."}
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import socket
+import struct
+from typing import Any, Dict, Tuple
+from urllib.parse import urlparse
+
+_LEN = struct.Struct(">I")
+MAX_FRAME_BYTES = 64 * 1024 * 1024
+
+
+def parse_address(url: str) -> Tuple[str, Any]:
+    """`tcp://host:port` → ("tcp", (host, port)), `unix:///path.sock` → ("unix", "/path.sock")."""
+    u = urlparse(url)
+    if u.scheme == "unix":
+        return "unix", u.path
+    if u.scheme == "tcp":
+        return "tcp", (u.hostname or "127.0.0.1", u.port or 7997)
+    raise ValueError(f"unsupported embedding server address: {url}")
+
+
+def encode_json(obj: Dict[str, Any]) -> bytes:
+    body = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+    return _LEN.pack(len(body)) + body
+
+
+def encode_bytes(body: bytes) -> bytes:
+    return _LEN.pack(len(body)) + body
+
+
+# --- 동기(클라이언트) ---
+
+def _recv_exact(sock: socket.socket, n: int) -> bytes:
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = sock.recv(n - len(buf))
+        if not chunk:
+            raise ConnectionError("embedding server closed the connection")
+        buf += chunk
+    return bytes(buf)
+
+
+def recv_frame(sock: socket.socket) -> bytes:
+    (n,) = _LEN.unpack(_recv_exact(sock, _LEN.size))
+    if n > MAX_FRAME_BYTES:
+        raise ConnectionError(f"frame too large: {n}")
+    return _recv_exact(sock, n)
+
+
+# --- 비동기(서버) ---
+
+async def read_frame(reader: asyncio.StreamReader) -> bytes:
+    (n,) = _LEN.unpack(await reader.readexactly(_LEN.size))
+    if n > MAX_FRAME_BYTES:
+        raise ValueError(f"frame too large: {n}")
+    return await reader.readexactly(n)
+
+
+__all__ = ["MAX_FRAME_BYTES", "parse_address", "encode_json", "encode_bytes", "recv_frame", "read_frame"]
@@ -1,10 +1,15 @@
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
 from app.core.config import get_settings
 from app.core.llm import setup_langsmith
-from app.models.db import create_db_and_tables
+from app.core.warmup import run_warmup
+from app.models.db import get_async_engine
+from app.models.migrations import check_schema_version
+from app.api.pagination import NEXT_CURSOR_HEADER
+from app.services.stt_service import shutdown_stt_pool
 from app.api.routers.health import router as health_router
 from app.api.routers.experiences import router as experiences_router
 from app.api.routers.jobs import router as jobs_router
@@ -12,18 +17,26 @@ from app.api.routers.recommendations import router as rec_router
 from app.api.routers.interview import router as interview_router
 from app.api.routers.auth import router as auth_router
 from app.api.routers.dashboard import router as dashboard_router
+from app.api.routers.metrics import router as metrics_router
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     print("🚀 AI Interview Coach 시작 중...")
-    create_db_and_tables()
+    # DDL은 `python -m app.models.migrations`(배포 단계)에서. 기동 시에는 버전 번호만 확인
+    check_schema_version()
     setup_langsmith()  # LangSmith 설정 초기화
+    # 워밍업은 기동을 막지 않도록 백그라운드로. 완료 여부는 /health/ready
+    warmup_task = asyncio.create_task(run_warmup()) if get_settings().warmup_enabled else None
     print("✅ AI Interview Coach 시작 완료!")
     yield
     # Shutdown
     print("👋 AI Interview Coach 종료 중...")
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+    shutdown_stt_pool()
+    await get_async_engine().dispose()
 
 
 settings = get_settings()
@@ -41,6 +54,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 app.include_router(health_router, prefix="/health", tags=["health"]) 
@@ -50,6 +64,8 @@ app.include_router(rec_router, prefix="/recommendations", tags=["recommendations
 app.include_router(interview_router, prefix="/interviews", tags=["interviews"]) 
 app.include_router(auth_router, prefix="/auth", tags=["auth"]) 
 app.include_router(dashboard_router, prefix="/dashboard", tags=["dashboard"]) 
+if settings.metrics_enabled:
+    app.include_router(metrics_router, tags=["metrics"])
 
 
 @app.get("/")
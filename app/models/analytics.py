@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from datetime import date
+
+from sqlmodel import SQLModel, Field
+
+
+class WeaknessStat(SQLModel, table=True):
+    """사용자/평가 축/일자별 누적 집계. 답변 저장 시 증분 갱신(app.services.analytics_service)."""
+
+    __tablename__ = "weakness_stat"
+    user_id: str = Field(primary_key=True)
+    axis: str = Field(primary_key=True)  # EVAL_AXES
+    bucket_date: date = Field(primary_key=True)  # UTC 일자
+    miss_count: int = 0  # missing_dims에 해당 축이 포함된 답변 수
+    answer_count: int = 0  # 평가된 전체 답변 수
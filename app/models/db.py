@@ -1,8 +1,19 @@
-from typing import Iterator
-from sqlmodel import SQLModel, create_engine, Session
-from sqlalchemy import text, inspect as sa_inspect
+from functools import lru_cache
+from typing import AsyncIterator, Iterator
+from sqlmodel import create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
 from app.core.config import get_settings
+from app.core.metrics import register_collector
+from app.models.pool_metrics import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    async_pool_metrics,
+    instrument_hold_time,
+    sync_pool_metrics,
+)
 
 
 def _build_database_url() -> str:
@@ -27,55 +38,75 @@ def _build_database_url() -> str:
     )
 
 
-settings = get_settings()
-engine = create_engine(_build_database_url(), echo=False, future=True)
+def _engine_kwargs() -> dict:
+    """풀/드라이버 설정. API, LocalDBQueue, 워커가 같은 설정을 공유하므로 프로세스별 ENV로 조정."""
+    settings = get_settings()
+    # psycopg: prepare_threshold=None이면 서버측 prepared statement 비활성(pgbouncer transaction pooling 호환)
+    prepare_threshold = None if settings.db_pgbouncer_mode else settings.db_prepare_threshold
+    return {
+        "echo": False,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "connect_args": {"prepare_threshold": prepare_threshold},
+    }
+
+
+@lru_cache
+def get_engine() -> Engine:
+    """동기 엔진(프로세스당 1개). 임포트 시점이 아니라 첫 사용 시 생성."""
+    sync_engine = create_engine(_build_database_url(), future=True, poolclass=InstrumentedQueuePool, **_engine_kwargs())
+    instrument_hold_time(sync_engine.pool, sync_pool_metrics)
+    return sync_engine
 
 
-def create_db_and_tables() -> None:
-    # Import vector entities to register tables
-    try:
-        from app.models import vector_entities  # noqa: F401
-    except Exception:
-        pass
-    # Always ensure pgvector extension for PostgreSQL
-    with engine.connect() as conn:
-        try:
-            conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
-            conn.commit()
-        except Exception:
-            conn.rollback()
-    SQLModel.metadata.create_all(engine)
-    _run_light_migrations()
+def __getattr__(name: str):
+    # 하위 호환: `from app.models.db import engine`
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(name)
 
 
 def get_session() -> Iterator[Session]:
-    with Session(engine) as session:
+    with Session(get_engine()) as session:
         yield session
 
 
-def _run_light_migrations() -> None:
-    """Best-effort, idempotent column additions for backward compatibility.
-    Avoids full Alembic setup by adding missing columns dynamically.
+@lru_cache
+def get_async_engine() -> AsyncEngine:
+    # psycopg(v3)는 동일 URL로 async 드라이버를 제공
+    async_engine = create_async_engine(_build_database_url(), poolclass=InstrumentedAsyncQueuePool, **_engine_kwargs())
+    instrument_hold_time(async_engine.sync_engine.pool, async_pool_metrics)
+    return async_engine
+
+
+def pool_status() -> dict:
+    status = {"sync": {"status": get_engine().pool.status(), **sync_pool_metrics.snapshot()}}
+    if get_async_engine.cache_info().currsize:
+        status["async"] = {"status": get_async_engine().sync_engine.pool.status(), **async_pool_metrics.snapshot()}
+    return status
+
+
+@register_collector
+def _pool_gauges():
+    # 엔진이 이미 만들어진 경우만(스크레이프가 엔진/커넥션을 만들지 않도록)
+    pools = []
+    if get_engine.cache_info().currsize:
+        pools.append(("sync", get_engine().pool))
+    if get_async_engine.cache_info().currsize:
+        pools.append(("async", get_async_engine().sync_engine.pool))
+    return [
+        ("db_pool_checked_out", "gauge", "Connections currently checked out", [({"pool": n}, p.checkedout()) for n, p in pools]),
+        ("db_pool_size", "gauge", "Configured pool size", [({"pool": n}, p.size()) for n, p in pools]),
+    ]
+
+
+async def get_async_session() -> AsyncIterator[AsyncSession]:
+    """비동기 세션. 커넥션은 첫 쿼리 시 체크아웃되고 commit/rollback/close 시 반환된다.
+    LLM 호출처럼 오래 걸리는 작업 전에는 `await session.close()`로 먼저 반환할 것.
     """
-    try:
-        with engine.begin() as conn:
-            insp = sa_inspect(conn)
-            if "jobposting" in insp.get_table_names():
-                existing_cols = {col["name"] for col in insp.get_columns("jobposting")}
-                dialect = conn.dialect.name
-
-                if "status" not in existing_cols:
-                    if dialect.startswith("postgres"):
-                        conn.execute(text("ALTER TABLE jobposting ADD COLUMN IF NOT EXISTS status TEXT DEFAULT 'draft'"))
-                    else:
-                        conn.execute(text("ALTER TABLE jobposting ADD COLUMN status VARCHAR"))
-
-                if "application_qa" not in existing_cols:
-                    if dialect.startswith("postgres"):
-                        conn.execute(text("ALTER TABLE jobposting ADD COLUMN IF NOT EXISTS application_qa JSONB DEFAULT '[]'::jsonb"))
-                    else:
-                        conn.execute(text("ALTER TABLE jobposting ADD COLUMN application_qa TEXT"))
-    except Exception:
-        # Non-fatal; app can still run, and errors will surface where needed
-        pass
+    async with AsyncSession(get_async_engine(), expire_on_commit=False) as session:
+        yield session
 
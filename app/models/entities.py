@@ -2,24 +2,24 @@ from __future__ import annotations
 
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from sqlmodel import SQLModel, Field, Column, JSON
-from passlib.context import CryptContext
+from sqlalchemy import Index
+from sqlmodel import SQLModel, Field, Column
+
+from app.models.types import JSONType
 
 
 class Experience(SQLModel, table=True):
+    __table_args__ = (Index("ix_experience_user_id_id", "user_id", "id"),)
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: str = Field(default="default", index=True)
     category: str = Field(index=True)  # project | career | education | certification | language
     title: Optional[str] = None
     start_date: Optional[str] = None
     end_date: Optional[str] = None
-    content: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON))
+    content: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSONType))
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-
 class User(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     email: str = Field(index=True, unique=True)
@@ -29,33 +29,54 @@ class User(SQLModel, table=True):
 
     @staticmethod
     def hash_password(password: str) -> str:
-        return pwd_context.hash(password)
+        from app.core.passwords import hash_password
+
+        return hash_password(password)
 
     @staticmethod
     def verify_password(password: str, hashed: str) -> bool:
-        return pwd_context.verify(password, hashed)
+        from app.core.passwords import verify_password
+
+        return verify_password(password, hashed)
+
+
+class JobPostingContent(SQLModel, table=True):
+    """공고 본문(사용자 간 공유). 정규화 텍스트의 sha256으로 식별하며 섹션 청크/임베딩도 이 단위로 한 번만 만든다."""
+    content_hash: str = Field(primary_key=True)
+    raw_text: str
+    sections: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSONType))
+    created_at: datetime = Field(default_factory=datetime.utcnow)
 
 
 class JobPosting(SQLModel, table=True):
+    __table_args__ = (Index("ix_jobposting_user_id_id", "user_id", "id"),)
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: str = Field(default="default", index=True)
     source_type: str = Field(index=True)  # url | manual
     url: Optional[str] = None
+    # 공유 본문 참조. 설정된 행은 raw_text/sections를 비워 두고 JobPostingContent에서 읽는다(레거시 행만 직접 보관)
+    content_hash: Optional[str] = Field(default=None, index=True)
     raw_text: Optional[str] = None
-    sections: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON))
+    sections: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSONType))
     status: str = Field(default="draft", index=True)  # draft | applied | interviewing | offer | rejected
-    application_qa: List[Dict[str, Any]] = Field(default_factory=list, sa_column=Column(JSON))
+    application_qa: List[Dict[str, Any]] = Field(default_factory=list, sa_column=Column(JSONType))
+    fetch_status: str = Field(default="ready")  # ready | fetching | failed
+    fetch_error: Optional[str] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
 
 class InterviewSession(SQLModel, table=True):
+    __table_args__ = (Index("ix_interviewsession_user_id_id", "user_id", "id"),)
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: str = Field(default="default", index=True)
     job_posting_id: int = Field(index=True)
-    selected_experience_ids: List[int] = Field(default_factory=list, sa_column=Column(JSON))
+    selected_experience_ids: List[int] = Field(default_factory=list, sa_column=Column(JSONType))
     status: str = Field(default="active", index=True)
     current_round: int = Field(default=0)
     follow_up_count: int = Field(default=0)
+    # 비정규화: 현재 질문 포인터와 append-only 전사 이벤트(app.services.transcript_service 참고)
+    last_question_id: Optional[int] = Field(default=None)
+    transcript: List[Dict[str, Any]] = Field(default_factory=list, sa_column=Column(JSONType))
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
 
@@ -74,7 +95,7 @@ class InterviewAnswer(SQLModel, table=True):
     session_id: int = Field(index=True)
     question_id: int = Field(index=True)
     answer_text: str
-    evaluation: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON))
+    evaluation: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSONType))
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
 
@@ -83,7 +104,7 @@ class FeedbackReport(SQLModel, table=True):
     session_id: int = Field(index=True)
     status: str = Field(default="pending", index=True)  # pending → processing → completed → failed
     progress: int = Field(default=0)  # 0-100%
-    report: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSON))
+    report: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSONType))
     error_message: Optional[str] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
     completed_at: Optional[datetime] = None
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from sqlmodel import SQLModel, Field
+
+
+class FetchedPage(SQLModel, table=True):
+    """정규화 URL 기준 공유 캐시(사용자 간 공통). 조건부 재요청을 위해 검증자(ETag/Last-Modified)를 보관."""
+
+    __tablename__ = "fetched_page"
+    url_key: str = Field(primary_key=True)  # normalize_url 결과
+    url: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    text: str
+    fetched_at: datetime = Field(default_factory=datetime.utcnow, index=True)
@@ -0,0 +1,503 @@
+"""버전 관리 스키마 마이그레이션.
+
+API/워커 기동 시에는 `check_schema_version()`으로 버전 번호만 확인하고,
+DDL은 배포 단계에서 1회성 명령으로 실행한다::
+
+    python -m app.models.migrations          # 최신 버전까지 적용
+    python -m app.models.migrations --status # 현재/최신 버전 출력
+    python -m app.models.migrations --vector-index # VECTOR_STORAGE_MODE 변경 후 HNSW 인덱스 재생성
+
+각 마이그레이션은 자체 트랜잭션에서 실행되며 멱등이어야 한다(IF NOT EXISTS 등).
+baseline(create_all)이 최신 모델로 테이블을 만들기 때문에 신규 DB에서는 이후 단계가 no-op이 된다.
+새 변경은 목록 끝에 다음 번호로 추가하고 기존 항목은 수정하지 않는다.
+baseline 이후 단계는 app 코드(서비스/모델)를 임포트하지 않고 SQL 리터럴만 사용한다(이후 리팩터링이 적용된 단계를 바꾸지 않도록).
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from sqlalchemy import text, inspect as sa_inspect
+from sqlalchemy.engine import Connection
+from sqlmodel import SQLModel
+
+from app.core.config import get_settings
+from app.models.db import get_engine
+
+
+logger = logging.getLogger(__name__)
+
+# 여러 레플리카/배포 잡이 동시에 실행해도 한 곳에서만 적용되도록(pg_advisory_lock 키)
+_ADVISORY_LOCK_KEY = 72_410_044
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    apply: Callable[[Connection], None]
+
+
+def _baseline(conn: Connection) -> None:
+    # 테이블 등록을 위해 모든 모델 모듈 임포트
+    from app.models import analytics, entities, fetched_page, job_queue, llm_cache, vector_entities  # noqa: F401
+
+    conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+    SQLModel.metadata.create_all(conn)
+
+
+def _jobposting_columns(conn: Connection) -> None:
+    for ddl in (
+        "ALTER TABLE jobposting ADD COLUMN IF NOT EXISTS status TEXT DEFAULT 'draft'",
+        "ALTER TABLE jobposting ADD COLUMN IF NOT EXISTS application_qa JSONB DEFAULT '[]'::jsonb",
+        "ALTER TABLE jobposting ADD COLUMN IF NOT EXISTS content_hash VARCHAR",
+        "CREATE INDEX IF NOT EXISTS ix_jobposting_content_hash ON jobposting (content_hash)",
+        "ALTER TABLE jobposting ADD COLUMN IF NOT EXISTS fetch_status VARCHAR DEFAULT 'ready'",
+        "ALTER TABLE jobposting ADD COLUMN IF NOT EXISTS fetch_error VARCHAR",
+    ):
+        conn.execute(text(ddl))
+
+
+def _session_transcript_columns(conn: Connection) -> None:
+    conn.execute(text("ALTER TABLE interviewsession ADD COLUMN IF NOT EXISTS last_question_id INTEGER"))
+    conn.execute(text("ALTER TABLE interviewsession ADD COLUMN IF NOT EXISTS transcript JSONB DEFAULT '[]'::jsonb"))
+
+
+# JSONB로 전환할 (테이블, 컬럼). ORM은 app.models.types.JSONType으로 선언되어 신규 테이블은 처음부터 JSONB
+_JSONB_COLUMNS = (
+    ("experience", "content"),
+    ("jobposting", "sections"),
+    ("jobposting", "application_qa"),
+    ("interviewsession", "selected_experience_ids"),
+    ("interviewsession", "transcript"),
+    ("interviewanswer", "evaluation"),
+    ("feedbackreport", "report"),
+    ("rag_embeddings", "meta"),
+)
+
+_JSONB_INDEXES = (
+    # 평가 등급별 필터/집계
+    "CREATE INDEX IF NOT EXISTS ix_interviewanswer_rating ON interviewanswer ((evaluation->>'rating'))",
+    # 부족 축 포함 여부(evaluation->'notes'->'missing_dims' ? 'tradeoff')
+    "CREATE INDEX IF NOT EXISTS ix_interviewanswer_missing_dims ON interviewanswer USING GIN ((evaluation->'notes'->'missing_dims'))",
+    # 원본 삭제 시 벡터 정리(delete_by_meta)
+    "CREATE INDEX IF NOT EXISTS ix_rag_embeddings_job_posting_id ON rag_embeddings ((meta->>'job_posting_id'))",
+    "CREATE INDEX IF NOT EXISTS ix_rag_embeddings_experience_id ON rag_embeddings ((meta->>'experience_id'))",
+)
+
+
+def _jsonb(conn: Connection) -> None:
+    insp = sa_inspect(conn)
+    for table, column in _JSONB_COLUMNS:
+        col = next((c for c in insp.get_columns(table) if c["name"] == column), None)
+        if col is None or "JSONB" in str(col["type"]).upper():
+            continue
+        # TEXT로 추가된 레거시 컬럼도 함께 처리(빈 문자열은 NULL로)
+        conn.execute(text(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE JSONB USING NULLIF({column}::text, '')::jsonb"))
+    for ddl in _JSONB_INDEXES:
+        conn.execute(text(ddl))
+
+
+# 질문/답변 테이블에서 transcript_service 이벤트 형식으로 재구성(포인터가 비어 있는 세션만 대상)
+_TRANSCRIPT_BACKFILL_SQL = """
+UPDATE interviewsession s
+SET transcript = ev.events, last_question_id = ev.last_qid
+FROM (
+  SELECT q.session_id,
+         jsonb_agg(jsonb_build_object('k', 'q', 'id', q.id, 'round', q.round_index, 'type', q.question_type, 'text', q.text) ORDER BY q.id)
+           || COALESCE((
+             SELECT jsonb_agg(jsonb_build_object('k', 'a', 'qid', a.question_id, 'text', a.answer_text,
+                                                 'evaluation', COALESCE(a.evaluation::jsonb, '{}'::jsonb)) ORDER BY a.id)
+             FROM interviewanswer a WHERE a.session_id = q.session_id
+           ), '[]'::jsonb) AS events,
+         MAX(q.id) AS last_qid
+  FROM interviewquestion q
+  WHERE q.session_id IN (SELECT id FROM interviewsession WHERE last_question_id IS NULL)
+  GROUP BY q.session_id
+) ev
+WHERE s.id = ev.session_id AND s.last_question_id IS NULL
+"""
+
+
+def _transcript_backfill(conn: Connection) -> None:
+    conn.execute(text(_TRANSCRIPT_BACKFILL_SQL))
+
+
+def _keyset_indexes(conn: Connection) -> None:
+    # 목록 keyset 페이지네이션용 (user_id, id) 복합 인덱스 (기존 테이블 대상)
+    for table in ("experience", "jobposting", "interviewsession"):
+        conn.execute(text(f"CREATE INDEX IF NOT EXISTS ix_{table}_user_id_id ON {table} (user_id, id)"))
+
+
+def _enqueue_weakness_rebuild(conn: Connection) -> None:
+    # 약점 집계 테이블이 비어 있으면 기존 답변으로 1회 재계산하도록 워커 작업 등록
+    conn.execute(text(
+        """
+        INSERT INTO jobqueue (type, payload, status, attempts, created_at, updated_at)
+        SELECT 'rebuild_weakness_stats', '{}', 'pending', 0, NOW() AT TIME ZONE 'UTC', NOW() AT TIME ZONE 'UTC'
+        WHERE NOT EXISTS (SELECT 1 FROM weakness_stat)
+          AND EXISTS (SELECT 1 FROM interviewanswer)
+          AND NOT EXISTS (SELECT 1 FROM jobqueue WHERE type = 'rebuild_weakness_stats' AND status IN ('pending', 'processing'))
+        """
+    ))
+
+
+# 마이그레이션 전용 HNSW 정의(저장 모드 → 인덱스 표현식, 연산자 클래스). app 코드와 분리된 고정 사본이라
+# 이후 vectorstore가 바뀌어도 이미 적용된 단계의 DDL은 그대로다.
+_HNSW_OPS = {
+    "full": ("(embedding::vector({d}))", "vector_cosine_ops"),
+    "half": ("(embedding::halfvec({d}))", "halfvec_cosine_ops"),
+    "binary": ("(binary_quantize(embedding)::bit({d}))", "bit_hamming_ops"),
+}
+
+
+def _storage_mode() -> str:
+    mode = get_settings().vector_storage_mode
+    return mode if mode in _HNSW_OPS else "full"
+
+
+def _hnsw_with() -> str:
+    settings = get_settings()
+    return f"WITH (m = {int(settings.vector_hnsw_m)}, ef_construction = {int(settings.vector_hnsw_ef_construction)})"
+
+
+def _embedding_typmod(conn: Connection) -> Optional[int]:
+    return conn.execute(text(
+        "SELECT atttypmod FROM pg_attribute WHERE attrelid = 'rag_embeddings'::regclass AND attname = 'embedding'"
+    )).scalar()
+
+
+def _vector_index(conn: Connection) -> None:
+    """저장 모드(VECTOR_STORAGE_MODE) 단일 HNSW 인덱스(vector(d) 컬럼 대상).
+
+    이후 baseline으로 만들어진 테이블(차원 없는 vector 컬럼)은 9단계가 공간별 인덱스를 관리하므로 no-op.
+    기존 행의 차원이 설정과 다르면 그대로 두고 9단계(legacy 공간 등록 → 워커 재임베딩)에 맡긴다.
+    """
+    current = _embedding_typmod(conn)
+    if not current or current <= 0:
+        return
+    settings = get_settings()
+    dim = int(settings.embedding_dimensions or settings.embedding_dim or 1536)
+    if current != dim:
+        if conn.execute(text("SELECT EXISTS (SELECT 1 FROM rag_embeddings)")).scalar():
+            logger.warning("rag_embeddings.embedding is vector(%s), configured %s; leaving it to the embedding space migration", current, dim)
+            return
+        conn.execute(text(f"ALTER TABLE rag_embeddings ALTER COLUMN embedding TYPE vector({dim})"))
+        for m in _HNSW_OPS:
+            conn.execute(text(f"DROP INDEX IF EXISTS ix_rag_embeddings_hnsw_{m}"))
+    mode = _storage_mode()
+    expr, opclass = _HNSW_OPS[mode]
+    if mode == "full":
+        expr = "embedding"  # 컬럼 자체가 vector(d)
+    conn.execute(text(
+        f"CREATE INDEX IF NOT EXISTS ix_rag_embeddings_hnsw_{mode} ON rag_embeddings "
+        f"USING hnsw ({expr.format(d=dim)} {opclass}) {_hnsw_with()}"
+    ))
+    for m in _HNSW_OPS:
+        if m != mode:
+            conn.execute(text(f"DROP INDEX IF EXISTS ix_rag_embeddings_hnsw_{m}"))
+
+
+_CREATE_EMBEDDING_SPACE = (
+    """
+    CREATE TABLE IF NOT EXISTS embedding_space (
+      id SERIAL PRIMARY KEY,
+      provider VARCHAR NOT NULL,
+      model_name VARCHAR NOT NULL,
+      dimensions INTEGER,
+      dim INTEGER,
+      status VARCHAR NOT NULL DEFAULT 'building',
+      total INTEGER NOT NULL DEFAULT 0,
+      done INTEGER NOT NULL DEFAULT 0,
+      cursor VARCHAR,
+      created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT NOW(),
+      activated_at TIMESTAMP WITHOUT TIME ZONE
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_embedding_space_status ON embedding_space (status)",
+)
+
+
+def _configured_embedding_spec() -> tuple:
+    """9단계 시점의 설정 → (provider, model_name, dimensions) 규칙(고정 사본)."""
+    settings = get_settings()
+    provider = settings.embedding_provider.lower() if settings.embedding_provider else "auto"
+    if settings.openai_api_key and provider in {"auto", "openai"}:
+        return "openai", settings.embedding_model or "text-embedding-3-small", settings.embedding_dimensions
+    if provider not in {"server", "onnx"}:
+        provider = "sentence-transformers"
+    return provider, settings.embedding_model or "sentence-transformers/all-MiniLM-L6-v2", settings.embedding_dimensions
+
+
+def _embedding_spaces(conn: Connection) -> None:
+    """rag_embeddings를 임베딩 공간 단위로 전환.
+
+    기존 행이 있으면 어떤 모델로 만들었는지 알 수 없으므로 model_name='legacy'(dim은 컬럼 typmod) active 공간으로
+    등록한다. 설정 모델과 절대 일치하지 않으므로 워커 기동 시 항상 새 공간으로 재임베딩된다.
+    행이 없으면 현재 설정의 모델로 바로 등록한다.
+    PK (id) → (space_id, id), embedding vector(d) → 차원 없는 vector(차원은 공간별로 관리).
+    """
+    for ddl in _CREATE_EMBEDDING_SPACE:
+        conn.execute(text(ddl))
+    conn.execute(text("ALTER TABLE rag_embeddings ADD COLUMN IF NOT EXISTS space_id INTEGER"))
+    typmod = _embedding_typmod(conn)
+    active_id = conn.execute(text("SELECT id FROM embedding_space WHERE status = 'active'")).scalar()
+    if active_id is None:
+        has_rows = conn.execute(text("SELECT EXISTS (SELECT 1 FROM rag_embeddings)")).scalar()
+        if has_rows:
+            provider, model_name, dimensions = "legacy", "legacy", None
+        else:
+            provider, model_name, dimensions = _configured_embedding_spec()
+        active_id = conn.execute(text(
+            """
+            INSERT INTO embedding_space (provider, model_name, dimensions, dim, status, total, done, created_at, activated_at)
+            VALUES (:p, :m, :d, :dim, 'active', 0, 0, NOW(), NOW())
+            RETURNING id
+            """
+        ), {"p": provider, "m": model_name, "d": dimensions, "dim": typmod if has_rows and typmod and typmod > 0 else None}).scalar()
+    conn.execute(text("UPDATE rag_embeddings SET space_id = :s WHERE space_id IS NULL"), {"s": active_id})
+    conn.execute(text("ALTER TABLE rag_embeddings ALTER COLUMN space_id SET NOT NULL"))
+
+    pk = sa_inspect(conn).get_pk_constraint("rag_embeddings")
+    if pk.get("constrained_columns") == ["id"]:
+        conn.execute(text(f'ALTER TABLE rag_embeddings DROP CONSTRAINT "{pk["name"]}"'))
+        conn.execute(text("ALTER TABLE rag_embeddings ADD PRIMARY KEY (space_id, id)"))
+    for mode in _HNSW_OPS:
+        conn.execute(text(f"DROP INDEX IF EXISTS ix_rag_embeddings_hnsw_{mode}"))
+    if typmod and typmod > 0:
+        conn.execute(text("ALTER TABLE rag_embeddings ALTER COLUMN embedding TYPE vector"))
+
+    dim = conn.execute(text("SELECT dim FROM embedding_space WHERE id = :id"), {"id": active_id}).scalar()
+    partitioned = conn.execute(text(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass('rag_embeddings'))"
+    )).scalar()
+    if dim and not partitioned:
+        mode = _storage_mode()
+        expr, opclass = _HNSW_OPS[mode]
+        conn.execute(text(
+            f"CREATE INDEX IF NOT EXISTS ix_rag_embeddings_hnsw_{mode}_s{int(active_id)} ON rag_embeddings "
+            f"USING hnsw ({expr.format(d=int(dim))} {opclass}) {_hnsw_with()} WHERE space_id = {int(active_id)}"
+        ))
+
+
+# 10단계 시점의 rag_embeddings 정의(tenant_id 해시 파티션)
+_CREATE_PARTITIONED_RAG = (
+    """
+    CREATE TABLE rag_embeddings (
+      tenant_id VARCHAR NOT NULL,
+      space_id INTEGER NOT NULL,
+      id VARCHAR NOT NULL,
+      collection VARCHAR NOT NULL,
+      document VARCHAR,
+      meta JSONB,
+      embedding vector,
+      PRIMARY KEY (tenant_id, space_id, id)
+    ) PARTITION BY HASH (tenant_id)
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_rag_embeddings_collection ON rag_embeddings (collection)",
+)
+
+# 기존 행의 테넌트: 경험/레거시 공고는 원본 소유자, 나머지(content_hash 공유 본문, 소유자 불명)는 공유 테넌트('_shared')
+_PARTITION_COPY_SQL = """
+INSERT INTO rag_embeddings (tenant_id, space_id, id, collection, document, meta, embedding)
+SELECT COALESCE(e.user_id, j.user_id, '_shared'), r.space_id, r.id, r.collection, r.document, r.meta, r.embedding
+FROM rag_embeddings_unpartitioned r
+LEFT JOIN experience e ON e.id::text = r.meta->>'experience_id'
+LEFT JOIN jobposting j ON j.id::text = r.meta->>'job_posting_id'
+ON CONFLICT DO NOTHING
+"""
+
+_RAG_META_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS ix_rag_embeddings_job_posting_id ON rag_embeddings ((meta->>'job_posting_id'))",
+    "CREATE INDEX IF NOT EXISTS ix_rag_embeddings_experience_id ON rag_embeddings ((meta->>'experience_id'))",
+    # 공유 테넌트에서 세션 공고 섹션 조회(search_shared) / 본문 정리
+    "CREATE INDEX IF NOT EXISTS ix_rag_embeddings_content_hash ON rag_embeddings ((meta->>'content_hash'))",
+)
+
+
+def _partition_rag_embeddings(conn: Connection) -> None:
+    """rag_embeddings를 tenant_id 해시 파티션 테이블로 전환(PK (tenant_id, space_id, id)).
+
+    기존 테이블은 이름을 바꿔 두고 새 파티션 테이블로 복사한 뒤 삭제한다(한 트랜잭션, 복사 동안 쓰기 차단).
+    신규 DB는 baseline이 이미 파티션 테이블을 만들었으므로 파티션만 생성한다.
+    active 공간의 HNSW 인덱스는 부모 ON ONLY + 파티션별 인덱스 ATTACH로 만든다.
+    """
+    partitioned = conn.execute(text(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass('rag_embeddings'))"
+    )).scalar()
+    if not partitioned:
+        # 새 테이블과 이름이 겹치지 않도록 PK 외 인덱스는 먼저 제거(HNSW/메타 인덱스는 아래에서 다시 생성)
+        for name in conn.execute(text(
+            "SELECT indexrelid::regclass::text FROM pg_index WHERE indrelid = 'rag_embeddings'::regclass AND NOT indisprimary"
+        )).scalars().all():
+            conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        pk = sa_inspect(conn).get_pk_constraint("rag_embeddings")
+        conn.execute(text("ALTER TABLE rag_embeddings RENAME TO rag_embeddings_unpartitioned"))
+        if pk.get("name"):
+            conn.execute(text(f'ALTER TABLE rag_embeddings_unpartitioned RENAME CONSTRAINT "{pk["name"]}" TO rag_embeddings_unpartitioned_pkey'))
+        for ddl in _CREATE_PARTITIONED_RAG:
+            conn.execute(text(ddl))
+
+    n = max(1, int(get_settings().vector_partitions))
+    existing = conn.execute(text(
+        "SELECT COUNT(*) FROM pg_inherits WHERE inhparent = 'rag_embeddings'::regclass"
+    )).scalar()
+    if not existing:
+        for i in range(n):
+            conn.execute(text(
+                f"CREATE TABLE IF NOT EXISTS rag_embeddings_p{i} PARTITION OF rag_embeddings "
+                f"FOR VALUES WITH (MODULUS {n}, REMAINDER {i})"
+            ))
+
+    if not partitioned:
+        conn.execute(text(_PARTITION_COPY_SQL))
+        conn.execute(text("DROP TABLE rag_embeddings_unpartitioned"))
+    for ddl in _RAG_META_INDEXES:
+        conn.execute(text(ddl))
+
+    active = conn.execute(text("SELECT id, dim FROM embedding_space WHERE status = 'active'")).fetchone()
+    if active is None or not active[1]:
+        return
+    space_id, dim = int(active[0]), int(active[1])
+    mode = _storage_mode()
+    expr, opclass = _HNSW_OPS[mode]
+    name = f"ix_rag_embeddings_hnsw_{mode}_s{space_id}"
+    spec = f"USING hnsw ({expr.format(d=dim)} {opclass}) {_hnsw_with()} WHERE space_id = {space_id}"
+    conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON ONLY rag_embeddings {spec}"))
+    parts = conn.execute(text(
+        """
+        SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'rag_embeddings'::regclass ORDER BY c.relname
+        """
+    )).scalars().all()
+    for part in parts:
+        child = f"{name}_{part.rsplit('_', 1)[-1]}"
+        conn.execute(text(f"CREATE INDEX IF NOT EXISTS {child} ON {part} {spec}"))
+        conn.execute(text(f"ALTER INDEX {name} ATTACH PARTITION {child}"))
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "baseline", _baseline),
+    Migration(2, "jobposting_columns", _jobposting_columns),
+    Migration(3, "session_transcript_columns", _session_transcript_columns),
+    Migration(4, "jsonb", _jsonb),
+    Migration(5, "transcript_backfill", _transcript_backfill),
+    Migration(6, "keyset_indexes", _keyset_indexes),
+    Migration(7, "weakness_rebuild", _enqueue_weakness_rebuild),
+    Migration(8, "vector_index", _vector_index),
+    Migration(9, "embedding_spaces", _embedding_spaces),
+    Migration(10, "partition_rag_embeddings", _partition_rag_embeddings),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+class SchemaVersionError(RuntimeError):
+    pass
+
+
+_CREATE_VERSION_TABLE = """
+CREATE TABLE IF NOT EXISTS schema_version (
+  version INTEGER PRIMARY KEY,
+  name VARCHAR NOT NULL,
+  applied_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+)
+"""
+
+
+def current_version(conn: Connection) -> int:
+    """적용된 최신 버전. 버전 테이블이 없으면 0. 카탈로그 조회 없이 단일 쿼리."""
+    exists = conn.execute(text("SELECT to_regclass('schema_version') IS NOT NULL")).scalar()
+    if not exists:
+        return 0
+    return int(conn.execute(text("SELECT COALESCE(MAX(version), 0) FROM schema_version")).scalar() or 0)
+
+
+def migrate(target: Optional[int] = None) -> List[int]:
+    """target(기본: 최신)까지 미적용 마이그레이션을 순서대로 적용하고 적용한 버전 목록을 반환."""
+    target = LATEST_VERSION if target is None else target
+    applied: List[int] = []
+    with get_engine().connect() as conn:
+        conn.execute(text("SELECT pg_advisory_lock(:k)"), {"k": _ADVISORY_LOCK_KEY})
+        conn.commit()
+        try:
+            with conn.begin():
+                conn.execute(text(_CREATE_VERSION_TABLE))
+            # 락 획득 후 다시 읽어 다른 실행자가 먼저 적용한 버전은 건너뜀
+            version = current_version(conn)
+            conn.commit()
+            for m in MIGRATIONS:
+                if m.version <= version or m.version > target:
+                    continue
+                logger.info("applying migration %s_%s", m.version, m.name)
+                with conn.begin():
+                    m.apply(conn)
+                    conn.execute(
+                        text("INSERT INTO schema_version (version, name) VALUES (:v, :n)"),
+                        {"v": m.version, "n": m.name},
+                    )
+                applied.append(m.version)
+        finally:
+            conn.rollback()
+            conn.execute(text("SELECT pg_advisory_unlock(:k)"), {"k": _ADVISORY_LOCK_KEY})
+            conn.commit()
+    return applied
+
+
+def check_schema_version() -> int:
+    """기동 시 호출: 버전 번호만 확인한다(DDL/카탈로그 검사 없음).
+
+    스키마가 코드보다 뒤처져 있으면 `db_auto_migrate`일 때만 직접 적용하고,
+    아니면 SchemaVersionError. 스키마가 더 앞서 있는 경우(롤링 배포 중 구버전)는 허용.
+    """
+    with get_engine().connect() as conn:
+        version = current_version(conn)
+    if version >= LATEST_VERSION:
+        return version
+    if get_settings().db_auto_migrate:
+        migrate()
+        return LATEST_VERSION
+    raise SchemaVersionError(
+        f"database schema version {version} < required {LATEST_VERSION}; run `python -m app.models.migrations`"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.models.migrations", description="Apply schema migrations.")
+    parser.add_argument("--status", action="store_true", help="print current and latest versions only")
+    parser.add_argument("--target", type=int, default=None, help="migrate up to this version (default: latest)")
+    parser.add_argument("--vector-index", action="store_true", help="(re)build the HNSW index for VECTOR_STORAGE_MODE")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if args.status:
+        with get_engine().connect() as conn:
+            print(f"current={current_version(conn)} latest={LATEST_VERSION}")
+        return 0
+    if args.vector_index:
+        from app.core.vectorstore import ensure_active_vector_index
+
+        with get_engine().begin() as conn:
+            print(f"vector index: {ensure_active_vector_index(conn)}")
+        return 0
+    applied = migrate(args.target)
+    print(f"applied={applied or 'none'} latest={LATEST_VERSION}")
+    return 0
+
+
+__all__ = [
+    "Migration",
+    "MIGRATIONS",
+    "LATEST_VERSION",
+    "SchemaVersionError",
+    "current_version",
+    "migrate",
+    "check_schema_version",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
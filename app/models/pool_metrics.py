@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.metrics import db_pool_wait_seconds, register_collector
+
+
+class PoolMetrics:
+    """커넥션 풀 대기 시간(체크아웃까지)과 보유 시간(체크아웃~체크인) 누적 통계."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.wait_count = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.timeouts = 0
+        self.hold_count = 0
+        self.hold_total = 0.0
+        self.hold_max = 0.0
+
+    def observe_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.wait_count += 1
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+
+    def observe_hold(self, seconds: float) -> None:
+        with self._lock:
+            self.hold_count += 1
+            self.hold_total += seconds
+            self.hold_max = max(self.hold_max, seconds)
+
+    def observe_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "checkouts": self.wait_count,
+                "wait_avg_ms": round(1000 * self.wait_total / self.wait_count, 3) if self.wait_count else 0.0,
+                "wait_max_ms": round(1000 * self.wait_max, 3),
+                "timeouts": self.timeouts,
+                "hold_avg_ms": round(1000 * self.hold_total / self.hold_count, 3) if self.hold_count else 0.0,
+                "hold_max_ms": round(1000 * self.hold_max, 3),
+            }
+
+
+sync_pool_metrics = PoolMetrics("sync")
+async_pool_metrics = PoolMetrics("async")
+
+
+class _WaitTimingMixin:
+    _metrics: PoolMetrics
+
+    def _do_get(self):  # type: ignore[override]
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()  # type: ignore[misc]
+        except PoolTimeoutError:
+            self._metrics.observe_timeout()
+            raise
+        waited = time.perf_counter() - start
+        self._metrics.observe_wait(waited)
+        db_pool_wait_seconds.labels(pool=self._metrics.name).observe(waited)
+        return conn
+
+
+@register_collector
+def _pool_collector():
+    # 누적 통계(/health/db-pool) 중 타임아웃/보유 시간을 지표로도 노출(대기 시간은 db_pool_wait_seconds)
+    pools = (sync_pool_metrics, async_pool_metrics)
+    return [
+        ("db_pool_timeouts_total", "counter", "Pool checkouts that timed out", [({"pool": m.name}, m.timeouts) for m in pools]),
+        ("db_pool_checkins_total", "counter", "Connections returned to the pool", [({"pool": m.name}, m.hold_count) for m in pools]),
+        ("db_pool_hold_seconds_total", "counter", "Total seconds connections were checked out", [({"pool": m.name}, m.hold_total) for m in pools]),
+    ]
+
+
+class InstrumentedQueuePool(_WaitTimingMixin, QueuePool):
+    _metrics = sync_pool_metrics
+
+
+class InstrumentedAsyncQueuePool(_WaitTimingMixin, AsyncAdaptedQueuePool):
+    _metrics = async_pool_metrics
+
+
+def instrument_hold_time(pool: Any, metrics: PoolMetrics) -> None:
+    """체크아웃 시각을 커넥션 레코드에 기록해 체크인 시 보유 시간을 계산."""
+
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(dbapi_conn, record, proxy):  # noqa: ANN001
+        record.info["checkout_at"] = time.perf_counter()
+
+    @event.listens_for(pool, "checkin")
+    def _on_checkin(dbapi_conn, record):  # noqa: ANN001
+        started = record.info.pop("checkout_at", None)
+        if started is not None:
+            metrics.observe_hold(time.perf_counter() - started)
+
+
+__all__ = [
+    "PoolMetrics",
+    "sync_pool_metrics",
+    "async_pool_metrics",
+    "InstrumentedQueuePool",
+    "InstrumentedAsyncQueuePool",
+    "instrument_hold_time",
+]
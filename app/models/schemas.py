@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime
 from pydantic import BaseModel, Field, ConfigDict
 
@@ -36,9 +36,47 @@ class JobPostingRead(BaseModel):
     sections: Dict[str, Any]
     status: str
     application_qa: List[Dict[str, Any]]
+    fetch_status: str = "ready"  # ready | fetching | failed (URL 공고 수집 상태)
+    fetch_error: Optional[str] = None
     created_at: datetime
 
 
+class JobPostingListItem(BaseModel):
+    """목록 응답용. `fields` 프로젝션 시 선택하지 않은 필드는 응답에서 제외된다(exclude_unset)."""
+    model_config = ConfigDict(from_attributes=True)
+    id: int
+    user_id: Optional[str] = None
+    source_type: Optional[str] = None
+    url: Optional[str] = None
+    raw_text: Optional[str] = None
+    sections: Optional[Dict[str, Any]] = None
+    status: Optional[str] = None
+    application_qa: Optional[List[Dict[str, Any]]] = None
+    fetch_status: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+
+class ExperienceListItem(BaseModel):
+    """목록 응답용. `fields` 프로젝션 시 선택하지 않은 필드는 응답에서 제외된다(exclude_unset)."""
+    model_config = ConfigDict(from_attributes=True)
+    id: int
+    user_id: Optional[str] = None
+    category: Optional[str] = None
+    title: Optional[str] = None
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    content: Optional[Dict[str, Any]] = None
+
+
+class BulkDeleteRequest(BaseModel):
+    ids: List[int] = Field(min_length=1, max_length=500)
+
+
+class BulkDeleteResult(BaseModel):
+    ok: bool = True
+    deleted: List[int] = Field(default_factory=list)
+
+
 class RecommendationRequest(BaseModel):
     user_id: str = "default"
     job_posting_id: int
@@ -79,6 +117,18 @@ class SubmitAnswerRequest(BaseModel):
     answer: str
 
 
+class EvaluationNotes(BaseModel):
+    missing_dims: List[str] = Field(default_factory=list)
+    hints: List[str] = Field(default_factory=list)
+    summary: str = ""
+
+
+class AnswerEvaluation(BaseModel):
+    """답변 평가 결과(구조화 출력). rating이 가장 먼저 생성되도록 필드 순서를 유지."""
+    rating: Literal["GOOD", "VAGUE", "OFF_TOPIC"]
+    notes: EvaluationNotes = Field(default_factory=EvaluationNotes)
+
+
 class SubmitAnswerResponse(BaseModel):
     rating: str
     notes: Dict[str, Any]
@@ -86,6 +136,11 @@ class SubmitAnswerResponse(BaseModel):
     follow_up_count: int
 
 
+class AudioAnswerQueued(BaseModel):
+    job_id: int
+    status: str = "pending"
+
+
 class FeedbackResponse(BaseModel):
     model_config = ConfigDict(protected_namespaces=())
     overall: str
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from sqlalchemy import JSON
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+# PostgreSQL에서는 JSONB(바이너리 저장, GIN/표현식 인덱스 가능), 그 외 DB에서는 일반 JSON
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+
+__all__ = ["JSONType"]
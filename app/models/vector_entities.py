@@ -1,27 +1,49 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Optional, List, Dict, Any
-from sqlmodel import SQLModel, Field, Column, JSON
+from sqlmodel import SQLModel, Field, Column
 from pgvector.sqlalchemy import Vector
-from app.core.config import get_settings
+from app.models.types import JSONType
 
 
-def _dim() -> int:
-    settings = get_settings()
-    try:
-        # 기본 1536(OpenAI text-embedding-3-small)
-        return int(getattr(settings, "embedding_dim", 1536) or 1536)
-    except Exception:
-        return 1536
+class EmbeddingSpace(SQLModel, table=True):
+    """임베딩 공간(모델 + 차원) 레지스트리. 검색은 status='active'인 공간 1개만 사용한다.
+
+    모델/차원 설정이 바뀌면 'building' 공간을 만들어 큐 작업으로 재임베딩하고(app.services.reembed_service),
+    완료 시 한 트랜잭션에서 active ↔ retired를 뒤바꿔 읽기를 전환한다.
+    """
+
+    __tablename__ = "embedding_space"
+    id: Optional[int] = Field(default=None, primary_key=True)
+    provider: str  # 서비스 생성용(openai | sentence-transformers | onnx | server)
+    model_name: str
+    dimensions: Optional[int] = None  # 설정된 축소 차원(None=모델 원래 차원)
+    dim: Optional[int] = None  # 실제 저장 차원(첫 벡터 계산 시 확정, 인덱스 표현식에 사용)
+    status: str = Field(default="building", index=True)  # building | active | retired
+    total: int = 0  # 재임베딩 대상 행 수(시작 시점)
+    done: int = 0
+    cursor: Optional[str] = None  # 재임베딩 진행 위치(원본 공간의 마지막 id)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    activated_at: Optional[datetime] = None
+
+
+# 공고 본문처럼 사용자 간 공유되는 벡터의 테넌트(content_hash로 조회)
+SHARED_TENANT = "_shared"
 
 
 class RAGEmbedding(SQLModel, table=True):
+    """tenant_id(사용자) 해시 파티션 테이블. 파티션(rag_embeddings_p{n})은 마이그레이션에서 생성한다."""
+
     __tablename__ = "rag_embeddings"
+    __table_args__ = {"postgresql_partition_by": "HASH (tenant_id)"}
+    # 파티션 키는 PK에 포함되어야 함. (tenant_id, space_id) 접두사로 테넌트 단위 검색
+    tenant_id: str = Field(primary_key=True)
+    # 같은 문서 id가 공간별로 1행씩(모델 전환 중 이중 기록)
+    space_id: int = Field(primary_key=True)
     id: str = Field(primary_key=True)
     collection: str = Field(index=True)
     document: Optional[str] = None
-    meta: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON))
-    # Vector column (pgvector)
-    embedding: Optional[List[float]] = Field(default=None, sa_column=Column(Vector(_dim())))
-
-
+    meta: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSONType))
+    # 차원은 공간마다 다르므로 컬럼은 차원 없는 vector. HNSW 인덱스는 공간별 부분 인덱스(::vector(d))
+    embedding: Optional[List[float]] = Field(default=None, sa_column=Column(Vector()))
@@ -1,18 +1,38 @@
 from __future__ import annotations
 
-from typing import Optional, Dict, Any
+import logging
+import threading
+import time
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
 from sqlalchemy import text
 from sqlmodel import Session, select
 
-from app.models.db import engine
+from app.core.metrics import job_wait_seconds
+from app.models.db import get_engine
 from app.models.job_queue import JobQueue
 
 
+logger = logging.getLogger(__name__)
+
+# jobqueue 시각 컬럼은 naive UTC(datetime.utcnow)이므로 SQL 쪽도 세션 타임존과 무관하게 UTC로 비교/기록
+# 대기/처리 중 작업 수와 실행 가능한(예약 시각이 지난) 가장 오래된 작업의 나이
+_DEPTH_SQL = """
+SELECT type, status, COUNT(*),
+       COALESCE(EXTRACT(EPOCH FROM (NOW() AT TIME ZONE 'UTC') - MIN(COALESCE(scheduled_at, created_at))
+                FILTER (WHERE scheduled_at IS NULL OR scheduled_at <= (NOW() AT TIME ZONE 'UTC'))), 0)
+FROM jobqueue
+WHERE status IN ('pending', 'processing')
+GROUP BY type, status
+"""
+
+
 class LocalDBQueue:
     def enqueue(self, type: str, payload: Dict[str, Any]) -> int:
-        with Session(engine) as db:
+        with Session(get_engine()) as db:
             job = JobQueue(type=type, payload=payload, status="pending")
             db.add(job)
             db.commit()
@@ -20,28 +40,37 @@ class LocalDBQueue:
             return int(job.id)
 
     def dequeue(self) -> Optional[Dict[str, Any]]:
-        # Postgres 전용: NOW() 기준으로 pending 중 하나를 잡아서 processing으로 마킹
-        with engine.begin() as conn:
+        # Postgres 전용: 현재 시각(UTC) 기준으로 pending 중 하나를 잡아서 processing으로 마킹
+        with get_engine().begin() as conn:
             row = conn.execute(text(
                 """
                 UPDATE jobqueue
-                SET status='processing', updated_at=NOW()
+                SET status='processing', updated_at=(NOW() AT TIME ZONE 'UTC')
                 WHERE id = (
                   SELECT id FROM jobqueue
-                  WHERE status='pending' AND (scheduled_at IS NULL OR scheduled_at <= NOW())
+                  WHERE status='pending' AND (scheduled_at IS NULL OR scheduled_at <= (NOW() AT TIME ZONE 'UTC'))
                   ORDER BY id ASC
                   FOR UPDATE SKIP LOCKED
                   LIMIT 1
                 )
-                RETURNING id, type, payload
+                RETURNING id, type, payload, attempts,
+                          EXTRACT(EPOCH FROM (NOW() AT TIME ZONE 'UTC') - COALESCE(scheduled_at, created_at))
                 """
             )).fetchone()
         if not row:
             return None
-        return {"id": int(row[0]), "type": row[1], "payload": row[2]}
+        job_wait_seconds.labels(type=row[1]).observe(max(0.0, float(row[4] or 0)))
+        return {"id": int(row[0]), "type": row[1], "payload": row[2], "attempts": int(row[3] or 0)}
+
+    def get(self, job_id: int) -> Optional[Dict[str, Any]]:
+        with Session(get_engine()) as db:
+            job = db.get(JobQueue, job_id)
+            if not job:
+                return None
+            return {"id": int(job.id), "type": job.type, "status": job.status, "attempts": job.attempts, "payload": job.payload}
 
     def ack(self, job_id: int) -> None:
-        with Session(engine) as db:
+        with Session(get_engine()) as db:
             job = db.get(JobQueue, job_id)
             if job:
                 job.status = "done"
@@ -50,7 +79,7 @@ class LocalDBQueue:
                 db.commit()
 
     def fail(self, job_id: int, retryable: bool = True) -> None:
-        with Session(engine) as db:
+        with Session(get_engine()) as db:
             job = db.get(JobQueue, job_id)
             if job:
                 job.attempts += 1
@@ -60,3 +89,43 @@ class LocalDBQueue:
                 db.commit()
 
 
+class QueueDepthCollector(Collector):
+    """작업 유형/상태별 큐 깊이와 가장 오래된 실행 가능 작업의 나이(초).
+
+    스크레이프마다 DB를 치지 않도록 결과를 max_age_seconds 동안 재사용한다.
+    큐 전체 값이라 한 프로세스(워커)에서만 등록한다.
+    """
+
+    def __init__(self, max_age_seconds: float = 15.0):
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        self._rows: List[Tuple[str, str, int, float]] = []
+        self._fetched_at = float("-inf")
+
+    def describe(self):
+        # 등록 시 collect()(= DB 조회)가 호출되지 않도록
+        return []
+
+    def _load(self) -> List[Tuple[str, str, int, float]]:
+        with self._lock:
+            if time.monotonic() - self._fetched_at >= self.max_age_seconds:
+                with get_engine().connect() as conn:
+                    self._rows = [(r[0], r[1], int(r[2]), float(r[3])) for r in conn.execute(text(_DEPTH_SQL))]
+                self._fetched_at = time.monotonic()
+            return self._rows
+
+    def collect(self):
+        try:
+            rows = self._load()
+        except Exception as e:  # DB 불가가 나머지 지표 노출을 막지 않도록
+            logger.warning("queue depth collection failed: %s", e)
+            return
+        depth = GaugeMetricFamily("jobqueue_depth", "Queued jobs by type and status", labels=["type", "status"])
+        age = GaugeMetricFamily(
+            "jobqueue_oldest_age_seconds", "Age of the oldest runnable job", labels=["type", "status"]
+        )
+        for job_type, status, count, oldest in rows:
+            depth.add_metric([job_type, status], count)
+            age.add_metric([job_type, status], oldest)
+        yield depth
+        yield age
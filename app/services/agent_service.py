@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from sqlmodel import Session, select
 
 from app.core.config import get_settings
@@ -11,52 +11,42 @@ from app.models.entities import (
     InterviewAnswer,
     Experience,
     JobPosting,
+    JobPostingContent,
 )
 from app.services.rag_service import build_documents, index_documents, retrieve_context, generate_question_from_context
-from app.services.graph import build_interview_graph
 from app.services.graph.state import InterviewState
 from app.services.prompts import llm_eval_prompt
+from app.services.transcript_service import current_question
 
 
 def _llm_eval_prompt(question: str, answer: str) -> List[Dict[str, str]]:
     return llm_eval_prompt(question, answer)
 
 
+def prepare_first_question(exps: List[Experience], job: JobPosting, content: Optional[JobPostingContent] = None) -> str:
+    """RAG 인덱싱 후 첫 질문 생성. DB 세션을 사용하지 않으므로 커넥션을 잡지 않은 채 실행 가능."""
+    docs = build_documents(exps, job, content)
+    index_documents(docs, tenant_id=job.user_id)
+
+    goal = "선택된 경험과 공고 우대사항을 바탕으로 핵심 역량을 검증"
+    ctx = retrieve_context(
+        goal, top_k=6, tenant_id=job.user_id, content_hashes=[content.content_hash] if content is not None else None
+    )
+    return generate_question_from_context(goal, ctx, round_index=0)
+
+
 class InterviewAgent:
     def __init__(self, db: Session):
         self.db = db
         self.llm = get_llm()
         self.settings = get_settings()
 
-    def start_session(self, user_id: str, job_posting_id: int, selected_experience_ids: List[int]) -> tuple[int, str, int]:
-        job = self.db.get(JobPosting, job_posting_id)
-        if not job:
-            raise ValueError("Job posting not found")
-        exps = [self.db.get(Experience, i) for i in selected_experience_ids]
-        exps = [e for e in exps if e]
-
-        # Index docs for RAG
-        docs = build_documents(exps, job)
-        index_documents(docs)
-
-        sess = InterviewSession(user_id=user_id, job_posting_id=job_posting_id, selected_experience_ids=selected_experience_ids)
-        self.db.add(sess)
-        self.db.commit()
-        self.db.refresh(sess)
-
-        goal = "선택된 경험과 공고 우대사항을 바탕으로 핵심 역량을 검증"
-        ctx = retrieve_context(goal, top_k=6)
-        first_q = generate_question_from_context(goal, ctx, round_index=0)
-
-        q = InterviewQuestion(session_id=sess.id, round_index=0, question_type="main", text=first_q)
-        self.db.add(q)
-        self.db.commit()
-        self.db.refresh(q)
-
-        return sess.id, first_q, q.id
-
     def next_question(self, session_id: int) -> Dict[str, Any]:
-        # Return last created question in this session
+        # 세션의 현재 질문 포인터(전사)에서 바로 반환. 전사 도입 이전 세션만 질문 테이블을 조회
+        sess = self.db.get(InterviewSession, session_id)
+        ev = current_question(sess) if sess else None
+        if ev:
+            return {"question": ev["text"], "question_id": ev["id"], "question_type": ev["type"], "round_index": ev["round"]}
         q = self.db.exec(
             select(InterviewQuestion).where(InterviewQuestion.session_id == session_id).order_by(InterviewQuestion.id.desc())
         ).first()
@@ -81,8 +71,9 @@ class InterviewAgent:
             "last_answer_text": answer,
         }
 
-        app = build_interview_graph(self.db)
-        out: InterviewState = app.invoke(state)
+        from app.services.graph import get_interview_graph
+
+        out: InterviewState = get_interview_graph().invoke(state, config={"configurable": {"db": self.db}})
 
         rating = out.get("last_rating", "VAGUE")  # type: ignore[assignment]
         notes = out.get("notes", {"summary": "", "hints": []})
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.services.prompts import EVAL_AXES
+
+
+# 답변 1건 → 축별 1행씩 증분(answer_count +1, 누락 축이면 miss_count +1)
+_UPSERT_SQL = text(
+    """
+    INSERT INTO weakness_stat (user_id, axis, bucket_date, miss_count, answer_count)
+    SELECT :uid, t.axis, :day, t.miss, 1
+    FROM unnest(CAST(:axes AS text[]), CAST(:misses AS int[])) AS t(axis, miss)
+    ON CONFLICT (user_id, axis, bucket_date) DO UPDATE
+    SET miss_count = weakness_stat.miss_count + EXCLUDED.miss_count,
+        answer_count = weakness_stat.answer_count + EXCLUDED.answer_count
+    """
+)
+
+# 원본 답변에서 재계산(백필/보정용). missing_dims GIN 인덱스를 사용한다.
+_REBUILD_DELETE_SQL = "DELETE FROM weakness_stat{where}"
+_REBUILD_INSERT_SQL = """
+    INSERT INTO weakness_stat (user_id, axis, bucket_date, miss_count, answer_count)
+    SELECT s.user_id, ax.axis, a.created_at::date,
+           COUNT(*) FILTER (WHERE a.evaluation->'notes'->'missing_dims' ? ax.axis),
+           COUNT(*)
+    FROM interviewanswer a
+    JOIN interviewsession s ON s.id = a.session_id
+    CROSS JOIN unnest(CAST(:axes AS text[])) AS ax(axis)
+    WHERE a.evaluation->>'rating' IS NOT NULL{where}
+    GROUP BY s.user_id, ax.axis, a.created_at::date
+"""
+
+# 세션 삭제 시: 답변을 지우면서 그 답변들이 더했던 축별 카운트를 같은 문장에서 차감
+_DELETE_ANSWERS_SQL = text(
+    """
+    WITH gone AS (
+      DELETE FROM interviewanswer WHERE session_id = ANY(:sids)
+      RETURNING session_id, evaluation, created_at
+    ), dec AS (
+      SELECT o.user_id, ax.axis, g.created_at::date AS day,
+             COUNT(*) FILTER (WHERE g.evaluation->'notes'->'missing_dims' ? ax.axis) AS miss,
+             COUNT(*) AS total
+      FROM gone g
+      JOIN unnest(CAST(:sids AS int[]), CAST(:uids AS text[])) AS o(session_id, user_id) ON o.session_id = g.session_id
+      CROSS JOIN unnest(CAST(:axes AS text[])) AS ax(axis)
+      WHERE g.evaluation->>'rating' IS NOT NULL
+      GROUP BY o.user_id, ax.axis, g.created_at::date
+    )
+    UPDATE weakness_stat w
+    SET miss_count = GREATEST(0, w.miss_count - dec.miss),
+        answer_count = GREATEST(0, w.answer_count - dec.total)
+    FROM dec
+    WHERE w.user_id = dec.user_id AND w.axis = dec.axis AND w.bucket_date = dec.day
+    """
+)
+
+_SERIES_SQL = text(
+    """
+    SELECT axis, date_trunc(:bucket, bucket_date)::date AS bucket,
+           SUM(miss_count) AS miss_count, SUM(answer_count) AS answer_count
+    FROM weakness_stat
+    WHERE user_id = :uid AND bucket_date >= :since
+    GROUP BY axis, bucket
+    ORDER BY bucket
+    """
+)
+
+
+def record_answer_stats(db: Session, user_id: str, evaluation: Dict[str, Any], at: Optional[datetime] = None) -> None:
+    """답변 평가 1건을 집계에 반영. 호출 측 트랜잭션 안에서 실행되며 커밋은 호출 측이 담당."""
+    if not evaluation or not evaluation.get("rating"):
+        return
+    missing = set((evaluation.get("notes") or {}).get("missing_dims") or [])
+    db.execute(
+        _UPSERT_SQL,
+        {
+            "uid": user_id,
+            "day": (at or datetime.utcnow()).date(),
+            "axes": list(EVAL_AXES),
+            "misses": [1 if ax in missing else 0 for ax in EVAL_AXES],
+        },
+    )
+
+
+def delete_answers_with_stats(db: Session, session_owners: Dict[int, str]) -> None:
+    """세션들의 답변을 삭제하고 집계에서 해당 기여분을 뺀다. 커밋은 호출 측 담당(세션 삭제와 같은 트랜잭션)."""
+    if not session_owners:
+        return
+    sids = list(session_owners)
+    db.execute(_DELETE_ANSWERS_SQL, {"sids": sids, "uids": [session_owners[s] for s in sids], "axes": list(EVAL_AXES)})
+
+
+def rebuild_weakness_stats(db: Session, user_id: Optional[str] = None) -> None:
+    """집계 테이블을 원본 답변으로부터 다시 만든다(전체 또는 사용자 단위)."""
+    params: Dict[str, Any] = {"axes": list(EVAL_AXES)}
+    if user_id is not None:
+        params["uid"] = user_id
+    db.execute(text(_REBUILD_DELETE_SQL.format(where=" WHERE user_id = :uid" if user_id is not None else "")), params)
+    db.execute(text(_REBUILD_INSERT_SQL.format(where=" AND s.user_id = :uid" if user_id is not None else "")), params)
+    db.commit()
+
+
+async def get_weaknesses(session: AsyncSession, user_id: str, days: int = 90, bucket: str = "week") -> Dict[str, Any]:
+    """축별 누락률 요약과 기간별 추이. 비용은 답변 이력 크기가 아니라 (축 수 × 기간 버킷 수)에 비례."""
+    since = date.today() - timedelta(days=days)
+    rows = (await session.execute(_SERIES_SQL, {"uid": user_id, "since": since, "bucket": bucket})).all()
+
+    series: Dict[str, List[Dict[str, Any]]] = {ax: [] for ax in EVAL_AXES}
+    totals: Dict[str, List[int]] = {ax: [0, 0] for ax in EVAL_AXES}
+    for r in rows:
+        miss, total = int(r.miss_count), int(r.answer_count)
+        series.setdefault(r.axis, []).append(
+            {"bucket": r.bucket.isoformat(), "miss_count": miss, "answer_count": total, "miss_rate": round(miss / total, 3) if total else 0.0}
+        )
+        t = totals.setdefault(r.axis, [0, 0])
+        t[0] += miss
+        t[1] += total
+
+    axes = [
+        {"axis": ax, "miss_count": m, "answer_count": n, "miss_rate": round(m / n, 3) if n else 0.0}
+        for ax, (m, n) in totals.items()
+    ]
+    axes.sort(key=lambda x: x["miss_rate"], reverse=True)
+    return {"days": days, "bucket": bucket, "axes": axes, "series": series}
+
+
+__all__ = ["record_answer_stats", "delete_answers_with_stats", "rebuild_weakness_stats", "get_weaknesses"]
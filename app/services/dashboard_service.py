@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from sqlalchemy import text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+
+
+# 사용자별 요약 캐시(프로세스 내). 쓰기 경로에서 invalidate_dashboard_summary로 무효화하고,
+# 다른 프로세스에서 발생한 변경은 짧은 TTL로 수렴시킨다.
+_summary_cache: TTLCache[Dict[str, Any]] = TTLCache(
+    max_entries=get_settings().dashboard_cache_max_entries,
+    ttl_seconds=get_settings().dashboard_cache_ttl_seconds,
+)
+
+# 카운트 3종 + 최근 세션 5건을 한 번의 왕복으로 조회
+_SUMMARY_SQL = text(
+    """
+    SELECT
+      (SELECT COUNT(*) FROM experience WHERE user_id = :uid) AS experiences,
+      (SELECT COUNT(*) FROM jobposting WHERE user_id = :uid) AS jobs,
+      (SELECT COUNT(*) FROM interviewsession WHERE user_id = :uid) AS sessions,
+      (
+        SELECT COALESCE(json_agg(r ORDER BY r.id DESC), '[]'::json)
+        FROM (
+          SELECT id, job_posting_id, status, current_round AS round, created_at
+          FROM interviewsession
+          WHERE user_id = :uid
+          ORDER BY id DESC
+          LIMIT 5
+        ) r
+      ) AS recent
+    """
+)
+
+
+async def get_dashboard_summary(session: AsyncSession, user_id: str) -> Dict[str, Any]:
+    cached = _summary_cache.get(user_id)
+    if cached is not None:
+        return cached
+    row = (await session.execute(_SUMMARY_SQL, {"uid": user_id})).one()
+    data = {
+        "experiences": int(row.experiences),
+        "jobs": int(row.jobs),
+        "sessions": int(row.sessions),
+        "recent": row.recent or [],
+    }
+    _summary_cache.set(user_id, data)
+    return data
+
+
+def invalidate_dashboard_summary(user_id: str | None) -> None:
+    if user_id is not None:
+        _summary_cache.pop(str(user_id))
+
+
+__all__ = ["get_dashboard_summary", "invalidate_dashboard_summary"]
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+from app.core.vectorstore import delete_by_meta
+from app.services.analytics_service import delete_answers_with_stats
+from app.services.job_content_service import delete_orphan_contents
+from app.services.dashboard_service import invalidate_dashboard_summary
+
+
+# 세션 하위 테이블. ORM 로딩 없이 집합 단위 DELETE로 정리한다(답변은 약점 집계 차감과 함께 별도 처리).
+_SESSION_CHILD_TABLES = ("interviewquestion", "feedbackreport")
+
+
+def _owner_clause(user_ids: Optional[Sequence[str]]) -> str:
+    return " AND user_id = ANY(:uids)" if user_ids is not None else ""
+
+
+def _params(ids: Sequence[int], user_ids: Optional[Sequence[str]]) -> Dict[str, object]:
+    params: Dict[str, object] = {"ids": list(ids)}
+    if user_ids is not None:
+        params["uids"] = list(user_ids)
+    return params
+
+
+def _delete_vectors(db: Session, key: str, rows: Sequence[Any]) -> None:
+    # 소유자(테넌트)별로 나눠 지워 해당 파티션만 스캔하게 한다. rows: (id, user_id, ...)
+    by_owner: Dict[str, List[int]] = defaultdict(list)
+    for r in rows:
+        by_owner[r[1]].append(r[0])
+    for owner, ids in by_owner.items():
+        delete_by_meta(db, key, ids, tenant_id=owner)
+
+
+def _invalidate(owner_ids: Iterable[str]) -> None:
+    for uid in set(owner_ids):
+        invalidate_dashboard_summary(uid)
+
+
+def delete_sessions(db: Session, session_ids: Sequence[int], user_ids: Optional[Sequence[str]] = None) -> List[int]:
+    """면접 세션과 답변/질문/피드백 리포트를 하나의 트랜잭션에서 삭제.
+
+    user_ids가 주어지면 해당 소유자의 세션만 대상. 실제 삭제된 세션 id 목록을 반환한다.
+    """
+    if not session_ids:
+        return []
+    rows = db.execute(
+        text(f"DELETE FROM interviewsession WHERE id = ANY(:ids){_owner_clause(user_ids)} RETURNING id, user_id"),
+        _params(session_ids, user_ids),
+    ).all()
+    deleted = [r[0] for r in rows]
+    if deleted:
+        # 답변 삭제 + weakness_stat 차감(증분 집계가 삭제된 답변을 계속 세지 않도록)
+        delete_answers_with_stats(db, {r[0]: r[1] for r in rows})
+        for table in _SESSION_CHILD_TABLES:
+            db.execute(text(f"DELETE FROM {table} WHERE session_id = ANY(:ids)"), {"ids": deleted})
+    db.commit()
+    _invalidate(r[1] for r in rows)
+    return deleted
+
+
+def delete_job_postings(db: Session, job_ids: Sequence[int], user_ids: Optional[Sequence[str]] = None) -> List[int]:
+    """공고와 해당 공고에서 파생된 벡터(레거시 meta.job_posting_id)를 함께 삭제.
+
+    공유 본문은 참조가 0이 된 경우에만 본문/임베딩(meta.content_hash)까지 삭제한다.
+    """
+    if not job_ids:
+        return []
+    rows = db.execute(
+        text(f"DELETE FROM jobposting WHERE id = ANY(:ids){_owner_clause(user_ids)} RETURNING id, user_id, content_hash"),
+        _params(job_ids, user_ids),
+    ).all()
+    deleted = [r[0] for r in rows]
+    _delete_vectors(db, "job_posting_id", rows)
+    delete_orphan_contents(db, (r[2] for r in rows))
+    db.commit()
+    _invalidate(r[1] for r in rows)
+    return deleted
+
+
+def delete_experiences(db: Session, exp_ids: Sequence[int], user_ids: Optional[Sequence[str]] = None) -> List[int]:
+    """경험과 해당 경험에서 파생된 벡터(meta.experience_id)를 함께 삭제."""
+    if not exp_ids:
+        return []
+    rows = db.execute(
+        text(f"DELETE FROM experience WHERE id = ANY(:ids){_owner_clause(user_ids)} RETURNING id, user_id"),
+        _params(exp_ids, user_ids),
+    ).all()
+    deleted = [r[0] for r in rows]
+    _delete_vectors(db, "experience_id", rows)
+    db.commit()
+    _invalidate(r[1] for r in rows)
+    return deleted
+
+
+__all__ = ["delete_sessions", "delete_job_postings", "delete_experiences"]
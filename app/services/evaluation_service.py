@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import json
+import logging
+import re
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from pydantic import ValidationError
+
+from app.core.llm import get_llm
+from app.models.schemas import AnswerEvaluation, EvaluationNotes
+from app.services.prompts import EVAL_AXES, llm_eval_prompt
+
+
+logger = logging.getLogger(__name__)
+
+# OpenAI structured output(JSON schema, strict). rating을 첫 필드로 두어 스트리밍 시 가장 먼저 도착하게 하고,
+# 라우팅/피드백에 필요한 필드만 포함해 출력 토큰을 최소화한다.
+EVAL_RESPONSE_FORMAT: Dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "answer_evaluation",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "rating": {"type": "string", "enum": ["GOOD", "VAGUE", "OFF_TOPIC"]},
+                "notes": {
+                    "type": "object",
+                    "properties": {
+                        "missing_dims": {"type": "array", "items": {"type": "string", "enum": list(EVAL_AXES)}},
+                        "hints": {"type": "array", "items": {"type": "string"}},
+                        "summary": {"type": "string"},
+                    },
+                    "required": ["missing_dims", "hints", "summary"],
+                    "additionalProperties": False,
+                },
+            },
+            "required": ["rating", "notes"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+_RATING_RE = re.compile(r'"rating"\s*:\s*"(GOOD|VAGUE|OFF_TOPIC)"')
+_JSON_OBJECT_RE = re.compile(r"\{[\s\S]*\}")
+
+
+def parse_evaluation(raw: str) -> AnswerEvaluation:
+    """평가 응답 파싱.
+
+    1) 빠른 경로: 구조화 출력이므로 그대로 pydantic 검증
+    2) 느린 경로: 본문에서 JSON 객체 추출 후 검증(구조화 출력 미지원 모델 대비)
+    3) 최후: rating 토큰만이라도 회수, 없으면 VAGUE
+    """
+    try:
+        return AnswerEvaluation.model_validate_json(raw)
+    except ValidationError:
+        pass
+    try:
+        m = _JSON_OBJECT_RE.search(raw)
+        return AnswerEvaluation.model_validate(json.loads(m.group(0) if m else raw))
+    except (ValueError, ValidationError):
+        pass
+    m = _RATING_RE.search(raw)
+    logger.warning("evaluation parse failed (rating=%s)", m.group(1) if m else None)
+    return AnswerEvaluation(rating=m.group(1) if m else "VAGUE", notes=EvaluationNotes(summary=raw))
+
+
+def evaluate_answer(question: str, answer: str) -> AnswerEvaluation:
+    raw = get_llm().chat(llm_eval_prompt(question, answer), call_site="eval", response_format=EVAL_RESPONSE_FORMAT)
+    return parse_evaluation(raw)
+
+
+def stream_evaluation(question: str, answer: str) -> Iterator[Tuple[str, Any]]:
+    """평가를 스트리밍하며 이벤트를 낸다.
+
+    - ("chunk", str): 평가 응답 토큰
+    - ("rating", str): rating 값이 확정되는 즉시 1회 (라우팅 조기 결정용)
+    - ("result", AnswerEvaluation): 스트림 종료 후 최종 결과
+    """
+    buf: list[str] = []
+    rating: Optional[str] = None
+    messages = llm_eval_prompt(question, answer)
+    for chunk in get_llm().chat_stream(messages, call_site="eval", response_format=EVAL_RESPONSE_FORMAT):
+        buf.append(chunk)
+        yield "chunk", chunk
+        if rating is None:
+            m = _RATING_RE.search("".join(buf))
+            if m:
+                rating = m.group(1)
+                yield "rating", rating
+    result = parse_evaluation("".join(buf))
+    if rating is None:
+        yield "rating", result.rating
+    yield "result", result
+
+
+__all__ = ["EVAL_RESPONSE_FORMAT", "parse_evaluation", "evaluate_answer", "stream_evaluation"]
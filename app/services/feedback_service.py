@@ -1,35 +1,67 @@
 from __future__ import annotations
 
+import logging
 import time
 from datetime import datetime
 from typing import Dict, Any, List
-from sqlmodel import Session, select
+from sqlmodel import Session
 
+from app.core.config import get_settings
 from app.core.llm import get_llm
 from app.models.db import get_session
-from app.models.entities import InterviewSession, InterviewAnswer, InterviewQuestion, FeedbackReport
-
-
-def _feedback_prompt(transcript: List[Dict[str, str]]) -> str:
-    """면접 전사와 평가 결과를 종합한 피드백 프롬프트"""
-    lines = []
-    for t in transcript:
-        lines.append(f"Q({t['round']},{t['type']}): {t['question']}")
-        lines.append(f"A: {t['answer']}")
-        if t.get('evaluation'):
-            eval_data = t['evaluation']
-            lines.append(f"평가: {eval_data.get('rating', 'N/A')}")
-            if eval_data.get('notes'):
-                notes = eval_data['notes']
-                if notes.get('missing_dims'):
-                    lines.append(f"부족한 요소: {', '.join(notes['missing_dims'])}")
-                if notes.get('hints'):
-                    lines.append(f"개선 힌트: {', '.join(notes['hints'])}")
-        lines.append("---")
-    
+from app.models.entities import InterviewSession, FeedbackReport
+from app.services.prompt_budget import compact_transcript, report_prompt_size
+from app.services.transcript_service import load_transcript
+
+
+logger = logging.getLogger(__name__)
+
+
+def _render_turn(t: Dict[str, Any]) -> str:
+    lines = [f"Q({t['round']},{t['type']}): {t['question']}", f"A: {t['answer']}"]
+    if t.get('evaluation'):
+        eval_data = t['evaluation']
+        lines.append(f"평가: {eval_data.get('rating', 'N/A')}")
+        if eval_data.get('notes'):
+            notes = eval_data['notes']
+            if notes.get('missing_dims'):
+                lines.append(f"부족한 요소: {', '.join(notes['missing_dims'])}")
+            if notes.get('hints'):
+                # 동일 힌트 반복 제거(순서 유지)
+                lines.append(f"개선 힌트: {', '.join(dict.fromkeys(notes['hints']))}")
+    lines.append("---")
     return "\n".join(lines)
 
 
+def _feedback_transcript(db: Session, sess: InterviewSession) -> List[Dict[str, Any]]:
+    """세션 전사(비정규화 컬럼)를 피드백 입력 형태로 변환. 미응답 문항은 자리표시 값으로 채운다."""
+    return [
+        {
+            "round": t["round"],
+            "type": t["type"],
+            "question": t["question"],
+            "answer": t["answer"] if t["answer"] is not None else "(no answer)",
+            "evaluation": t["evaluation"] or {},
+        }
+        for t in load_transcript(db, sess)
+    ]
+
+
+def _feedback_prompt(transcript: List[Dict[str, Any]]) -> str:
+    """면접 전사와 평가 결과를 종합한 피드백 프롬프트.
+
+    최근 문항은 원문 그대로, 오래된 문항은 한 줄 요약으로 압축해
+    prompt_transcript_budget_tokens 안에 맞춘다.
+    """
+    settings = get_settings()
+    return compact_transcript(
+        transcript,
+        _render_turn,
+        budget_tokens=settings.prompt_transcript_budget_tokens,
+        keep_recent=settings.prompt_transcript_recent_turns,
+    )
+
+
 def _project_improvement_prompt(transcript: List[Dict[str, str]], project_context: str = "") -> str:
     """프로젝트 기반 개선 제안 프롬프트"""
     context_info = f"프로젝트 컨텍스트: {project_context}\n\n" if project_context else ""
@@ -57,21 +89,7 @@ def generate_feedback(db: Session, session_id: int) -> Dict[str, Any]:
     if not sess:
         raise ValueError("Session not found")
 
-    q_list = db.exec(select(InterviewQuestion).where(InterviewQuestion.session_id == session_id).order_by(InterviewQuestion.id.asc())).all()
-    a_map = {a.question_id: a for a in db.exec(select(InterviewAnswer).where(InterviewAnswer.session_id == session_id)).all()}
-
-    transcript = []
-    for q in q_list:
-        a = a_map.get(q.id)
-        transcript.append(
-            {
-                "round": q.round_index,
-                "type": q.question_type,
-                "question": q.text,
-                "answer": a.answer_text if a else "(no answer)",
-                "evaluation": a.evaluation if a else {},
-            }
-        )
+    transcript = _feedback_transcript(db, sess)
 
     # 1. 종합 피드백 생성 (질문별 평가 결과 종합)
     sys_overall = (
@@ -84,10 +102,12 @@ def generate_feedback(db: Session, session_id: int) -> Dict[str, Any]:
         + "\n\n형식(JSON): {\"overall\":\"...\", \"strengths\":[\"\"], \"areas\":[\"\"], \"detailed_analysis\":\"...\"}"
     )
     
-    raw_overall = llm.chat([
+    overall_messages = [
         {"role": "system", "content": sys_overall},
         {"role": "user", "content": usr_overall},
-    ])
+    ]
+    report_prompt_size("feedback", overall_messages)
+    raw_overall = llm.chat(overall_messages, call_site="feedback")
 
     # 2. 프로젝트 개선 제안 생성
     sys_project = (
@@ -96,10 +116,12 @@ def generate_feedback(db: Session, session_id: int) -> Dict[str, Any]:
     )
     usr_project = _project_improvement_prompt(transcript)
     
-    raw_project = llm.chat([
+    project_messages = [
         {"role": "system", "content": sys_project},
         {"role": "user", "content": usr_project},
-    ])
+    ]
+    report_prompt_size("feedback_project", project_messages)
+    raw_project = llm.chat(project_messages, call_site="feedback")
 
     # 3. 결과 파싱 및 통합
     import json
@@ -127,7 +149,7 @@ def generate_feedback(db: Session, session_id: int) -> Dict[str, Any]:
         parsed_project = json.loads(raw_project)
         project_suggestions = parsed_project
     except Exception as e:
-        print(f"피드백 파싱 실패: {e}")
+        logger.warning("피드백 파싱 실패: %s", e)
         pass
 
     return {
@@ -141,22 +163,10 @@ def generate_feedback(db: Session, session_id: int) -> Dict[str, Any]:
 
 def collect_interview_data(db: Session, session_id: int) -> List[Dict[str, Any]]:
     """면접 데이터 수집"""
-    q_list = db.exec(select(InterviewQuestion).where(InterviewQuestion.session_id == session_id).order_by(InterviewQuestion.id.asc())).all()
-    a_map = {a.question_id: a for a in db.exec(select(InterviewAnswer).where(InterviewAnswer.session_id == session_id)).all()}
-
-    transcript = []
-    for q in q_list:
-        a = a_map.get(q.id)
-        transcript.append(
-            {
-                "round": q.round_index,
-                "type": q.question_type,
-                "question": q.text,
-                "answer": a.answer_text if a else "(no answer)",
-                "evaluation": a.evaluation if a else {},
-            }
-        )
-    return transcript
+    sess = db.get(InterviewSession, session_id)
+    if not sess:
+        raise ValueError("Session not found")
+    return _feedback_transcript(db, sess)
 
 
 def prepare_feedback_prompt(transcript: List[Dict[str, Any]]) -> List[Dict[str, str]]:
@@ -168,10 +178,12 @@ def prepare_feedback_prompt(transcript: List[Dict[str, Any]]) -> List[Dict[str,
         _feedback_prompt(transcript)
         + "\n\n형식(JSON): {\"overall\":\"...\", \"strengths\":[\"\"], \"areas\":[\"\"], \"model_answer\":\"...\"}"
     )
-    return [
+    messages = [
         {"role": "system", "content": sys},
         {"role": "user", "content": usr},
     ]
+    report_prompt_size("feedback", messages)
+    return messages
 
 
 def parse_feedback_response(raw_feedback: str) -> Dict[str, Any]:
@@ -209,19 +221,19 @@ def parse_feedback_response(raw_feedback: str) -> Dict[str, Any]:
 
 def generate_feedback_async(session_id: int, report_id: int):
     """백그라운드에서 실행되는 비동기 피드백 생성"""
-    print(f"🚀 피드백 생성 시작: session_id={session_id}, report_id={report_id}")
+    logger.info("피드백 생성 시작: session_id=%s report_id=%s", session_id, report_id)
     
     # 새로운 데이터베이스 세션 생성
-    from app.models.db import engine
-    with Session(engine) as db:
+    from app.models.db import get_engine
+    with Session(get_engine()) as db:
         report = db.get(FeedbackReport, report_id)
         if not report:
-            print(f"❌ 리포트를 찾을 수 없습니다: {report_id}")
+            logger.warning("리포트를 찾을 수 없습니다: %s", report_id)
             return
         
         try:
             # 1. 상태 업데이트: processing
-            print("📊 상태 업데이트: processing")
+            logger.debug("report %s: processing", report_id)
             report.status = "processing"
             report.progress = 10
             db.add(report)
@@ -229,7 +241,7 @@ def generate_feedback_async(session_id: int, report_id: int):
             time.sleep(1)  # 사용자가 상태 변화를 볼 수 있도록
             
             # 2. 데이터 수집 (30%)
-            print("📋 면접 데이터 수집 중...")
+            logger.debug("report %s: collecting transcript", report_id)
             transcript = collect_interview_data(db, session_id)
             report.progress = 30
             db.add(report)
@@ -237,7 +249,7 @@ def generate_feedback_async(session_id: int, report_id: int):
             time.sleep(1)
             
             # 3. LLM 프롬프트 준비 (50%)
-            print("🛠️ 프롬프트 준비 중...")
+            logger.debug("report %s: preparing prompt", report_id)
             prompt = prepare_feedback_prompt(transcript)
             report.progress = 50
             db.add(report)
@@ -245,26 +257,26 @@ def generate_feedback_async(session_id: int, report_id: int):
             time.sleep(1)
             
             # 4. LLM API 호출 (80%)
-            print("🤖 AI 피드백 생성 중...")
+            logger.debug("report %s: calling llm", report_id)
             llm = get_llm()
-            raw_feedback = llm.chat(prompt)
+            raw_feedback = llm.chat(prompt, call_site="feedback")
             report.progress = 80
             db.add(report)
             db.commit()
             time.sleep(1)
             
             # 5. 결과 파싱 및 저장 (100%)
-            print("✅ 피드백 완성 및 저장 중...")
+            logger.debug("report %s: saving", report_id)
             parsed_feedback = parse_feedback_response(raw_feedback)
             report.status = "completed"
             report.progress = 100
             report.report = parsed_feedback
             report.completed_at = datetime.utcnow()
             
-            print(f"🎉 피드백 생성 완료: session_id={session_id}")
+            logger.info("피드백 생성 완료: session_id=%s report_id=%s", session_id, report_id)
             
         except Exception as e:
-            print(f"❌ 피드백 생성 실패: {str(e)}")
+            logger.exception("피드백 생성 실패: session_id=%s report_id=%s", session_id, report_id)
             report.status = "failed"
             report.error_message = str(e)
         
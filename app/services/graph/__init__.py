@@ -1,6 +1,13 @@
 from .state import InterviewState
-from .interview_graph import build_interview_graph
 
-__all__ = ["InterviewState", "build_interview_graph"]
 
+def __getattr__(name):
+    # langgraph 임포트 비용이 커서 그래프 모듈은 실제 사용 시점에 로드
+    if name in {"build_interview_graph", "get_interview_graph"}:
+        from . import interview_graph
 
+        return getattr(interview_graph, name)
+    raise AttributeError(name)
+
+
+__all__ = ["InterviewState", "build_interview_graph", "get_interview_graph"]
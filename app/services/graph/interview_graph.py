@@ -1,16 +1,18 @@
 from __future__ import annotations
 
-from typing import Callable
+from functools import lru_cache
+from typing import Any, Callable
 
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, END
-from langgraph.checkpoint.memory import MemorySaver
-from sqlmodel import Session as DBSession
+from sqlmodel import Session as DBSession, select
 
+from app.core.metrics import graph_node_seconds
 from app.services.graph.state import InterviewState
-from app.services.rag_service import retrieve_context, generate_question_from_context
-from app.core.llm import get_llm
-from app.services.prompts import llm_eval_prompt
+from app.services.rag_service import retrieval_scope, retrieve_context, generate_question_from_context
+from app.services.evaluation_service import evaluate_answer
 from app.models.entities import InterviewSession, InterviewQuestion, InterviewAnswer
+from app.services.transcript_service import append_events, lock_session, question_event, record_answer
 
 
 def node_load_goal_and_context(state: InterviewState, db: DBSession) -> InterviewState:
@@ -18,7 +20,8 @@ def node_load_goal_and_context(state: InterviewState, db: DBSession) -> Intervie
     goal = (
         "다음 핵심 역량을 검증" if state.get("current_round", 0) > 0 else "선택된 경험과 공고 우대사항을 바탕으로 핵심 역량을 검증"
     )
-    ctx = retrieve_context(goal, top_k=6)
+    sess = db.get(InterviewSession, state["session_id"])
+    ctx = retrieve_context(goal, top_k=6, **(retrieval_scope(db, sess) if sess else {}))
     state["goal"] = goal
     state["context"] = ctx
     return state
@@ -27,21 +30,20 @@ def node_load_goal_and_context(state: InterviewState, db: DBSession) -> Intervie
 def node_save_answer_and_evaluate(state: InterviewState, db: DBSession) -> InterviewState:
     # 답변 저장 및 평가
     qid = state["last_question_id"]
-    messages = llm_eval_prompt(state["last_question_text"], state["last_answer_text"])
-    raw = get_llm().chat(messages)
-
-    import json, re
-
-    rating = "VAGUE"
-    notes = {"summary": raw, "hints": []}
-    try:
-        m = re.search(r"\{[\s\S]*\}", raw)
-        payload = m.group(0) if m else raw
-        parsed = json.loads(payload)
-        rating = parsed.get("rating", rating)
-        notes = parsed.get("notes", notes)
-    except Exception:
-        pass
+    existing = db.exec(
+        select(InterviewAnswer)
+        .where(InterviewAnswer.question_id == qid, InterviewAnswer.session_id == state["session_id"])
+        .limit(1)
+    ).first()
+    if existing is not None:
+        # 재시도(예: 질문 생성 실패 후 큐 재실행): 이미 저장·집계된 답변의 평가를 재사용하고 질문 생성만 다시
+        ev = existing.evaluation or {}
+        state["last_rating"] = ev.get("rating", "VAGUE")
+        state["notes"] = ev.get("notes") or {"summary": "", "hints": []}
+        return state
+    result = evaluate_answer(state["last_question_text"], state["last_answer_text"])
+    rating = result.rating
+    notes = result.notes.model_dump()
 
     ans = InterviewAnswer(
         session_id=state["session_id"],
@@ -49,8 +51,7 @@ def node_save_answer_and_evaluate(state: InterviewState, db: DBSession) -> Inter
         answer_text=state["last_answer_text"],
         evaluation={"rating": rating, "notes": notes},
     )
-    db.add(ans)
-    db.commit()
+    record_answer(db, ans)
 
     state["last_rating"] = rating
     state["notes"] = notes
@@ -84,7 +85,8 @@ def _decide_route(state: InterviewState, db: DBSession) -> str:
 
 
 def node_emit_question(state: InterviewState, db: DBSession, route: str) -> InterviewState:
-    sess = db.get(InterviewSession, state["session_id"])  # type: ignore[arg-type]
+    # 답변 저장과 경합하지 않도록 세션 행을 잠근 뒤 카운터/전사를 갱신
+    sess = lock_session(db, state["session_id"])  # type: ignore[arg-type]
     if route == "FOLLOW_UP":
         text = state.get("candidate_follow_up") or "조금 더 구체적으로 설명해주세요."
         q = InterviewQuestion(
@@ -107,6 +109,8 @@ def node_emit_question(state: InterviewState, db: DBSession, route: str) -> Inte
         )
 
     db.add(q)
+    db.flush()
+    append_events(sess, question_event(q))
     db.add(sess)
     db.commit()
     db.refresh(q)
@@ -118,20 +122,28 @@ def node_emit_question(state: InterviewState, db: DBSession, route: str) -> Inte
     return state
 
 
-def build_interview_graph(db: DBSession):
-    g = StateGraph(InterviewState)
+def _with_db(fn: Callable[..., Any], name: str | None = None) -> Callable[[InterviewState, RunnableConfig], Any]:
+    # 그래프는 한 번만 컴파일하고 DB 세션은 호출마다 config["configurable"]["db"]로 전달
+    # name이 있으면 노드 실행 시간을 graph_node_seconds{node=name}로 기록
+    def node(state: InterviewState, config: RunnableConfig):
+        if name is None:
+            return fn(state, config["configurable"]["db"])
+        with graph_node_seconds.labels(node=name).time():
+            return fn(state, config["configurable"]["db"])
 
-    # 래퍼로 DB 주입
-    def wrap(fn: Callable[[InterviewState, DBSession], InterviewState]):
-        return lambda s: fn(s, db)
+    return node
+
+
+def build_interview_graph():
+    g = StateGraph(InterviewState)
 
-    g.add_node("load_ctx", wrap(node_load_goal_and_context))
-    g.add_node("save_and_eval", wrap(node_save_answer_and_evaluate))
-    g.add_node("gen_follow_up", wrap(node_generate_follow_up))
-    g.add_node("gen_next_main", wrap(node_generate_next_main))
+    g.add_node("load_ctx", _with_db(node_load_goal_and_context, "load_ctx"))
+    g.add_node("save_and_eval", _with_db(node_save_answer_and_evaluate, "save_and_eval"))
+    g.add_node("gen_follow_up", _with_db(node_generate_follow_up, "gen_follow_up"))
+    g.add_node("gen_next_main", _with_db(node_generate_next_main, "gen_next_main"))
 
-    g.add_node("emit_follow_up", lambda s: node_emit_question(s, db, "FOLLOW_UP"))
-    g.add_node("emit_next_round", lambda s: node_emit_question(s, db, "NEXT_ROUND"))
+    g.add_node("emit_follow_up", _with_db(lambda s, db: node_emit_question(s, db, "FOLLOW_UP"), "emit_follow_up"))
+    g.add_node("emit_next_round", _with_db(lambda s, db: node_emit_question(s, db, "NEXT_ROUND"), "emit_next_round"))
 
     g.set_entry_point("load_ctx")
     g.add_edge("load_ctx", "save_and_eval")
@@ -141,19 +153,23 @@ def build_interview_graph(db: DBSession):
     g.add_edge("save_and_eval", "gen_next_main")
 
     # 간단 라우팅: gen_follow_up 이후 분기 (gen_next_main는 사이드 이펙트로 가정)
-    def route_decider(state: InterviewState):
+    def route_decider(state: InterviewState, db: DBSession):
         return "emit_follow_up" if _decide_route(state, db) == "FOLLOW_UP" else "emit_next_round"
 
     g.add_conditional_edges(
         "gen_follow_up",
-        route_decider,
+        _with_db(route_decider),
         {"emit_follow_up": "emit_follow_up", "emit_next_round": "emit_next_round"},
     )
 
     g.add_edge("emit_follow_up", END)
     g.add_edge("emit_next_round", END)
 
-    app = g.compile(checkpointer=MemorySaver())
-    return app
+    # 세션 상태는 DB가 원본이므로 체크포인터 없이 컴파일
+    return g.compile()
 
 
+@lru_cache
+def get_interview_graph():
+    """컴파일된 그래프(프로세스당 1회). 호출: invoke(state, config={"configurable": {"db": session}})"""
+    return build_interview_graph()
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.vectorstore import delete_by_meta
+from app.models.entities import JobPosting, JobPostingContent
+
+
+_WS_RE = re.compile(r"\s+")
+# 본문 해시별 트랜잭션 advisory 락 네임스페이스(attach와 고아 정리가 같은 해시에서 겹치지 않도록)
+_CONTENT_LOCK_NS = 72_410_042
+
+
+def content_hash(raw_text: str) -> str:
+    """공백 차이를 무시한 본문 해시(동일 공고를 여러 사용자가 등록해도 같은 값)."""
+    return hashlib.sha256(_WS_RE.sub(" ", raw_text).strip().encode("utf-8")).hexdigest()
+
+
+def _lock_content(db: Session, h: str) -> None:
+    # 커밋/롤백 시 자동 해제. 정리 쪽이 락을 쥔 채 지운 행은 대기 후 아래 INSERT가 다시 만든다
+    db.execute(text("SELECT pg_advisory_xact_lock(:ns, hashtext(:h))"), {"ns": _CONTENT_LOCK_NS, "h": h})
+
+
+def attach_content(db: Session, jp: JobPosting, raw_text: str, sections: Dict[str, Any]) -> str:
+    """공유 본문 행을 (없으면) 만들고 공고가 참조하게 한다. 커밋은 호출 측 담당(그때까지 해시 락 유지)."""
+    h = content_hash(raw_text)
+    _lock_content(db, h)
+    db.execute(
+        pg_insert(JobPostingContent.__table__)
+        .values(content_hash=h, raw_text=raw_text, sections=sections)
+        .on_conflict_do_nothing(index_elements=["content_hash"])
+    )
+    jp.content_hash = h
+    jp.raw_text = None
+    jp.sections = {}
+    return h
+
+
+def job_text(jp: JobPosting, content: Optional[JobPostingContent]) -> Tuple[Optional[str], Dict[str, Any]]:
+    """(raw_text, sections). 공유 본문이 있으면 그것을, 레거시 행이면 공고 행의 값을 사용."""
+    if content is not None:
+        return content.raw_text, content.sections or {}
+    return jp.raw_text, jp.sections or {}
+
+
+def load_content(db: Session, jp: JobPosting) -> Optional[JobPostingContent]:
+    return db.get(JobPostingContent, jp.content_hash) if jp.content_hash else None
+
+
+async def load_content_async(session: AsyncSession, jp: JobPosting) -> Optional[JobPostingContent]:
+    return await session.get(JobPostingContent, jp.content_hash) if jp.content_hash else None
+
+
+def load_contents(db: Session, hashes: Iterable[Optional[str]]) -> Dict[str, JobPostingContent]:
+    keys = sorted({h for h in hashes if h})
+    if not keys:
+        return {}
+    rows = db.exec(select(JobPostingContent).where(JobPostingContent.content_hash.in_(keys))).all()
+    return {c.content_hash: c for c in rows}
+
+
+def to_read_dict(jp: JobPosting, content: Optional[JobPostingContent]) -> Dict[str, Any]:
+    """API 응답용: 공유 본문을 합쳐 기존 JobPostingRead 형태를 유지."""
+    data = jp.model_dump()
+    data["raw_text"], data["sections"] = job_text(jp, content)
+    return data
+
+
+def delete_orphan_contents(db: Session, hashes: Iterable[Optional[str]]) -> List[str]:
+    """더 이상 어떤 공고도 참조하지 않는 본문과 그 임베딩(meta.content_hash)을 삭제. 커밋은 호출 측 담당."""
+    keys = sorted({h for h in hashes if h})
+    if not keys:
+        return []
+    # 아직 커밋되지 않은 attach가 있으면 끝날 때까지 대기(정렬 순서로 잡아 정리끼리 교착 방지).
+    # READ COMMITTED에서 아래 DELETE는 락 획득 이후 스냅샷이므로 방금 커밋된 참조를 본다
+    for h in keys:
+        _lock_content(db, h)
+    rows = db.execute(
+        text(
+            """
+            DELETE FROM jobpostingcontent c
+            WHERE c.content_hash = ANY(:hashes)
+              AND NOT EXISTS (SELECT 1 FROM jobposting j WHERE j.content_hash = c.content_hash)
+            RETURNING c.content_hash
+            """
+        ),
+        {"hashes": keys},
+    ).all()
+    orphaned = [r[0] for r in rows]
+    delete_by_meta(db, "content_hash", orphaned)
+    return orphaned
+
+
+__all__ = [
+    "content_hash",
+    "attach_content",
+    "job_text",
+    "load_content",
+    "load_content_async",
+    "load_contents",
+    "to_read_dict",
+    "delete_orphan_contents",
+]
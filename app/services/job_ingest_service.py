@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import asyncio
+import re
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from sqlmodel import Session
+
+from app.core.config import get_settings
+from app.models.entities import JobPosting
+from app.models.fetched_page import FetchedPage
+from app.services.job_content_service import attach_content
+
+
+_TRACKING_PARAMS = {"fbclid", "gclid", "igshid", "mc_cid", "mc_eid", "ref", "source"}
+_WS_RE = re.compile(r"\s+")
+
+
+class FetchError(Exception):
+    pass
+
+
+def parse_job_text(text: str) -> dict:
+    # 매우 단순한 휴리스틱 파서. 실서비스에서는 Section 헤더를 정교하게 인식하도록 개선 필요
+    sections = {"main": text}
+    for key in ["주요 업무", "자격 요건", "우대 사항", "우대사항", "책임", "요건"]:
+        if key in text:
+            sections_key = {
+                "주요 업무": "responsibilities",
+                "책임": "responsibilities",
+                "자격 요건": "requirements",
+                "요건": "requirements",
+                "우대 사항": "preferred",
+                "우대사항": "preferred",
+            }.get(key, key)
+            # 간단히 구간을 자르지는 않고, 전체 텍스트를 보존. 프롬프트에서 섹션 키 활용
+            sections[sections_key] = text
+    return sections
+
+
+def normalize_url(url: str) -> str:
+    """캐시 키용 URL 정규화: 스킴/호스트 소문자, 기본 포트·프래그먼트·추적 파라미터 제거, 쿼리 정렬."""
+    parts = urlsplit(url.strip())
+    scheme = (parts.scheme or "https").lower()
+    host = (parts.hostname or "").lower()
+    port = parts.port
+    netloc = host if port is None or (scheme, port) in {("http", 80), ("https", 443)} else f"{host}:{port}"
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((scheme, netloc, path, urlencode(query), ""))
+
+
+def extract_text(html: str) -> str:
+    """HTML 본문 텍스트 추출. selectolax(lexbor) → lxml → BeautifulSoup 순으로 사용 가능한 파서를 쓴다."""
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+
+        tree = LexborHTMLParser(html)
+        for node in tree.css("script, style, noscript, template"):
+            node.decompose()
+        root = tree.body or tree.root
+        text = root.text(separator=" ", strip=True) if root is not None else ""
+    except ImportError:
+        try:
+            import lxml.html
+
+            doc = lxml.html.fromstring(html)
+            for node in doc.xpath("//script|//style|//noscript|//template"):
+                node.drop_tree()
+            text = " ".join(doc.itertext())
+        except ImportError:
+            from bs4 import BeautifulSoup
+
+            soup = BeautifulSoup(html, "html.parser")
+            for node in soup(["script", "style", "noscript", "template"]):
+                node.decompose()
+            text = soup.get_text(" ", strip=True)
+    return _WS_RE.sub(" ", text).strip()
+
+
+def get_cached_page(db: Session, url: str, fresh_only: bool = True) -> Optional[FetchedPage]:
+    page = db.get(FetchedPage, normalize_url(url))
+    if page is None or not fresh_only:
+        return page
+    ttl = timedelta(seconds=get_settings().job_fetch_cache_ttl_seconds)
+    return page if datetime.utcnow() - page.fetched_at <= ttl else None
+
+
+async def _fetch(url: str, cached: Optional[FetchedPage]) -> Optional[Dict[str, Optional[str]]]:
+    """조건부 GET. 304면 None, 200이면 본문 텍스트와 검증자를 반환. 본문은 크기 상한까지만 스트리밍으로 읽는다."""
+    import httpx
+
+    settings = get_settings()
+    headers = {"User-Agent": settings.job_fetch_user_agent, "Accept": "text/html,application/xhtml+xml"}
+    if cached is not None:
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+    timeout = httpx.Timeout(settings.job_fetch_timeout_seconds)
+    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True, max_redirects=5) as client:
+        async with client.stream("GET", url, headers=headers) as r:
+            if r.status_code == 304 and cached is not None:
+                return None
+            if r.status_code >= 400:
+                raise FetchError(f"HTTP {r.status_code}")
+            buf = bytearray()
+            async for chunk in r.aiter_bytes():
+                buf.extend(chunk)
+                if len(buf) > settings.job_fetch_max_bytes:
+                    raise FetchError(f"Response exceeds {settings.job_fetch_max_bytes} bytes")
+            html = bytes(buf).decode(r.encoding or "utf-8", errors="replace")
+            return {"text": extract_text(html), "etag": r.headers.get("etag"), "last_modified": r.headers.get("last-modified")}
+
+
+async def fetch_page(db: Session, url: str) -> FetchedPage:
+    """공유 캐시를 거쳐 페이지 텍스트를 얻는다(신선하면 재요청 없음, 오래되면 조건부 재요청)."""
+    key = normalize_url(url)
+    cached = db.get(FetchedPage, key)
+    ttl = timedelta(seconds=get_settings().job_fetch_cache_ttl_seconds)
+    if cached is not None and datetime.utcnow() - cached.fetched_at <= ttl:
+        return cached
+
+    result = await _fetch(url, cached)
+    if result is None:
+        cached.fetched_at = datetime.utcnow()
+        page = cached
+    else:
+        if not result["text"]:
+            raise FetchError("No text content")
+        page = cached or FetchedPage(url_key=key, url=url, text="")
+        page.text = result["text"]
+        page.etag = result["etag"]
+        page.last_modified = result["last_modified"]
+        page.fetched_at = datetime.utcnow()
+    db.add(page)
+    db.commit()
+    db.refresh(page)
+    return page
+
+
+def apply_text(db: Session, jp: JobPosting, text: str) -> None:
+    """본문을 공유 콘텐츠로 연결(동일 본문은 사용자 간 한 행만 저장)."""
+    attach_content(db, jp, text, parse_job_text(text))
+    jp.fetch_status = "ready"
+    jp.fetch_error = None
+
+
+def ingest_job_posting(db: Session, job_posting_id: int) -> None:
+    """큐 작업 본체: URL 공고를 가져와 공고 행을 채운다. 실패 시 fetch_status=failed로 남긴다."""
+    jp = db.get(JobPosting, job_posting_id)
+    if not jp or not jp.url:
+        return
+    try:
+        page = asyncio.run(fetch_page(db, jp.url))
+    except Exception as e:
+        db.rollback()
+        jp = db.get(JobPosting, job_posting_id)
+        if jp:
+            jp.fetch_status = "failed"
+            jp.fetch_error = str(e)[:500]
+            db.add(jp)
+            db.commit()
+        return
+    apply_text(db, jp, page.text)
+    db.add(jp)
+    db.commit()
+
+
+__all__ = [
+    "FetchError",
+    "parse_job_text",
+    "normalize_url",
+    "extract_text",
+    "get_cached_page",
+    "fetch_page",
+    "apply_text",
+    "ingest_job_posting",
+]
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import logging
+import random
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from app.core.config import get_settings
+
+
+logger = logging.getLogger(__name__)
+
+# 채팅 포맷 오버헤드(role/구분자)를 메시지당 대략적으로 반영
+_MESSAGE_OVERHEAD_TOKENS = 4
+
+
+@lru_cache
+def _get_encoder() -> Optional[Any]:
+    """로컬 토크나이저(tiktoken). 설치/로드 실패 시 None → 휴리스틱 사용."""
+    try:
+        import tiktoken
+    except Exception:
+        return None
+    settings = get_settings()
+    try:
+        return tiktoken.encoding_for_model(settings.llm_model)
+    except Exception:
+        pass
+    try:
+        return tiktoken.get_encoding(settings.prompt_tokenizer_encoding)
+    except Exception:
+        return None
+
+
+def count_tokens(text: str) -> int:
+    if not text:
+        return 0
+    enc = _get_encoder()
+    if enc is not None:
+        return len(enc.encode(text, disallowed_special=()))
+    # 휴리스틱: ASCII 4자당 1토큰, 한글 등 비ASCII는 1자당 1토큰(보수적)
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return ascii_chars // 4 + (len(text) - ascii_chars) + 1
+
+
+def count_message_tokens(messages: List[Dict[str, str]]) -> int:
+    return sum(count_tokens(m.get("content", "")) + _MESSAGE_OVERHEAD_TOKENS for m in messages)
+
+
+def truncate_to_tokens(text: str, max_tokens: int, suffix: str = "…") -> str:
+    if max_tokens <= 0 or not text:
+        return ""
+    if count_tokens(text) <= max_tokens:
+        return text
+    enc = _get_encoder()
+    if enc is not None:
+        ids = enc.encode(text, disallowed_special=())
+        return enc.decode(ids[: max(0, max_tokens - 1)]).rstrip() + suffix
+    # 휴리스틱 모드: 이분 탐색으로 예산에 맞는 최대 길이 선택
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if count_tokens(text[:mid]) <= max_tokens - 1:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo].rstrip() + suffix
+
+
+def pack_context(
+    chunks: Sequence[str],
+    budget_tokens: int,
+    scores: Optional[Sequence[float]] = None,
+    max_chunks: Optional[int] = None,
+    separator: str = "\n\n",
+) -> List[str]:
+    """관련도 순으로 예산 안에 들어가는 청크만 채운다.
+
+    scores가 없으면 입력 순서(retrieve_context의 재랭킹 순서)를 관련도로 간주한다.
+    예산을 넘는 청크는 건너뛰고 다음 청크를 시도하며, 첫 청크조차 넘치면 잘라서 넣는다.
+    """
+    order = list(range(len(chunks)))
+    if scores is not None:
+        order.sort(key=lambda i: scores[i], reverse=True)
+
+    sep_tokens = count_tokens(separator)
+    packed: List[str] = []
+    used = 0
+    for i in order:
+        if max_chunks is not None and len(packed) >= max_chunks:
+            break
+        chunk = chunks[i]
+        if not chunk:
+            continue
+        cost = count_tokens(chunk) + (sep_tokens if packed else 0)
+        if used + cost <= budget_tokens:
+            packed.append(chunk)
+            used += cost
+        elif not packed:
+            packed.append(truncate_to_tokens(chunk, budget_tokens))
+            used = budget_tokens
+    return packed
+
+
+def _summarize_turn(t: Dict[str, Any], question_tokens: int) -> str:
+    """오래된 문항을 한 줄로 압축: 질문 앞부분 + 평가 등급 + 부족 요소."""
+    ev = t.get("evaluation") or {}
+    notes = ev.get("notes") or {}
+    parts = [f"Q({t['round']},{t['type']}): {truncate_to_tokens(t['question'], question_tokens)}"]
+    if ev.get("rating"):
+        parts.append(f"평가: {ev['rating']}")
+    if notes.get("missing_dims"):
+        parts.append(f"부족: {', '.join(notes['missing_dims'])}")
+    return " | ".join(parts)
+
+
+def compact_transcript(
+    transcript: List[Dict[str, Any]],
+    render_turn: Callable[[Dict[str, Any]], str],
+    budget_tokens: int,
+    keep_recent: int,
+    summary_question_tokens: int = 40,
+) -> str:
+    """최근 keep_recent개 문항은 원문 그대로, 그 이전 문항은 한 줄 요약으로 압축한다.
+
+    그래도 예산을 넘으면 가장 오래된 요약부터 생략하고, 최근 문항 자체가 넘치면
+    각 문항을 균등 예산으로 잘라낸다.
+    """
+    recent = transcript[-keep_recent:] if keep_recent > 0 else []
+    older = transcript[: len(transcript) - len(recent)]
+
+    recent_blocks = [render_turn(t) for t in recent]
+    recent_cost = sum(count_tokens(b) for b in recent_blocks)
+    if recent_blocks and recent_cost > budget_tokens:
+        per_turn = max(1, budget_tokens // len(recent_blocks))
+        recent_blocks = [truncate_to_tokens(b, per_turn) for b in recent_blocks]
+        recent_cost = sum(count_tokens(b) for b in recent_blocks)
+
+    # 생략/요약 머리말 줄을 위한 여유분 확보
+    remaining = budget_tokens - recent_cost - count_tokens(f"(이전 {len(older)}개 문항 생략)\n[이전 문항 요약]\n---\n")
+    summaries: List[str] = []
+    # 최신 요약부터 채우고, 남는 예산이 없으면 그보다 오래된 문항은 생략
+    for t in reversed(older):
+        line = _summarize_turn(t, summary_question_tokens)
+        cost = count_tokens(line)
+        if cost > remaining:
+            break
+        summaries.append(line)
+        remaining -= cost
+    summaries.reverse()
+
+    lines: List[str] = []
+    dropped = len(older) - len(summaries)
+    if dropped:
+        lines.append(f"(이전 {dropped}개 문항 생략)")
+    if summaries:
+        lines.append("[이전 문항 요약]")
+        lines.extend(summaries)
+        lines.append("---")
+    lines.extend(recent_blocks)
+    return "\n".join(lines)
+
+
+def report_prompt_size(call_site: str, messages: List[Dict[str, str]]) -> Optional[int]:
+    """호출 지점별 프롬프트 토큰 수를 기록하고 반환. 표본에 들지 않으면 인코딩하지 않고 None.
+
+    매 호출 전체 인코딩은 핫 패스 비용이므로 DEBUG 로그이거나 prompt_size_sample_rate 표본일 때만 센다.
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        rate = get_settings().prompt_size_sample_rate
+        if rate <= 0 or random.random() >= rate:
+            return None
+    tokens = count_message_tokens(messages)
+    logger.info("prompt_size call_site=%s tokens=%d messages=%d", call_site, tokens, len(messages))
+    return tokens
+
+
+__all__ = [
+    "count_tokens",
+    "count_message_tokens",
+    "truncate_to_tokens",
+    "pack_context",
+    "compact_transcript",
+    "report_prompt_size",
+]
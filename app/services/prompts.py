@@ -2,17 +2,23 @@ from __future__ import annotations
 
 from typing import List, Dict
 
+from app.services.prompt_budget import report_prompt_size
+
+
+# 평가 축 키(missing_dims 값)
+EVAL_AXES = ("understanding", "quantitative", "justification", "tradeoff", "process")
+
 
 def llm_eval_prompt(question: str, answer: str) -> List[Dict[str, str]]:
     """답변 평가 프롬프트. JSON 스키마를 강제하여 안정적으로 파싱 가능하게 함.
 
-    출력 스키마 예:
+    출력 스키마 예(rating이 먼저 오도록 순서 고정):
     {
       "rating": "GOOD|VAGUE|OFF_TOPIC",
       "notes": {
-        "summary": "...요약",
+        "missing_dims": ["quantitative", "justification"],
         "hints": ["꼬리질문 단서1", "단서2"],
-        "missing_dims": ["quantitative", "justification"]
+        "summary": "...요약"
       }
     }
     """
@@ -42,18 +48,20 @@ def llm_eval_prompt(question: str, answer: str) -> List[Dict[str, str]]:
   {{
     "rating": "...",
     "notes": {{
-      "summary": "한글 1~2문장 요약",
+      "missing_dims": ["quantitative", "justification"],
       "hints": ["...", "..."],
-      "missing_dims": ["quantitative", "justification"]
+      "summary": "한글 1~2문장 요약"
     }}
   }}
 """
-    return [
+    messages = [
         {"role": "system", "content": sys},
         {"role": "user", "content": usr},
     ]
+    report_prompt_size("eval", messages)
+    return messages
 
 
-__all__ = ["llm_eval_prompt"]
+__all__ = ["EVAL_AXES", "llm_eval_prompt"]
 
 
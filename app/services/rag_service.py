@@ -3,12 +3,17 @@ from __future__ import annotations
 from typing import List, Dict, Any, Optional
 from sqlmodel import Session
 
+from app.core.config import get_settings
 from app.core.vectorstore import VectorStore
 from app.core.llm import get_llm
-from app.models.entities import Experience, JobPosting
+from app.models.entities import Experience, InterviewSession, JobPosting, JobPostingContent
+from app.services.job_content_service import job_text
+from app.services.prompt_budget import pack_context, report_prompt_size
 
 
-def build_documents(experiences: List[Experience], job: JobPosting) -> List[Dict[str, Any]]:
+def build_documents(experiences: List[Experience], job: JobPosting, content: Optional[JobPostingContent] = None) -> List[Dict[str, Any]]:
+    """경험/공고 문서 목록. 공유 본문(content)이 있으면 공고 섹션은 content_hash 기반 고정 id를 받아
+    동일 공고의 임베딩을 사용자/세션 간 한 번만 계산한다."""
     docs: List[Dict[str, Any]] = []
     for e in experiences:
         text_parts: List[str] = []
@@ -21,29 +26,58 @@ def build_documents(experiences: List[Experience], job: JobPosting) -> List[Dict
         text = "\n".join(text_parts)
         docs.append({"text": text, "meta": {"type": "experience", "experience_id": e.id}})
     # job sections
-    if isinstance(job.sections, dict):
-        for k, v in job.sections.items():
+    raw_text, sections = job_text(job, content)
+    if content is not None:
+        h = content.content_hash
+        items = [(k, str(v)) for k, v in sections.items() if v] or ([("raw", raw_text)] if raw_text else [])
+        for k, v in items:
+            docs.append({"id": f"job:{h}:{k}", "text": v, "meta": {"type": "job", "section": k, "content_hash": h}})
+    elif sections:
+        for k, v in sections.items():
             if v:
                 docs.append({"text": str(v), "meta": {"type": "job", "section": k, "job_posting_id": job.id}})
-    elif job.raw_text:
-        docs.append({"text": job.raw_text, "meta": {"type": "job", "section": "raw", "job_posting_id": job.id}})
+    elif raw_text:
+        docs.append({"text": raw_text, "meta": {"type": "job", "section": "raw", "job_posting_id": job.id}})
     return docs
 
 
-def index_documents(docs: List[Dict[str, Any]]) -> None:
-    vs = VectorStore(collection_name="interview_kb")
-    vs.upsert(documents=[d["text"] for d in docs], metadatas=[d["meta"] for d in docs])
-
-
-def retrieve_context(question: str, top_k: int = 6) -> List[str]:
+def index_documents(docs: List[Dict[str, Any]], tenant_id: Optional[str] = None) -> None:
+    """공유 공고 본문(고정 id)은 공유 테넌트에, 경험/레거시 공고는 사용자(tenant_id) 파티션에 기록."""
+    shared = [d for d in docs if d.get("id")]
+    own = [d for d in docs if not d.get("id")]
+    if shared:
+        # 공유 공고 본문: 이미 임베딩된 섹션은 건너뜀
+        VectorStore(collection_name="interview_kb").upsert(
+            [d["text"] for d in shared], [d["meta"] for d in shared], ids=[d["id"] for d in shared], skip_existing=True
+        )
+    if own:
+        VectorStore(collection_name="interview_kb", tenant_id=tenant_id).upsert(
+            documents=[d["text"] for d in own], metadatas=[d["meta"] for d in own]
+        )
+
+
+def retrieval_scope(db: Session, sess: InterviewSession) -> Dict[str, Any]:
+    """세션의 검색 범위: 사용자 파티션 + 세션 공고의 공유 본문(content_hash). retrieve_context 키워드 인자로 사용."""
+    job = db.get(JobPosting, sess.job_posting_id) if sess.job_posting_id else None
+    return {"tenant_id": sess.user_id, "content_hashes": [job.content_hash] if job and job.content_hash else None}
+
+
+def retrieve_context(
+    question: str,
+    top_k: int = 6,
+    tenant_id: Optional[str] = None,
+    content_hashes: Optional[List[str]] = None,
+) -> List[str]:
     """질문 의도에 맞게 재랭킹된 컨텍스트를 반환.
 
+    tenant_id가 있으면 그 사용자의 문서와 content_hashes 공고의 공유 섹션만 검색한다.
+
     우선순위 가중치:
     - 공고 섹션(Responsibilities/Requirements/Preferences): +0.3
     - 경험 핵심 영역(title/핵심 섹션 키): +0.2
     """
-    vs = VectorStore(collection_name="interview_kb")
-    res = vs.query(question, n_results=top_k * 2)
+    vs = VectorStore(collection_name="interview_kb", tenant_id=tenant_id)
+    res = vs.query(question, n_results=top_k * 2, content_hashes=content_hashes)
     docs = res.get("documents", [[]])[0]
     metas = res.get("metadatas", [[]])[0]
 
@@ -75,8 +109,10 @@ def _build_question_messages(goal: str, context_chunks: List[str], round_index:
     - 컨텍스트 스니펫을 1회 이상 직접 언급/인용
     - 무엇/왜/어떻게/결과(수치) 중 최소 2개 축 포함
     - 라운드에 따라 난이도 조정
+    - 근거 자료는 관련도 순으로 토큰 예산(prompt_context_budget_tokens) 안에서만 포함
     """
-    context = "\n\n".join(context_chunks[:6])
+    settings = get_settings()
+    context = "\n\n".join(pack_context(context_chunks, settings.prompt_context_budget_tokens, max_chunks=6))
 
     # 라운드 기반 난이도 안내
     if round_index is None:
@@ -107,16 +143,18 @@ def _build_question_messages(goal: str, context_chunks: List[str], round_index:
         "- 하나의 핵심만 묻기.\n\n"
         "출력: 질문 문장만 반환."
     )
-    return [
+    messages = [
         {"role": "system", "content": sys},
         {"role": "user", "content": usr},
     ]
+    report_prompt_size("question", messages)
+    return messages
 
 
 def generate_question_from_context(goal: str, context_chunks: List[str], round_index: Optional[int] = None) -> str:
     llm = get_llm()
     messages = _build_question_messages(goal, context_chunks, round_index)
-    out = llm.chat(messages)
+    out = llm.chat(messages, call_site="question")
     return out.strip()
 
 
@@ -126,6 +164,6 @@ def stream_question_from_context(goal: str, context_chunks: List[str], round_ind
     """
     llm = get_llm()
     messages = _build_question_messages(goal, context_chunks, round_index)
-    for chunk in llm.chat_stream(messages):
+    for chunk in llm.chat_stream(messages, call_site="question"):
         yield chunk
 
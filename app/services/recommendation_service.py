@@ -6,6 +6,7 @@ from sqlmodel import Session, select
 
 from app.core.embeddings import get_embedding_service, cosine_similarity
 from app.models.entities import Experience, JobPosting
+from app.services.job_content_service import job_text, load_content
 
 
 def _experience_text(exp: Experience) -> str:
@@ -39,7 +40,8 @@ def recommend_experiences(session: Session, user_id: str, job_posting_id: int, e
         exps = session.exec(select(Experience).where(Experience.user_id == user_id)).all()
 
     texts = [_experience_text(e) for e in exps]
-    query_text = _job_query_text(jp.sections) or (jp.raw_text or "")
+    raw_text, sections = job_text(jp, load_content(session, jp))
+    query_text = _job_query_text(sections) or (raw_text or "")
 
     embedder = get_embedding_service()
     exp_embs = np.array(embedder.embed_texts(texts)) if texts else np.zeros((0, 384))
@@ -0,0 +1,243 @@
+"""임베딩 모델/차원 변경 시 무중단 재임베딩.
+
+1) ensure_reembed: 설정(모델, 차원)이 active 공간과 다르면 building 공간을 만들고 reembed_batch 작업 등록
+   (이후 새 문서는 VectorStore가 active/building 양쪽에 기록)
+2) reembed_batch: 원본(active) 공간에서 대상 공간에 없는 행을 id 순으로 배치만큼 임베딩해 기록하고
+   진행률(done/cursor)을 갱신한 뒤 다음 배치를 같은 트랜잭션에서 등록. 끝까지 가면 처음부터 누락분을 한 번 더 확인
+3) 누락이 없으면 대상 공간 인덱스를 CONCURRENTLY로 만들고 한 트랜잭션에서 active ↔ retired 전환
+4) 유예 시간 뒤 purge_embedding_space가 이전 공간 행을 배치 삭제
+
+    python -m app.services.reembed_service [start|status]
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+
+from app.core.config import get_settings
+from app.core.embedding_spaces import Space, invalidate_spaces, load_spaces
+from app.core.embeddings import (
+    EmbeddingModelMismatch,
+    EmbeddingService,
+    RemoteEmbeddingService,
+    get_embedding_service_for,
+    resolve_embedding_spec,
+)
+from app.core.vectorstore import drop_space_indexes, ensure_vector_index, write_vectors
+from app.models.db import get_engine
+
+
+logger = logging.getLogger(__name__)
+
+_LOCK_KEY = 72_410_048
+
+_ENQUEUE_SQL = """
+INSERT INTO jobqueue (type, payload, status, attempts, scheduled_at, created_at, updated_at)
+VALUES (:type, CAST(:payload AS JSON), 'pending', 0,
+        (NOW() AT TIME ZONE 'UTC') + make_interval(secs => :delay), NOW() AT TIME ZONE 'UTC', NOW() AT TIME ZONE 'UTC')
+"""
+
+
+def _enqueue(conn, job_type: str, space_id: int, delay: float = 0.0) -> None:
+    conn.execute(text(_ENQUEUE_SQL), {"type": job_type, "payload": f'{{"space_id": {int(space_id)}}}', "delay": delay})
+
+
+def _space(conn, space_id: int) -> Optional[Space]:
+    row = conn.execute(
+        text("SELECT id, provider, model_name, dimensions, dim, status FROM embedding_space WHERE id = :id"),
+        {"id": space_id},
+    ).fetchone()
+    return Space(*row) if row else None
+
+
+def verify_service(service: EmbeddingService, model_name: str, dim: Optional[int] = None) -> int:
+    """서비스가 실제로 model_name의 벡터를 내는지 확인하고 출력 차원을 반환.
+
+    provider=server는 모델과 무관한 원격 클라이언트이므로 서버 info로 적재 모델을 확인하고,
+    dim(공간에 이미 기록된 차원)이 있으면 프로브 벡터 차원과 비교한다. 불일치면 EmbeddingModelMismatch.
+    """
+    if service.model_name != model_name:
+        raise EmbeddingModelMismatch(f"service model {service.model_name!r} != space model {model_name!r}")
+    if isinstance(service, RemoteEmbeddingService):
+        service.check_info(service.info())
+    got = len(service.embed_texts(["embedding space probe"])[0])
+    if dim is not None and got != dim:
+        raise EmbeddingModelMismatch(f"service for {model_name!r} returns {got}-d vectors, space stores {dim}-d")
+    return got
+
+
+def ensure_reembed() -> Optional[int]:
+    """설정된 모델이 active 공간과 다르면 building 공간 id를 반환(없으면 생성 + 첫 배치 등록)."""
+    provider, model_name, dimensions = resolve_embedding_spec()
+    # 락/트랜잭션 밖에서 새 설정의 서비스 확인(잘못된 서버 모델이면 공간을 만들거나 provider를 바꾸지 않음)
+    try:
+        verify_service(get_embedding_service_for(provider, model_name, dimensions), model_name)
+    except Exception as e:  # 모델 불일치 또는 서버 불가: 워커 기동은 막지 않고 다음 기동/명령에서 재시도
+        logger.error("not switching embedding space: %s", e)
+        return None
+    with get_engine().begin() as conn:
+        conn.execute(text("SELECT pg_advisory_xact_lock(:k)"), {"k": _LOCK_KEY})
+        active, building = load_spaces(conn)
+        if active is None:
+            return None
+        if active.matches(model_name, dimensions):
+            # 같은 모델의 실행 방식만 바뀐 경우(sbert ↔ onnx ↔ server) 재임베딩 없이 질의 경로만 교체
+            if active.provider != provider:
+                conn.execute(text("UPDATE embedding_space SET provider = :p WHERE id = :id"), {"p": provider, "id": active.id})
+            target = None
+        else:
+            target = next((b.id for b in building if b.matches(model_name, dimensions)), None)
+            if target is None:
+                total = conn.execute(
+                    text("SELECT COUNT(*) FROM rag_embeddings WHERE space_id = :s"), {"s": active.id}
+                ).scalar()
+                target = conn.execute(text(
+                    """
+                    INSERT INTO embedding_space (provider, model_name, dimensions, status, total, done, cursor, created_at)
+                    VALUES (:p, :m, :d, 'building', :total, 0, '', NOW())
+                    RETURNING id
+                    """
+                ), {"p": provider, "m": model_name, "d": dimensions, "total": total}).scalar()
+                _enqueue(conn, "reembed_batch", target)
+                logger.info("re-embedding %s rows from space %s into space %s (%s)", total, active.id, target, model_name)
+        # 설정이 다시 바뀌어 더 이상 목표가 아닌 building 공간은 폐기(이중 기록 중단 + 행 삭제 예약)
+        for b in building:
+            if b.id != target:
+                conn.execute(text("UPDATE embedding_space SET status = 'retired' WHERE id = :id"), {"id": b.id})
+                _enqueue(conn, "purge_embedding_space", b.id, delay=get_settings().embedding_space_retire_grace_seconds)
+    invalidate_spaces()
+    return target
+
+
+def reembed_batch(space_id: int) -> None:
+    """원본 공간에서 대상 공간에 없는 행 1배치를 재임베딩하고 다음 배치(또는 전환)를 예약."""
+    settings = get_settings()
+    engine = get_engine()
+    with engine.connect() as conn:
+        target = _space(conn, space_id)
+        active, _ = load_spaces(conn)
+        if target is None or target.status != "building" or active is None:
+            return  # 취소/완료된 공간
+        cursor = conn.execute(text("SELECT cursor FROM embedding_space WHERE id = :id"), {"id": space_id}).scalar() or ""
+        rows = conn.execute(text(
+            """
+            SELECT a.id, a.collection, a.document, a.meta, a.tenant_id
+            FROM rag_embeddings a
+            WHERE a.space_id = :src AND a.id > :cursor
+              AND NOT EXISTS (
+                SELECT 1 FROM rag_embeddings b WHERE b.tenant_id = a.tenant_id AND b.space_id = :dst AND b.id = a.id
+              )
+            ORDER BY a.id
+            LIMIT :n
+            """
+        ), {"src": active.id, "dst": space_id, "cursor": cursor, "n": settings.reembed_batch_size}).fetchall()
+
+    if not rows and cursor:
+        # 1회 순회 완료: 캐시 만료 전 이중 기록을 놓친 행이 있을 수 있으므로 처음부터 누락분 재확인
+        with engine.begin() as conn:
+            conn.execute(text("UPDATE embedding_space SET cursor = '' WHERE id = :id"), {"id": space_id})
+            _enqueue(conn, "reembed_batch", space_id)
+        return
+    if not rows:
+        activate_space(space_id)
+        return
+
+    if target.dim is None:
+        # 첫 배치 전: 서비스가 대상 공간의 모델을 실제로 서빙하는지 확인(실패 시 작업 실패 → 재시도)
+        verify_service(target.service, target.model_name)
+    vectors = target.service.embed_texts([r[2] or "" for r in rows])
+    with engine.begin() as conn:
+        write_vectors(conn, target, [
+            {"tenant_id": r[4], "id": r[0], "collection": r[1], "document": r[2], "meta": r[3] or {}, "embedding": v}
+            for r, v in zip(rows, vectors)
+        ], overwrite=False)
+        conn.execute(
+            text("UPDATE embedding_space SET done = done + :n, cursor = :c WHERE id = :id AND status = 'building'"),
+            {"n": len(rows), "c": rows[-1][0], "id": space_id},
+        )
+        _enqueue(conn, "reembed_batch", space_id)
+
+
+def activate_space(space_id: int) -> None:
+    """대상 공간 인덱스 생성(쓰기 비차단) 후 active 전환. 이전 공간은 유예 후 삭제 예약."""
+    engine = get_engine()
+    with engine.connect() as conn:
+        target = _space(conn, space_id)
+    if target is None or target.status != "building":
+        return
+    # 전환 직전 재확인: 다른 모델 벡터가 섞인 공간을 active로 올리지 않음
+    verify_service(target.service, target.model_name, target.dim)
+    if target.dim is not None:
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            ensure_vector_index(conn, space_id, target.dim, concurrently=True)
+    with engine.begin() as conn:
+        conn.execute(text("SELECT pg_advisory_xact_lock(:k)"), {"k": _LOCK_KEY})
+        # 락 안에서 재확인: 그 사이 설정 변경으로 폐기된 공간이면 전환하지 않음
+        if conn.execute(text("SELECT status FROM embedding_space WHERE id = :id"), {"id": space_id}).scalar() != "building":
+            return
+        previous = conn.execute(text("SELECT id FROM embedding_space WHERE status = 'active'")).scalars().all()
+        # 단일 UPDATE로 active ↔ retired 전환(읽기는 이 커밋 시점부터 새 공간)
+        conn.execute(text(
+            """
+            UPDATE embedding_space
+            SET status = CASE WHEN id = :id THEN 'active' ELSE 'retired' END,
+                activated_at = CASE WHEN id = :id THEN NOW() ELSE activated_at END
+            WHERE id = :id OR status = 'active'
+            """
+        ), {"id": space_id})
+        # 다른 프로세스의 공간 캐시가 만료될 때까지 이전 공간 행 유지
+        for old in previous:
+            _enqueue(conn, "purge_embedding_space", old, delay=get_settings().embedding_space_retire_grace_seconds)
+    invalidate_spaces()
+    logger.info("embedding space %s is now active (%s)", space_id, target.model_name)
+
+
+def purge_embedding_space(space_id: int) -> None:
+    """retired 공간의 행을 배치로 삭제하고 인덱스 제거. 남은 행이 있으면 다음 배치 예약."""
+    with get_engine().begin() as conn:
+        status = conn.execute(text("SELECT status FROM embedding_space WHERE id = :id"), {"id": space_id}).scalar()
+        if status != "retired":
+            return
+        deleted = conn.execute(text(
+            """
+            DELETE FROM rag_embeddings
+            WHERE space_id = :s
+              AND (tenant_id, id) IN (SELECT tenant_id, id FROM rag_embeddings WHERE space_id = :s LIMIT :n)
+            """
+        ), {"s": space_id, "n": get_settings().reembed_batch_size * 8}).rowcount
+        if deleted:
+            _enqueue(conn, "purge_embedding_space", space_id)
+        else:
+            drop_space_indexes(conn, space_id)
+
+
+def space_status() -> List[Dict[str, Any]]:
+    with get_engine().connect() as conn:
+        rows = conn.execute(text(
+            "SELECT id, provider, model_name, dimensions, dim, status, total, done, created_at, activated_at "
+            "FROM embedding_space ORDER BY id"
+        )).mappings().all()
+    return [
+        {**dict(r), "progress": round(min(1.0, r["done"] / r["total"]), 4) if r["total"] else None}
+        for r in rows
+    ]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.services.reembed_service")
+    parser.add_argument("command", choices=["start", "status"], nargs="?", default="status")
+    args = parser.parse_args(argv)
+    if args.command == "start":
+        print(f"building space: {ensure_reembed()}")
+    for s in space_status():
+        print(s)
+
+
+__all__ = ["verify_service", "ensure_reembed", "reembed_batch", "activate_space", "purge_embedding_space", "space_status"]
+
+
+if __name__ == "__main__":
+    main()
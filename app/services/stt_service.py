@@ -1,13 +1,165 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import multiprocessing
+import os
+import tempfile
+import wave
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
+from fastapi import HTTPException, UploadFile
 
-def transcribe_audio_stub(file_path: str) -> str:
-    # STT 추후 구현: OpenAI Whisper API 또는 faster-whisper 연동
-    # 현재는 스텁으로 파일명을 반환
-    return f"[STT 미구현] 파일({file_path})에서 텍스트를 추출했다고 가정합니다."
+from app.core.config import get_settings
 
 
-__all__ = ["transcribe_audio_stub"]
+# 확장자 기반 길이 추정 시 가정하는 비트레이트(압축 포맷; WAV는 헤더에서 정확히 계산)
+_ASSUMED_BYTES_PER_SECOND = 128_000 // 8
 
+
+@dataclass
+class SpooledAudio:
+    path: str
+    size_bytes: int
+    duration_seconds: float
+
+    def cleanup(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def _estimate_duration(path: str, size_bytes: int) -> float:
+    try:
+        with wave.open(path, "rb") as w:
+            return w.getnframes() / float(w.getframerate() or 1)
+    except (wave.Error, EOFError):
+        return size_bytes / _ASSUMED_BYTES_PER_SECOND
+
+
+async def spool_upload(upload: UploadFile) -> SpooledAudio:
+    """업로드를 청크 단위로 스풀 파일에 기록(메모리에 전체를 올리지 않음). 크기 상한 초과 시 413."""
+    settings = get_settings()
+    os.makedirs(settings.stt_spool_dir, exist_ok=True)
+    suffix = os.path.splitext(upload.filename or "")[1] or ".bin"
+    fd, path = tempfile.mkstemp(prefix="answer-", suffix=suffix, dir=settings.stt_spool_dir)
+    limit = settings.stt_max_upload_mb * 1024 * 1024
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while True:
+                chunk = await upload.read(settings.stt_upload_chunk_bytes)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > limit:
+                    raise HTTPException(status_code=413, detail=f"Audio exceeds {settings.stt_max_upload_mb}MB")
+                out.write(chunk)
+    except BaseException:
+        os.remove(path)
+        raise
+    finally:
+        await upload.close()
+    if size == 0:
+        os.remove(path)
+        raise HTTPException(status_code=400, detail="Empty audio upload")
+    return SpooledAudio(path=path, size_bytes=size, duration_seconds=_estimate_duration(path, size))
+
+
+class STTBackend:
+    name = "base"
+
+    def transcribe(self, path: str) -> str:  # pragma: no cover - interface
+        raise NotImplementedError
+
+
+class StubSTTBackend(STTBackend):
+    """결정적 로컬 대체 구현(개발/테스트용). 같은 오디오는 항상 같은 텍스트를 낸다."""
+
+    name = "stub"
+
+    def transcribe(self, path: str) -> str:
+        h = hashlib.sha256()
+        size = 0
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+                size += len(chunk)
+        return f"[STT stub] audio {h.hexdigest()[:12]} ({size} bytes)"
+
+
+class FasterWhisperBackend(STTBackend):
+    """faster-whisper(CTranslate2) CPU int8 추론."""
+
+    name = "faster-whisper"
+
+    def __init__(self, model_size: str, language: Optional[str] = None):
+        from faster_whisper import WhisperModel
+
+        self.model = WhisperModel(model_size, device="cpu", compute_type="int8", cpu_threads=get_settings().stt_cpu_threads)
+        self.language = language
+
+    def transcribe(self, path: str) -> str:
+        segments, _ = self.model.transcribe(path, language=self.language, vad_filter=True)
+        return " ".join(s.text.strip() for s in segments).strip()
+
+
+def _resolve_backend_name(name: str) -> str:
+    if name != "auto":
+        return name
+    try:
+        import faster_whisper  # noqa: F401
+
+        return "faster-whisper"
+    except Exception:
+        return "stub"
+
+
+@lru_cache
+def get_stt_backend(name: Optional[str] = None) -> STTBackend:
+    """프로세스별로 한 번만 로드(모델 로딩 비용 상각)."""
+    settings = get_settings()
+    resolved = _resolve_backend_name(name or settings.stt_backend)
+    if resolved == "faster-whisper":
+        return FasterWhisperBackend(settings.stt_model, language=settings.stt_language)
+    if resolved == "stub":
+        return StubSTTBackend()
+    raise ValueError(f"Unknown STT backend: {resolved}")
+
+
+def _transcribe_in_process(path: str, backend: str) -> str:
+    # 프로세스 풀 워커에서 실행(피클 가능한 최상위 함수)
+    return get_stt_backend(backend).transcribe(path)
+
+
+@lru_cache
+def _stt_pool() -> ProcessPoolExecutor:
+    # 스레드가 떠 있는 API 프로세스에서 fork하지 않도록 spawn 사용
+    return ProcessPoolExecutor(max_workers=get_settings().stt_workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+async def transcribe_file(path: str) -> str:
+    """CPU 바운드 전사를 프로세스 풀에서 실행(이벤트 루프/GIL 비점유)."""
+    backend = _resolve_backend_name(get_settings().stt_backend)
+    return await asyncio.get_running_loop().run_in_executor(_stt_pool(), _transcribe_in_process, path, backend)
+
+
+def shutdown_stt_pool() -> None:
+    if _stt_pool.cache_info().currsize:
+        _stt_pool().shutdown(wait=False, cancel_futures=True)
+
+
+__all__ = [
+    "SpooledAudio",
+    "spool_upload",
+    "STTBackend",
+    "StubSTTBackend",
+    "FasterWhisperBackend",
+    "get_stt_backend",
+    "transcribe_file",
+    "shutdown_stt_pool",
+]
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.entities import InterviewAnswer, InterviewQuestion, InterviewSession
+from app.services.analytics_service import record_answer_stats
+
+
+# InterviewSession.transcript 는 append-only 이벤트 로그다.
+#   {"k": "q", "id", "round", "type", "text"}        질문 생성
+#   {"k": "a", "qid", "text", "evaluation"}          답변 저장
+# 답변 저장(백그라운드)과 다음 질문 저장이 경합할 수 있어 순서에 의존하지 않고 qid로 접는다.
+
+
+def question_event(q: InterviewQuestion) -> Dict[str, Any]:
+    return {"k": "q", "id": q.id, "round": q.round_index, "type": q.question_type, "text": q.text}
+
+
+def answer_event(a: InterviewAnswer) -> Dict[str, Any]:
+    return {"k": "a", "qid": a.question_id, "text": a.answer_text, "evaluation": a.evaluation or {}}
+
+
+def append_events(sess: InterviewSession, *events: Dict[str, Any]) -> None:
+    """이벤트 추가 및 last_question_id 갱신. JSON 변경 감지를 위해 리스트를 새로 할당한다."""
+    sess.transcript = [*(sess.transcript or []), *events]
+    for ev in events:
+        if ev["k"] == "q":
+            sess.last_question_id = ev["id"]
+
+
+def lock_session(db: Session, session_id: int) -> Optional[InterviewSession]:
+    """SELECT ... FOR UPDATE 로 세션 행을 잠그고 최신 값으로 다시 읽는다."""
+    stmt = (
+        select(InterviewSession)
+        .where(InterviewSession.id == session_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    return db.exec(stmt).first()
+
+
+def record_question(db: Session, q: InterviewQuestion) -> InterviewQuestion:
+    """질문 저장과 세션 포인터/전사 갱신을 하나의 트랜잭션으로 커밋."""
+    sess = lock_session(db, q.session_id)
+    db.add(q)
+    db.flush()
+    if sess is not None:
+        append_events(sess, question_event(q))
+        db.add(sess)
+    db.commit()
+    db.refresh(q)
+    return q
+
+
+def record_answer(db: Session, a: InterviewAnswer) -> InterviewAnswer:
+    """답변 저장, 세션 전사 갱신, 약점 집계 증분을 하나의 트랜잭션으로 커밋."""
+    sess = lock_session(db, a.session_id)
+    db.add(a)
+    if sess is not None:
+        append_events(sess, answer_event(a))
+        db.add(sess)
+        record_answer_stats(db, sess.user_id, a.evaluation, a.created_at)
+    db.commit()
+    return a
+
+
+def fold_transcript(events: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """이벤트 로그를 질문 순서의 문항 목록으로 접는다. 답변이 없으면 answer/evaluation은 None."""
+    items: Dict[int, Dict[str, Any]] = {}
+    pending: Dict[int, Dict[str, Any]] = {}
+    for ev in events:
+        if ev.get("k") == "q":
+            item = {
+                "question_id": ev["id"],
+                "round": ev["round"],
+                "type": ev["type"],
+                "question": ev["text"],
+                "answer": None,
+                "evaluation": None,
+            }
+            if ev["id"] in pending:
+                ans = pending.pop(ev["id"])
+                item["answer"], item["evaluation"] = ans["text"], ans["evaluation"]
+            items[ev["id"]] = item
+        elif ev.get("k") == "a":
+            item = items.get(ev["qid"])
+            if item is None:
+                pending[ev["qid"]] = ev
+            else:
+                item["answer"], item["evaluation"] = ev["text"], ev["evaluation"]
+    return list(items.values())
+
+
+def current_question(sess: InterviewSession) -> Optional[Dict[str, Any]]:
+    """last_question_id 에 해당하는 질문 이벤트(보통 마지막 원소)."""
+    if sess.last_question_id is None:
+        return None
+    for ev in reversed(sess.transcript or []):
+        if ev.get("k") == "q" and ev["id"] == sess.last_question_id:
+            return ev
+    return None
+
+
+def _legacy_events(questions: Iterable[InterviewQuestion], answers: Iterable[InterviewAnswer]) -> List[Dict[str, Any]]:
+    return [question_event(q) for q in questions] + [answer_event(a) for a in answers]
+
+
+def is_legacy(sess: InterviewSession) -> bool:
+    """전사 컬럼 도입 이전에 생성된 세션(포인터 없음)."""
+    return sess.last_question_id is None
+
+
+def load_transcript(db: Session, sess: InterviewSession) -> List[Dict[str, Any]]:
+    if not is_legacy(sess):
+        return fold_transcript(sess.transcript or [])
+    questions = db.exec(select(InterviewQuestion).where(InterviewQuestion.session_id == sess.id).order_by(InterviewQuestion.id.asc())).all()
+    answers = db.exec(select(InterviewAnswer).where(InterviewAnswer.session_id == sess.id)).all()
+    return fold_transcript(_legacy_events(questions, answers))
+
+
+async def load_transcript_async(session: AsyncSession, sess: InterviewSession) -> List[Dict[str, Any]]:
+    if not is_legacy(sess):
+        return fold_transcript(sess.transcript or [])
+    questions = (await session.exec(select(InterviewQuestion).where(InterviewQuestion.session_id == sess.id).order_by(InterviewQuestion.id.asc()))).all()
+    answers = (await session.exec(select(InterviewAnswer).where(InterviewAnswer.session_id == sess.id))).all()
+    return fold_transcript(_legacy_events(questions, answers))
+
+
+__all__ = [
+    "question_event",
+    "answer_event",
+    "append_events",
+    "lock_session",
+    "record_question",
+    "record_answer",
+    "fold_transcript",
+    "current_question",
+    "is_legacy",
+    "load_transcript",
+    "load_transcript_async",
+]
@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Dict, Any
 from sqlmodel import Session
 
-from app.models.db import engine
+from app.models.db import get_engine
 from app.services.feedback_service import collect_interview_data, prepare_feedback_prompt, parse_feedback_response
 from app.core.llm import get_llm
 from app.core.vectorstore import VectorStore
@@ -14,7 +14,7 @@ def handle_generate_feedback(payload: Dict[str, Any]) -> None:
     from app.models.entities import FeedbackReport
     from datetime import datetime
 
-    with Session(engine) as db:
+    with Session(get_engine()) as db:
         report = db.exec(
             db.select(FeedbackReport).where(FeedbackReport.session_id == session_id)
         ).first() if hasattr(db, "select") else db.query(FeedbackReport).filter_by(session_id=session_id).first()
@@ -31,7 +31,7 @@ def handle_generate_feedback(payload: Dict[str, Any]) -> None:
         transcript = collect_interview_data(db, session_id)
         prompt = prepare_feedback_prompt(transcript)
         llm = get_llm()
-        raw = llm.chat(prompt)
+        raw = llm.chat(prompt, call_site="feedback")
         parsed = parse_feedback_response(raw)
 
         report.status = "completed"
@@ -42,20 +42,91 @@ def handle_generate_feedback(payload: Dict[str, Any]) -> None:
 
 
 def handle_embed_documents(payload: Dict[str, Any]) -> None:
-    # payload: {documents: [{text, meta}, ...], collection?: str}
+    # payload: {documents: [{text, meta}, ...], collection?: str, tenant_id?: str (없으면 공유 테넌트)}
     docs = payload.get("documents", [])
     collection = payload.get("collection", "interview_kb")
     if not docs:
         return
-    vs = VectorStore(collection_name=collection)
+    vs = VectorStore(collection_name=collection, tenant_id=payload.get("tenant_id"))
     vs.upsert([d["text"] for d in docs], [d.get("meta", {}) for d in docs])
 
 
-def handle(job_type: str, payload: Dict[str, Any]) -> None:
+def handle_rebuild_weakness_stats(payload: Dict[str, Any]) -> None:
+    # payload: {user_id?: str} (없으면 전체 재계산)
+    from app.services.analytics_service import rebuild_weakness_stats
+
+    with Session(get_engine()) as db:
+        rebuild_weakness_stats(db, payload.get("user_id"))
+
+
+def handle_transcribe_audio(payload: Dict[str, Any], last_attempt: bool = True) -> None:
+    # payload: {path, session_id, question_id} — 긴 음성 답변. 전사 후 일반 답변 경로로 처리
+    import os
+    from app.models.entities import InterviewSession
+    from app.services.agent_service import InterviewAgent
+    from app.services.stt_service import get_stt_backend
+
+    path = payload["path"]
+    done = False
+    try:
+        session_id, question_id = int(payload["session_id"]), int(payload["question_id"])
+        with Session(get_engine()) as db:
+            sess = db.get(InterviewSession, session_id)
+            # 이전 시도가 다음 질문까지 커밋한 뒤 ack 전에 실패했다면 이미 처리된 작업
+            pending = sess is None or sess.last_question_id in (None, question_id)
+        if pending:
+            # 전사(CPU) 동안 커넥션을 잡지 않도록 세션을 나눈다
+            text = get_stt_backend().transcribe(path)
+            with Session(get_engine()) as db:
+                InterviewAgent(db).submit_answer(session_id, question_id, text)
+        done = True
+    finally:
+        # 성공했거나 더 이상 재시도하지 않으면 스풀 파일 제거(실패 업로드가 디스크에 쌓이지 않도록)
+        if done or last_attempt:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+def handle_fetch_job_posting(payload: Dict[str, Any]) -> None:
+    # payload: {job_posting_id}
+    from app.services.job_ingest_service import ingest_job_posting
+
+    with Session(get_engine()) as db:
+        ingest_job_posting(db, int(payload["job_posting_id"]))
+
+
+def handle_reembed_batch(payload: Dict[str, Any]) -> None:
+    # payload: {space_id} — 진행 위치는 embedding_space.cursor에 보관
+    from app.services.reembed_service import reembed_batch
+
+    reembed_batch(int(payload["space_id"]))
+
+
+def handle_purge_embedding_space(payload: Dict[str, Any]) -> None:
+    # payload: {space_id} — 전환 후 retired 공간 행 배치 삭제
+    from app.services.reembed_service import purge_embedding_space
+
+    purge_embedding_space(int(payload["space_id"]))
+
+
+def handle(job_type: str, payload: Dict[str, Any], last_attempt: bool = True) -> None:
+    """last_attempt: 실패 시 더 이상 재시도되지 않는 시도인지(작업별 정리용)."""
     if job_type == "generate_feedback":
         handle_generate_feedback(payload)
     elif job_type == "embed_documents":
         handle_embed_documents(payload)
+    elif job_type == "rebuild_weakness_stats":
+        handle_rebuild_weakness_stats(payload)
+    elif job_type == "transcribe_audio":
+        handle_transcribe_audio(payload, last_attempt)
+    elif job_type == "fetch_job_posting":
+        handle_fetch_job_posting(payload)
+    elif job_type == "reembed_batch":
+        handle_reembed_batch(payload)
+    elif job_type == "purge_embedding_space":
+        handle_purge_embedding_space(payload)
     else:
         # 확장 포인트: STT, 레포트 요약 등
         pass
@@ -4,21 +4,52 @@ import os
 import time
 from app.queues.local_db import LocalDBQueue
 from app.worker.handlers import handle
+from app.core.warmup import run_warmup_sync
+from app.models.migrations import check_schema_version
+from app.core.config import get_settings
+from app.core.llm_cache import purge_expired
+from app.core.metrics import REGISTRY, job_duration_seconds, start_http_server
+from app.queues.local_db import QueueDepthCollector
+from app.services.reembed_service import ensure_reembed
 
 
 def main():
     poll_interval = float(os.getenv("QUEUE_POLL_INTERVAL", "1"))
+    settings = get_settings()
+    if settings.metrics_enabled and settings.metrics_worker_port:
+        # 워커에는 웹 앱이 없으므로 /metrics 전용 HTTP 서버를 별도 포트로
+        # 큐 깊이/대기 나이는 큐 전체 값이므로 API가 아닌 워커에서만(짧게 캐시해 스크레이프마다 조회하지 않음)
+        REGISTRY.register(QueueDepthCollector())
+        start_http_server(settings.metrics_worker_port)
+    check_schema_version()
+    if settings.embedding_auto_reembed:
+        # 임베딩 모델/차원 설정이 바뀌었으면 새 공간으로 재임베딩 시작(이미 진행 중이면 no-op)
+        ensure_reembed()
     q = LocalDBQueue()
+    # 첫 작업 지연 방지: 풀/임베딩 모델/토크나이저 선로딩(실패해도 작업 처리 시 지연 로드)
+    run_warmup_sync(["db", "embeddings", "llm", "tokenizer"])
+    purge_every = settings.llm_cache_purge_interval_seconds if settings.llm_cache_db_enabled else 0
+    next_purge = time.monotonic()
     while True:
+        if purge_every > 0 and time.monotonic() >= next_purge:
+            # 다시 조회되지 않는 만료 키는 읽기 경로에서 지워지지 않으므로 주기적으로 정리
+            purge_expired()
+            next_purge = time.monotonic() + purge_every
         job = q.dequeue()
         if not job:
             time.sleep(poll_interval)
             continue
+        start = time.perf_counter()
+        # 이번 시도가 실패하면 attempts가 상한에 닿는지(더 재시도하지 않고 failed로)
+        last_attempt = job["attempts"] + 1 >= settings.queue_max_attempts
         try:
-            handle(job["type"], job["payload"])
+            handle(job["type"], job["payload"], last_attempt=last_attempt)
             q.ack(job["id"])
+            outcome = "ok"
         except Exception:
-            q.fail(job["id"], retryable=True)
+            q.fail(job["id"], retryable=not last_attempt)
+            outcome = "error"
+        job_duration_seconds.labels(type=job["type"], outcome=outcome).observe(time.perf_counter() - start)
 
 
 if __name__ == "__main__":
@@ -41,7 +41,7 @@ export default function ExperiencesPage() {
 
   const { data: experiences, isLoading, error } = useQuery({
     queryKey: ['experiences'],
-    queryFn: experienceApi.list,
+    queryFn: () => experienceApi.list(),
   });
 
   const deleteMutation = useMutation({
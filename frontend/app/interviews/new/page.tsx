@@ -5,6 +5,7 @@ import { useRouter } from 'next/navigation';
 import { useQuery, useMutation } from '@tanstack/react-query';
 import { jobApi, experienceApi, interviewApi } from '@/lib/api';
 import { useAuth } from '@/lib/store';
+import { getFetchStatusText, getJobFetchStatus, pollWhileFetching } from '@/lib/utils';
 
 export default function NewInterviewPage() {
   const router = useRouter();
@@ -14,12 +15,13 @@ export default function NewInterviewPage() {
 
   const { data: jobs = [] } = useQuery({
     queryKey: ['jobs'],
-    queryFn: jobApi.list,
+    queryFn: () => jobApi.list(),
+    refetchInterval: (query) => pollWhileFetching(query.state.data),
   });
 
   const { data: experiences = [] } = useQuery({
     queryKey: ['experiences'],
-    queryFn: experienceApi.list,
+    queryFn: () => experienceApi.list(),
   });
 
   const startInterviewMutation = useMutation({
@@ -92,6 +94,7 @@ export default function NewInterviewPage() {
           <div className="space-y-3">
             {jobs.map((job) => {
               const { companyName, position } = extractJobInfo(job);
+              const fetchStatus = getJobFetchStatus(job);
               return (
                 <label key={job.id} className="flex items-center space-x-3 p-3 border rounded-component hover:bg-gray-50">
                   <input
@@ -99,12 +102,18 @@ export default function NewInterviewPage() {
                     name="job"
                     value={job.id}
                     checked={selectedJobId === job.id}
+                    disabled={fetchStatus !== 'ready'}
                     onChange={(e) => setSelectedJobId(Number(e.target.value))}
                     className="w-4 h-4 text-primary"
                   />
                   <div className="flex-1">
                     <div className="font-medium text-text-primary">{position}</div>
                     <div className="text-sm text-text-secondary">{companyName}</div>
+                    {fetchStatus !== 'ready' && (
+                      <div className={`text-xs ${fetchStatus === 'failed' ? 'text-danger' : 'text-text-secondary'}`}>
+                        {getFetchStatusText(fetchStatus)}
+                      </div>
+                    )}
                   </div>
                 </label>
               );
@@ -17,7 +17,7 @@ import { Modal, ModalContent, ModalDescription, ModalFooter, ModalHeader, ModalT
 import { Loading } from '@/components/ui/loading';
 import { jobApi, experienceApi, interviewApi } from '@/lib/api';
 import { useInterviewStore } from '@/stores/interview';
-import { formatInterviewDuration, getQuestionTypeText, getLoadingMessage } from '@/lib/utils';
+import { formatInterviewDuration, getQuestionTypeText, getLoadingMessage, getFetchStatusText, getJobFetchStatus, pollWhileFetching } from '@/lib/utils';
 
 export default function InterviewPage() {
   const params = useParams();
@@ -50,11 +50,13 @@ export default function InterviewPage() {
   const { data: job } = useQuery({
     queryKey: ['job', jobId],
     queryFn: () => jobApi.get(jobId),
+    refetchInterval: (query) => pollWhileFetching(query.state.data),
   });
+  const fetchStatus = getJobFetchStatus(job);
 
   const { data: experiences } = useQuery({
     queryKey: ['experiences'],
-    queryFn: experienceApi.list,
+    queryFn: () => experienceApi.list(),
   });
 
   // 면접 시작 mutation
@@ -95,9 +97,9 @@ export default function InterviewPage() {
             setStreamingQuestion((prev) => prev + chunk);
           },
           onEnd: (meta) => {
-            // 다음 질문을 대화에 추가
+            // 다음 질문을 대화에 추가(질문 토큰은 평가 이벤트보다 먼저 올 수 있으나 evaluation은 항상 question_end 이전)
             addQuestion({
-              question: streamingQuestion || '다음 질문을 불러오지 못했습니다.',
+              question: meta.question || '다음 질문을 불러오지 못했습니다.',
               question_id: meta.question_id,
               question_type: meta.question_type,
               round_index: meta.round_index,
@@ -125,13 +127,14 @@ export default function InterviewPage() {
 
   // 컴포넌트 마운트 시 면접 시작
   useEffect(() => {
-    if (job && experiences && !isSessionActive) {
+    // 공고 본문 수집이 끝난 뒤에만 시작(서버도 ready가 아니면 409)
+    if (job && fetchStatus === 'ready' && experiences && !isSessionActive) {
       startInterviewMutation.mutate({
         job_posting_id: jobId,
         selected_experience_ids: experiences.map(exp => exp.id),
       });
     }
-  }, [job, experiences, isSessionActive]);
+  }, [job, fetchStatus, experiences, isSessionActive]);
 
   // 메시지 스크롤
   useEffect(() => {
@@ -158,6 +161,25 @@ export default function InterviewPage() {
     }
   };
 
+  if (job && fetchStatus !== 'ready') {
+    return (
+      <div className="min-h-screen bg-gradient-to-br from-blue-50 to-indigo-100 flex items-center justify-center">
+        <Card className="w-full max-w-md">
+          <CardContent className="p-8 text-center">
+            {fetchStatus === 'fetching' ? (
+              <Loading size="lg" text={getFetchStatusText(fetchStatus)} />
+            ) : (
+              <>
+                <p className="text-danger mb-4">{getFetchStatusText(fetchStatus)}</p>
+                <Button onClick={() => router.push(`/jobs/${jobId}/edit`)}>공고 수정</Button>
+              </>
+            )}
+          </CardContent>
+        </Card>
+      </div>
+    );
+  }
+
   if (startInterviewMutation.isPending || !isSessionActive) {
     return (
       <div className="min-h-screen bg-gradient-to-br from-blue-50 to-indigo-100 flex items-center justify-center">
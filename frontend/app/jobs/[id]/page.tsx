@@ -23,7 +23,7 @@ import { Accordion, AccordionContent, AccordionItem, AccordionTrigger } from '@/
 import { Modal, ModalContent, ModalDescription, ModalFooter, ModalHeader, ModalTitle } from '@/components/ui/modal';
 import { Loading, CardSkeleton } from '@/components/ui/loading';
 import { jobApi, experienceApi, recommendationApi } from '@/lib/api';
-import { formatDate, getCategoryText, getStatusText, getStatusBadgeStyle } from '@/lib/utils';
+import { formatDate, getCategoryText, getStatusText, getStatusBadgeStyle, getFetchStatusText, getJobFetchStatus, pollWhileFetching } from '@/lib/utils';
 import type { JobPosting, Experience, RecommendedItem } from '@/types/api';
 
 export default function JobDetailPage() {
@@ -43,11 +43,13 @@ export default function JobDetailPage() {
   const { data: job, isLoading: jobLoading } = useQuery({
     queryKey: ['job', jobId],
     queryFn: () => jobApi.get(jobId),
+    // URL 공고를 가져오는 중이면 완료될 때까지 폴링
+    refetchInterval: (query) => pollWhileFetching(query.state.data),
   });
 
   const { data: experiences, isLoading: experiencesLoading } = useQuery({
     queryKey: ['experiences'],
-    queryFn: experienceApi.list,
+    queryFn: () => experienceApi.list(),
   });
 
   // 지원서 답변 저장 mutation
@@ -151,6 +153,7 @@ export default function JobDetailPage() {
   }
 
   const hasApplicationQuestions = job.application_qa && job.application_qa.length > 0;
+  const fetchStatus = getJobFetchStatus(job);
   const recommendedExperiences = recommendations
     .filter(rec => rec.selected)
     .map(rec => experiences?.find(exp => exp.id === rec.experience_id))
@@ -181,7 +184,7 @@ export default function JobDetailPage() {
           <Link href={`/jobs/${jobId}/edit`}>
             <Button variant="outline">수정</Button>
           </Link>
-          {hasApplicationQuestions && (
+          {hasApplicationQuestions && fetchStatus === 'ready' && (
             <Link href={`/jobs/${jobId}/interview`}>
               <Button className="gap-2">
                 <MessageCircle className="w-4 h-4" />
@@ -192,6 +195,12 @@ export default function JobDetailPage() {
         </div>
       </div>
 
+      {fetchStatus !== 'ready' && (
+        <div className={`mb-6 rounded-component border p-4 text-sm ${fetchStatus === 'failed' ? 'border-danger text-danger' : 'text-text-secondary'}`}>
+          {fetchStatus === 'fetching' ? <Loading size="sm" text={getFetchStatusText(fetchStatus)} /> : getFetchStatusText(fetchStatus)}
+        </div>
+      )}
+
       <div className="grid grid-cols-1 lg:grid-cols-3 gap-6">
         {/* 메인 콘텐츠 */}
         <div className="lg:col-span-2 space-y-6">
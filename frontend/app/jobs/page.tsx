@@ -34,7 +34,7 @@ export default function JobsPage() {
 
   const { data: jobs, isLoading, error } = useQuery({
     queryKey: ['jobs'],
-    queryFn: jobApi.list,
+    queryFn: () => jobApi.list(),
   });
 
   const deleteMutation = useMutation({
@@ -240,9 +240,9 @@ export default function JobsPage() {
                         )}
                       </div>
 
-                      {job.raw_text && (
+                      {(job.sections?.main || job.raw_text) && (
                         <p className="text-sm text-text-secondary">
-                          {truncateText(job.raw_text, 200)}
+                          {truncateText(job.sections?.main || job.raw_text, 200)}
                         </p>
                       )}
                     </div>
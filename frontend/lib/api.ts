@@ -59,6 +59,25 @@ api.interceptors.response.use(
   }
 );
 
+// 목록 API는 keyset 페이지로 응답(다음 페이지 커서는 X-Next-Cursor 헤더) → 커서를 따라 끝까지 모은다.
+// fields로 목록 화면에 필요한 필드만 받아 응답 크기를 줄인다(id는 항상 포함).
+const LIST_PAGE_SIZE = 200;
+
+const listAllPages = async <T>(url: string, params: Record<string, any> = {}): Promise<T[]> => {
+  const items: T[] = [];
+  let cursor: string | undefined;
+  do {
+    const response = await api.get(url, { params: { ...params, limit: LIST_PAGE_SIZE, ...(cursor ? { cursor } : {}) } });
+    items.push(...response.data);
+    cursor = response.headers['x-next-cursor'];
+  } while (cursor);
+  return items;
+};
+
+// 목록 화면용 필드(raw_text는 sections.main과 중복이므로 제외)
+const JOB_LIST_FIELDS = 'source_type,url,sections,status,application_qa,fetch_status,created_at';
+const EXPERIENCE_LIST_FIELDS = 'category,title,start_date,end_date,content';
+
 // Auth API
 export const authApi = {
   signup: async (email: string, password: string, name?: string): Promise<AuthResponse> => {
@@ -82,9 +101,8 @@ export const dashboardApi = {
 
 // Experience API
 export const experienceApi = {
-  list: async (): Promise<Experience[]> => {
-    const response = await api.get('/experiences/');
-    return response.data;
+  list: async (fields: string = EXPERIENCE_LIST_FIELDS): Promise<Experience[]> => {
+    return listAllPages<Experience>('/experiences/', fields ? { fields } : {});
   },
 
   get: async (id: number): Promise<Experience> => {
@@ -110,9 +128,8 @@ export const experienceApi = {
 
 // Job Posting API
 export const jobApi = {
-  list: async (): Promise<JobPosting[]> => {
-    const response = await api.get('/jobs/');
-    return response.data;
+  list: async (fields: string = JOB_LIST_FIELDS): Promise<JobPosting[]> => {
+    return listAllPages<JobPosting>('/jobs/', fields ? { fields } : {});
   },
 
   get: async (id: number): Promise<JobPosting> => {
@@ -165,15 +182,21 @@ export const interviewApi = {
     return response.data;
   },
 
-  // SSE 스트리밍: 답변 제출 → 평가 이벤트 즉시 → 질문 토큰 스트리밍
+  // SSE 스트리밍: 평가 토큰(evaluation_chunk) → rating → 질문 토큰(question_chunk)이 평가와 섞여 도착
+  // → evaluation(최종 평가) → 나머지 question_chunk → question_end → done.
+  // evaluation은 항상 question_end보다 먼저 오며, 질문 전문은 onEnd의 question으로 전달한다.
   submitAnswerStream: async (
     sessionId: number,
     questionId: number,
     answer: string,
     handlers: {
+      onEvaluationChunk?: (textChunk: string) => void;
+      onRating?: (payload: { rating: string; route: 'NEXT_ROUND' | 'FOLLOW_UP' }) => void;
       onEvaluation?: (payload: { rating: string; notes: any }) => void;
+      onQuestionStart?: () => void;
       onChunk?: (textChunk: string) => void;
-      onEnd?: (meta: { question_id: number; question_type: string; round_index: number }) => void;
+      onEnd?: (meta: { question: string; question_id: number; question_type: string; round_index: number }) => void;
+      onDone?: () => void;
       onError?: (error: any) => void;
     }
   ): Promise<() => void> => {
@@ -200,6 +223,7 @@ export const interviewApi = {
       const decoder = new TextDecoder('utf-8');
       let buffer = '';
       let currentEvent: string | null = null;
+      let questionText = '';
 
       const processBuffer = () => {
         const messages = buffer.split('\n\n');
@@ -213,15 +237,21 @@ export const interviewApi = {
             if (line.startsWith('event:')) currentEvent = line.slice(6).trim();
             else if (line.startsWith('data:')) dataLine = (dataLine || '') + line.slice(5).trim();
           }
-          if (!dataLine) continue;
+          // question_start/done은 data 없이 이벤트명만 온다
+          if (!dataLine && !currentEvent) continue;
           try {
-            const payload = JSON.parse(dataLine);
-            if (currentEvent === 'evaluation') handlers.onEvaluation?.(payload);
-            else if (currentEvent === 'question_chunk') handlers.onChunk?.(payload.content || '');
-            else if (currentEvent === 'question_end') handlers.onEnd?.(payload);
-            else if (currentEvent === 'done') {
-              // ignore; caller will stop when onEnd fired
-            }
+            const payload = dataLine ? JSON.parse(dataLine) : {};
+            if (currentEvent === 'evaluation_chunk') handlers.onEvaluationChunk?.(payload.content || '');
+            else if (currentEvent === 'rating') handlers.onRating?.(payload);
+            else if (currentEvent === 'evaluation') handlers.onEvaluation?.(payload);
+            else if (currentEvent === 'question_start') {
+              questionText = '';
+              handlers.onQuestionStart?.();
+            } else if (currentEvent === 'question_chunk') {
+              questionText += payload.content || '';
+              handlers.onChunk?.(payload.content || '');
+            } else if (currentEvent === 'question_end') handlers.onEnd?.({ ...payload, question: questionText.trim() });
+            else if (currentEvent === 'done') handlers.onDone?.();
           } catch (e) {
             handlers.onError?.(e);
           }
@@ -297,8 +327,7 @@ export const interviewApi = {
   },
 
   listSessions: async (includeLegacy: boolean = false): Promise<InterviewSessionSummary[]> => {
-    const response = await api.get('/interviews/', { params: includeLegacy ? { include_legacy: true } : {} });
-    return response.data;
+    return listAllPages<InterviewSessionSummary>('/interviews/', includeLegacy ? { include_legacy: true } : {});
   },
 
   getSession: async (sessionId: number): Promise<{ id: number; job_posting_id: number; status: string; last_question?: string } & any> => {
@@ -67,6 +67,24 @@ export function calculateDDay(targetDate: string | Date): string {
   }
 }
 
+// URL 공고 수집 상태
+export const JOB_FETCH_POLL_MS = 2000;
+
+export function getJobFetchStatus(job?: { fetch_status?: string } | null): 'ready' | 'fetching' | 'failed' {
+  const status = job?.fetch_status || 'ready';
+  return status === 'fetching' || status === 'failed' ? status : 'ready';
+}
+
+export function getFetchStatusText(status: string): string {
+  return status === 'fetching' ? '공고를 가져오는 중입니다...' : status === 'failed' ? '공고를 가져오지 못했습니다. URL을 확인하거나 본문을 직접 입력해주세요.' : '';
+}
+
+// 가져오는 중인 공고가 있으면 주기적으로 다시 조회(react-query refetchInterval용)
+export function pollWhileFetching(data?: { fetch_status?: string } | Array<{ fetch_status?: string }> | null): number | false {
+  const items = Array.isArray(data) ? data : data ? [data] : [];
+  return items.some((j) => getJobFetchStatus(j) === 'fetching') ? JOB_FETCH_POLL_MS : false;
+}
+
 // 텍스트 트렁케이트
 export function truncateText(text: string, maxLength: number): string {
   if (text.length <= maxLength) return text;
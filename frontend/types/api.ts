@@ -41,9 +41,12 @@ export interface JobPosting {
   sections: Record<string, any>;
   status: string; // draft | applied | interviewing | offer | rejected
   application_qa: Array<Record<string, any>>;
+  fetch_status?: FetchStatus; // URL 공고 수집 상태(ready가 아니면 면접 시작 불가)
   created_at: string;
 }
 
+export type FetchStatus = 'ready' | 'fetching' | 'failed';
+
 export interface JobPostingCreate {
   user_id?: string;
   source_type: string;
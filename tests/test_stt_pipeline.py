@@ -0,0 +1,105 @@
+"""음성 답변 파이프라인: 스풀 업로드 → StubSTTBackend 전사 → 큐 작업(transcribe_audio) 처리.
+
+DB 없이 돌도록 워커 핸들러의 세션/에이전트만 기록용 대체물로 바꾼다.
+"""
+from __future__ import annotations
+
+import asyncio
+import io
+import os
+
+import pytest
+from fastapi import UploadFile
+
+from app.core.config import get_settings
+from app.services import agent_service, stt_service
+from app.worker import handlers
+
+
+class _FakeSession:
+    def __init__(self, sess):
+        self.sess = sess
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def get(self, model, key):
+        return self.sess
+
+
+class _Sess:
+    def __init__(self, last_question_id):
+        self.last_question_id = last_question_id
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "stt_spool_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "stt_backend", "stub")
+    stt_service.get_stt_backend.cache_clear()
+
+    calls = []
+    state = {"sess": _Sess(last_question_id=2), "fail": False}
+
+    class _Agent:
+        def __init__(self, db):
+            pass
+
+        def submit_answer(self, session_id, question_id, answer):
+            calls.append((session_id, question_id, answer))
+            if state["fail"]:
+                raise RuntimeError("llm down")
+
+    monkeypatch.setattr(handlers, "get_engine", lambda: None)
+    monkeypatch.setattr(handlers, "Session", lambda engine: _FakeSession(state["sess"]))
+    monkeypatch.setattr(agent_service, "InterviewAgent", _Agent)
+    yield calls, state
+    stt_service.get_stt_backend.cache_clear()
+
+
+def _spool(data: bytes):
+    upload = UploadFile(file=io.BytesIO(data), filename="answer.webm")
+    return asyncio.run(stt_service.spool_upload(upload))
+
+
+def test_queued_transcription_uses_stub_and_removes_spool(pipeline):
+    calls, _ = pipeline
+    spooled = _spool(b"\x00\x01" * 4096)
+    assert os.path.exists(spooled.path) and spooled.size_bytes == 8192
+
+    expected = stt_service.StubSTTBackend().transcribe(spooled.path)
+    handlers.handle("transcribe_audio", {"path": spooled.path, "session_id": 1, "question_id": 2}, last_attempt=False)
+
+    assert calls == [(1, 2, expected)]
+    assert not os.path.exists(spooled.path)
+
+
+def test_failed_attempt_keeps_spool_until_last_attempt(pipeline):
+    calls, state = pipeline
+    state["fail"] = True
+    spooled = _spool(b"audio")
+    payload = {"path": spooled.path, "session_id": 1, "question_id": 2}
+
+    with pytest.raises(RuntimeError):
+        handlers.handle("transcribe_audio", payload, last_attempt=False)
+    assert os.path.exists(spooled.path)
+
+    with pytest.raises(RuntimeError):
+        handlers.handle("transcribe_audio", payload, last_attempt=True)
+    assert not os.path.exists(spooled.path)
+    assert len(calls) == 2
+
+
+def test_retry_after_question_advanced_is_noop(pipeline):
+    calls, state = pipeline
+    state["sess"] = _Sess(last_question_id=3)
+    spooled = _spool(b"audio")
+
+    handlers.handle("transcribe_audio", {"path": spooled.path, "session_id": 1, "question_id": 2}, last_attempt=False)
+
+    assert calls == []
+    assert not os.path.exists(spooled.path)